@@ -0,0 +1,121 @@
+"""서버 시작(import)과 첫 세션 실행 시간 측정
+
+새 인터프리터에서 `python -X importtime -c "import main"`을 실행해 모듈별
+import 시간을 모으고, 앱 모듈(utils, pages, main)이 Streamlit 위에 더하는
+시간과 무거운 모듈 목록을 보여 준다. 선택했을 때만 읽어야 하는 페이지
+모듈이 시작 시 import되면 실패로 처리한다.
+
+저장소 루트에서 실행:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --repeat 5 --max-app-ms 150 --first-run
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+# 시작 시 import되면 안 되는 모듈 (선택한 보기에서만 사용)
+DEFERRED_MODULES = ['pages.analysis', 'pages.cohort', 'pages.profiling', 'utils.cohort', 'utils.bulk_io', 'yaml']
+
+APP_PREFIXES = ('main', 'utils', 'pages')
+
+LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+FIRST_RUN_SCRIPT = """
+import time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file('main.py', default_timeout=120)
+at.run()
+if at.exception:
+    raise SystemExit(at.exception[0].value)
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def parse_importtime(stderr):
+    """[(name, self_us, cumulative_us, depth), ...]"""
+    modules = []
+    for line in stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return modules
+
+
+def run_importtime():
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import main'],
+        capture_output=True, text=True, check=True
+    )
+    return parse_importtime(result.stderr)
+
+
+def summarize(modules):
+    by_name = {name: (self_us, cumulative_us) for name, self_us, cumulative_us, _ in modules}
+    total = by_name['main'][1]
+    streamlit = by_name.get('streamlit', (0, 0))[1]
+    app_self = sum(self_us for name, self_us, _, _ in modules if name.split('.')[0] in APP_PREFIXES)
+    return {
+        'total_ms': total / 1000,
+        'streamlit_ms': streamlit / 1000,
+        # main이 Streamlit 외에 더하는 시간 (앱 모듈이 처음 끌어온 의존성 포함)
+        'app_ms': (total - streamlit) / 1000,
+        'app_self_ms': app_self / 1000,
+        'deferred_loaded': [name for name in DEFERRED_MODULES if name in by_name]
+    }
+
+
+def first_run_ms(workdir):
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    result = subprocess.run(
+        [sys.executable, '-c', FIRST_RUN_SCRIPT],
+        capture_output=True, text=True, check=True, cwd=workdir, env=env
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='import 시간 측정')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--max-app-ms', type=float, help='앱 모듈 import 시간 상한 (넘으면 실패)')
+    parser.add_argument('--first-run', action='store_true', help='새 프로세스에서 AppTest 첫 실행 시간도 측정')
+    args = parser.parse_args(argv)
+
+    # 첫 실행은 .pyc 생성 시간이 섞이므로 버림
+    run_importtime()
+    samples = [run_importtime() for _ in range(args.repeat)]
+    summaries = [summarize(modules) for modules in samples]
+    best = min(summaries, key=lambda summary: summary['total_ms'])
+
+    print(f"import main       {best['total_ms']:8.1f} ms")
+    print(f"  streamlit       {best['streamlit_ms']:8.1f} ms")
+    print(f"  앱 추가분        {best['app_ms']:8.1f} ms (앱 모듈 자체 {best['app_self_ms']:.1f} ms)")
+
+    print(f'\n자체 시간이 큰 모듈 (상위 {args.top})')
+    heaviest = sorted(samples[summaries.index(best)], key=lambda module: -module[1])[:args.top]
+    for name, self_us, cumulative_us, _ in heaviest:
+        print(f'  {name:<50} {self_us / 1000:8.1f} ms  (누적 {cumulative_us / 1000:.1f} ms)')
+
+    failed = False
+    if best['deferred_loaded']:
+        print(f"\n시작 시 import되면 안 되는 모듈: {', '.join(best['deferred_loaded'])}")
+        failed = True
+    if args.max_app_ms is not None and best['app_ms'] > args.max_app_ms:
+        print(f"\n앱 추가분 {best['app_ms']:.1f} ms가 상한 {args.max_app_ms:.1f} ms를 넘었습니다")
+        failed = True
+
+    if args.first_run:
+        with tempfile.TemporaryDirectory() as workdir:
+            os.symlink(os.path.abspath('main.py'), os.path.join(workdir, 'main.py'))
+            print(f'\n첫 세션 실행 (새 프로세스, AppTest) {first_run_ms(workdir):8.1f} ms')
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""버튼 한 번 누를 때의 응답 시간 측정
+
+저장소 루트에서 실행:
+    python -m benchmarks.bench_interaction [행 수]
+
+이전 구조에서는 +30분 등의 버튼이 st.rerun()을 호출해 클릭 한 번에 스크립트
+전체가 두 번 실행되었다. 이전 값은 '클릭 실행 + 추가 전체 실행'으로 계산한다.
+실제 앱에서는 프래그먼트 안의 버튼이 해당 섹션만 다시 실행하므로 'after'보다
+더 빠르다 (AppTest는 항상 스크립트 전체를 실행).
+"""
+import os
+import sys
+import tempfile
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.bench_load import write_synthetic_csvs
+
+DEFAULT_ROWS = 20_000
+REPEAT = 5
+
+MAIN_SCRIPT = os.path.abspath('main.py')
+
+
+def timed_run(at):
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return elapsed
+
+
+def best(samples):
+    return min(samples) * 1000
+
+
+def main(rows):
+    cwd = os.getcwd()
+    sys.path.insert(0, cwd)
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            write_synthetic_csvs(rows)
+            at = AppTest.from_file(MAIN_SCRIPT, default_timeout=120)
+            timed_run(at)
+
+            click, full = [], []
+            for _ in range(REPEAT):
+                at.button(key='plus_study').click()
+                click.append(timed_run(at))
+                full.append(timed_run(at))
+        finally:
+            os.chdir(cwd)
+
+    print(f'activity rows: {rows}')
+    print(f"{'':<28} {'ms':>8}")
+    print(f"{'full script run':<28} {best(full):>8.1f}")
+    print(f"{'before (click + st.rerun)':<28} {best(click) + best(full):>8.1f}")
+    print(f"{'after (callback, one run)':<28} {best(click):>8.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS)
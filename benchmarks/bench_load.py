@@ -0,0 +1,69 @@
+"""load_data 콜드 로드 시간 측정
+
+저장소 루트에서 실행:
+    python -m benchmarks.bench_load [행 수 ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.datasets import write_dataset
+from utils import data_manager
+
+DEFAULT_ROWS = [1_000, 10_000, 50_000, 100_000]
+
+
+def write_synthetic_csvs(activity_rows, seed=0):
+    """현재 디렉토리의 data/ 아래에 약 activity_rows 행 규모의 CSV 생성"""
+    write_dataset(max(1, activity_rows // 8), 8, seed, interleave=True)
+
+
+def legacy_load_data():
+    """iterrows 기반의 이전 load_data (비교용)"""
+    data = {'activities': {}, 'checklist': {}, 'reviews': {}}
+    checklist_df = pd.read_csv('data/checklist_data.csv')
+    for _, row in checklist_df.iterrows():
+        data['checklist'].setdefault(row['date'], {})[row['item_id']] = row['checked']
+    activities_df = pd.read_csv('data/activities_data.csv')
+    for _, row in activities_df.iterrows():
+        day = data['activities'].setdefault(row['date'], {'study': [], 'break': []})
+        day[row['activity_type']].append({
+            'hours': float(row['hours']),
+            'memo': row['memo'],
+            'timestamp': row['timestamp']
+        })
+    reviews_df = pd.read_csv('data/reviews_data.csv')
+    for _, row in reviews_df.iterrows():
+        data['reviews'][row['date']] = {'content': row['content'], 'timestamp': row['timestamp']}
+    return data
+
+
+def time_call(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(row_counts):
+    cwd = os.getcwd()
+    print(f"{'rows':>10} {'iterrows (s)':>14} {'load_data (s)':>14} {'speedup':>8}")
+    for rows in row_counts:
+        with tempfile.TemporaryDirectory() as workdir:
+            os.chdir(workdir)
+            try:
+                write_synthetic_csvs(rows)
+                legacy = time_call(legacy_load_data, repeat=1)
+                current = time_call(data_manager.load_data)
+            finally:
+                os.chdir(cwd)
+        print(f"{rows:>10} {legacy:>14.3f} {current:>14.3f} {legacy / current:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_ROWS)
@@ -0,0 +1,74 @@
+"""활동 기록의 메모리 사용량 비교 (dict 구조 vs ActivityDay/ActivityRecord)
+
+저장소 루트에서 실행:
+    python -m benchmarks.bench_memory [행 수 ...]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.bench_load import legacy_load_data, write_synthetic_csvs
+from utils import data_manager
+from utils.aggregates import ActivityAggregates
+
+DEFAULT_ROWS = [10_000, 100_000]
+
+
+def measure(build):
+    """build()가 만든 객체가 차지하는 메모리(바이트)와 객체"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return after - before, result
+
+
+def legacy_totals(activities):
+    """이전 방식: 날짜마다 dict를 순회하며 sum"""
+    return {
+        date: (
+            sum(record['hours'] for record in day['study']),
+            sum(record['hours'] for record in day['break'])
+        )
+        for date, day in activities.items()
+    }
+
+
+def main(row_counts):
+    cwd = os.getcwd()
+    print(f"{'rows':>10} {'dict (MB)':>10} {'compact (MB)':>13} {'ratio':>6} "
+          f"{'dict sum (ms)':>14} {'range sum (ms)':>15}")
+    for rows in row_counts:
+        with tempfile.TemporaryDirectory() as workdir:
+            os.chdir(workdir)
+            try:
+                write_synthetic_csvs(rows)
+                legacy_bytes, legacy = measure(lambda: legacy_load_data()['activities'])
+                compact_bytes, compact = measure(
+                    lambda: data_manager._frame_to_section(
+                        'activities', data_manager._read_csv('data/activities_data.csv', 'activities')
+                    )
+                )
+            finally:
+                os.chdir(cwd)
+
+        start = time.perf_counter()
+        legacy_totals(legacy)
+        legacy_ms = (time.perf_counter() - start) * 1000
+
+        totals = ActivityAggregates.from_activities(compact).daily_totals()
+        start = time.perf_counter()
+        totals.range_totals()
+        range_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{rows:>10} {legacy_bytes / 1e6:>10.1f} {compact_bytes / 1e6:>13.1f} "
+              f"{legacy_bytes / compact_bytes:>5.1f}x {legacy_ms:>14.2f} {range_ms:>15.3f}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_ROWS)
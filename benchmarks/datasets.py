@@ -0,0 +1,65 @@
+"""벤치마크용 합성 데이터 생성
+
+기간(일 수)과 하루 기록 수를 정해 data/ 아래에 세 CSV 스냅샷을 만든다.
+"""
+import os
+import random
+
+import pandas as pd
+
+# 이름 -> 일 수
+SCALES = {
+    '1m': 30,
+    '6m': 182,
+    '1y': 365,
+    '3y': 365 * 3,
+    '10y': 365 * 10
+}
+
+START_DATE = '2020-01-01'
+
+MEMOS = ['', '수학', '영어 단어', '물리 문제 풀이', '국어 비문학 지문 분석 및 오답 정리']
+CHECKLIST_ITEMS = ['wake', 'sleep', 'class', 'meal', 'tkd', 'study', 'screen', 'focus']
+
+
+def scale_days(scale):
+    """'1y' 같은 이름 또는 일 수 문자열을 일 수로 변환"""
+    return SCALES[scale] if scale in SCALES else int(scale)
+
+
+def write_dataset(days, records_per_day=8, seed=0, interleave=False):
+    """현재 디렉토리의 data/ 아래에 days일 x 하루 records_per_day개 기록 생성
+
+    interleave=True면 활동 행을 날짜 순이 아니라 날짜를 돌아가며 섞어 쓴다.
+    생성한 활동 행 수를 반환한다.
+    """
+    rng = random.Random(seed)
+    os.makedirs('data', exist_ok=True)
+    dates = pd.date_range(START_DATE, periods=days).strftime('%Y-%m-%d').tolist()
+    rows = days * records_per_day
+    if interleave:
+        activity_dates = [dates[i % days] for i in range(rows)]
+    else:
+        activity_dates = [date for date in dates for _ in range(records_per_day)]
+
+    pd.DataFrame({
+        'date': activity_dates,
+        'activity_type': [rng.choice(['study', 'break']) for _ in range(rows)],
+        'hours': [rng.choice([0.5, 1.0, 1.5, 2.0]) for _ in range(rows)],
+        'memo': [rng.choice(MEMOS) for _ in range(rows)],
+        'timestamp': [f'{rng.randrange(24):02d}:{rng.randrange(60):02d}' for _ in range(rows)],
+    }).to_csv('data/activities_data.csv', index=False)
+
+    pd.DataFrame({
+        'date': [date for date in dates for _ in CHECKLIST_ITEMS],
+        'item_id': CHECKLIST_ITEMS * days,
+        'checked': [rng.random() < 0.7 for _ in range(days * len(CHECKLIST_ITEMS))],
+    }).to_csv('data/checklist_data.csv', index=False)
+
+    pd.DataFrame({
+        'date': dates,
+        'content': ['오늘의 총평: ' + rng.choice(MEMOS) for _ in dates],
+        'timestamp': ['23:00' for _ in dates],
+    }).to_csv('data/reviews_data.csv', index=False)
+
+    return rows
@@ -0,0 +1,203 @@
+"""브라우저 없이 실행하는 벤치마크 모음
+
+규모별로 합성 데이터를 만든 뒤 저장/분석/캘린더 경로의 시간을 재고
+JSON 보고서로 남긴다. 저장 방식은 STORAGE_MODE 환경 변수를 따른다.
+
+저장소 루트에서 실행:
+    python -m benchmarks.suite
+    python -m benchmarks.suite --scales 1m 1y 10y --records-per-day 12 --output report.json
+    STORAGE_MODE=sqlite python -m benchmarks.suite --app
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+
+import pandas as pd
+import streamlit
+
+from benchmarks.datasets import START_DATE, scale_days, write_dataset
+from utils import data_manager
+from utils.aggregates import ActivityAggregates
+from utils.calendar_index import CalendarIndex
+from utils.range_query import RangeIndex
+from utils.schedule import get_schedule_book
+from utils.render_cache import RenderCache
+from pages.calendar import RENDER_FORMAT, build_month_view, create_calendar_grid, render_calendar_html
+
+DEFAULT_SCALES = ['1m', '1y', '10y']
+DEFAULT_OUTPUT = 'benchmarks/report.json'
+
+MAIN_SCRIPT = os.path.abspath('main.py')
+
+
+def measure(func, repeat, setup=None):
+    """setup()은 시간에서 제외하고 func()만 repeat번 측정 (ms)"""
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {'best_ms': min(samples), 'mean_ms': statistics.mean(samples), 'repeat': repeat}
+
+
+def months_of(days):
+    return sorted({d[:7] for d in pd.date_range(START_DATE, periods=days).strftime('%Y-%m-%d')})
+
+
+def calendar_pass(data, months):
+    """모든 월의 달력 격자, 월 요약, HTML을 처음부터 생성"""
+    index = CalendarIndex(data)
+    for month in months:
+        selected = date(int(month[:4]), int(month[5:]), 1)
+        create_calendar_grid(selected)
+        render_calendar_html(selected, index.month(selected.year, selected.month))
+
+
+def cached_calendar_pass(data, months, cache):
+    """날짜 선택으로 지난 달을 오갈 때처럼 렌더 캐시를 거쳐 모든 월 화면 조회"""
+    index = data_manager.get_calendar_index(data)
+    for month in months:
+        year, month = int(month[:4]), int(month[5:])
+        version = f"{RENDER_FORMAT}-{index.month_version(year, month)}"
+        cache.get(year, month, version, lambda: build_month_view(year, month, index.month(year, month)))
+
+
+def range_queries(ranges):
+    """기간 분석 탭 한 번에 해당하는 조회"""
+    ranges.totals()
+    ranges.series(freq='week')
+    ranges.rolling(windows=(30,))
+    ranges.by_weekday()
+    ranges.by_day_type()
+
+
+def run_scale(days, records_per_day, repeat, run_app):
+    results = {}
+    rows = write_dataset(days, records_per_day)
+    data = data_manager.load_data()
+    months = months_of(days)
+    last_day = pd.Timestamp(START_DATE) + pd.Timedelta(days=days - 1)
+    edit_key = last_day.strftime('%Y-%m-%d')
+
+    results['load_data'] = measure(data_manager.load_data, repeat)
+
+    # 하루치 기록 하나를 바꾼 뒤 저장
+    results['save_data'] = measure(
+        lambda: data_manager.save_data(data), repeat,
+        setup=lambda: data_manager.add_activity(data, edit_key, 'study', 0.5, 'bench', '12:00')
+    )
+
+    results['backup_data (first)'] = measure(data_manager.backup_data, 1)
+    results['backup_data (incremental)'] = measure(
+        data_manager.backup_data, repeat,
+        setup=lambda: (
+            data_manager.add_activity(data, edit_key, 'break', 0.5, 'bench', '12:30'),
+            data_manager.save_data(data)
+        )
+    )
+
+    results['daily_summary'] = measure(data_manager.daily_summary, repeat)
+    results['monthly_summary'] = measure(data_manager.monthly_summary, repeat)
+    results['aggregates (build)'] = measure(
+        lambda: ActivityAggregates.from_activities(data['activities']), repeat
+    )
+    results['calendar grid + summary (all months)'] = measure(lambda: calendar_pass(data, months), repeat)
+    totals = data_manager.get_aggregates(data).daily_totals()
+    results['range index (build)'] = measure(lambda: RangeIndex(totals, get_schedule_book()), repeat)
+    ranges = data_manager.get_range_index(data)
+    results['range query (totals + weekly + 30d rolling + weekday)'] = measure(
+        lambda: range_queries(ranges), repeat
+    )
+    cache = RenderCache('calendar', max_entries=len(months), persist=False)
+    cached_calendar_pass(data, months, cache)
+    results['calendar render cache hit (all months)'] = measure(
+        lambda: cached_calendar_pass(data, months, cache), repeat
+    )
+
+    if run_app:
+        # 첫 실행은 모듈 import 시간이 섞이므로 두 번 재고 최솟값 사용
+        results['app first run'] = measure(_run_app, 2)
+
+    return rows, len(months), results
+
+
+def _run_app():
+    from streamlit.testing.v1 import AppTest
+    # 공유 저장소는 프로세스 단위로 캐시되므로 이전 규모의 데이터를 비움
+    streamlit.cache_resource.clear()
+    at = AppTest.from_file(MAIN_SCRIPT, default_timeout=600)
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+
+
+def environment():
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'storage_mode': data_manager.STORAGE_MODE,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'pandas': pd.__version__,
+        'streamlit': streamlit.__version__
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='합성 데이터 벤치마크')
+    parser.add_argument('--scales', nargs='+', default=DEFAULT_SCALES,
+                        help='1m, 6m, 1y, 3y, 10y 또는 일 수')
+    parser.add_argument('--records-per-day', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--app', action='store_true', help='AppTest로 앱 첫 실행 시간도 측정')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    report = {'environment': environment(), 'results': []}
+    cwd = os.getcwd()
+    sys.path.insert(0, cwd)
+    for scale in args.scales:
+        days = scale_days(scale)
+        with tempfile.TemporaryDirectory() as workdir:
+            os.chdir(workdir)
+            try:
+                rows, months, results = run_scale(days, args.records_per_day, args.repeat, args.app)
+            finally:
+                # 변경 로그 파일은 상대 경로로 열려 있으므로 다음 규모 전에 닫음
+                data_manager.get_journal().close()
+                os.chdir(cwd)
+        for name, timing in results.items():
+            report['results'].append({
+                'scale': scale,
+                'days': days,
+                'months': months,
+                'records_per_day': args.records_per_day,
+                'activity_rows': rows,
+                'benchmark': name,
+                **timing
+            })
+            print(f"{scale:>5} {rows:>9} {name:<38} {timing['best_ms']:>10.2f} ms")
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f'보고서: {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,23 +1,50 @@
 import streamlit as st
-from datetime import datetime
-import pandas as pd
-import pytz
 import os
-from utils.data_manager import load_data, save_data, backup_data
+from utils.data_manager import (
+    load_data, save_data, backup_data, compact_data, writer_status,
+    STORAGE_MODE, SHARED_STORE, WRITE_BEHIND
+)
+from utils.shared_store import SharedStore
 from pages.checklist import render_checklist
 from pages.calendar import render_calendar
-from pages.analysis import show_data_analysis
+from pages.search import render_search
+from pages.bulk import render_import_panel
+from utils import profiling
+from utils.clock import seoul_now
+from utils.tenancy import MULTI_USER, is_valid_user_id, shard_path, use_user, current_root
 
-# 서울 시간대 설정
-seoul_tz = pytz.timezone('Asia/Seoul')
-
-# 현재 서울 시간 가져오기
-current_time = datetime.now(seoul_tz).strftime('%H:%M')
+# 분석/코호트/계측 페이지는 선택했을 때 처음 import (첫 세션 시작 시간 단축)
 
 def ensure_directories():
     """필요한 디렉토리 생성"""
-    os.makedirs('data', exist_ok=True)
-    os.makedirs('backup', exist_ok=True)
+    os.makedirs(shard_path('data'), exist_ok=True)
+    os.makedirs(shard_path('backup'), exist_ok=True)
+
+@st.cache_resource
+def get_shared_store(root):
+    """모든 세션이 함께 쓰는 데이터 저장소 (사용자 샤드마다 프로세스당 한 번만 로드)"""
+    return SharedStore(load_data())
+
+def select_user():
+    """MULTI_USER=1 일 때 사용자 ID (주소의 ?user= 또는 사이드바 입력)"""
+    if 'user_id' not in st.session_state:
+        st.session_state.user_id = st.query_params.get('user', '')
+    user_id = st.sidebar.text_input('사용자 ID', key='user_id').strip()
+    if not is_valid_user_id(user_id):
+        return None
+    return user_id
+
+def render_save_status():
+    """백그라운드 저장 상태 표시"""
+    status = writer_status()
+    if status is None:
+        return
+    if status['last_error']:
+        st.error(f"저장 오류: {status['last_error']}")
+    elif status['pending'] or status['busy']:
+        st.caption('저장 중...')
+    elif status['last_flush']:
+        st.caption(f"마지막 저장: {status['last_flush'][11:]}")
 
 def main():
     # 페이지 기본 설정
@@ -27,12 +54,29 @@ def main():
         layout="wide"
     )
 
+    # PROFILING=1 이면 rerun마다 구간별 시간/입출력/요소 수를 기록
+    if 'profile_history' not in st.session_state:
+        st.session_state.profile_history = profiling.new_history()
+    user_id = None
+    if MULTI_USER:
+        user_id = select_user()
+        if user_id is None:
+            st.info('사이드바에 사용자 ID(영문, 숫자, _, -)를 입력하세요.')
+            return
+    with use_user(user_id), profiling.rerun(st.session_state.profile_history):
+        render_app()
+    if profiling.PROFILING:
+        from pages.profiling import render_profile_panel
+        render_profile_panel(st.session_state.profile_history)
+
+def render_app():
     # 디렉토리 생성
     ensure_directories()
 
-    # 데이터 초기화
-    if 'data' not in st.session_state:
-        st.session_state.data = load_data()
+    # 데이터 초기화 (사용자가 바뀌면 그 사용자의 샤드를 다시 읽음)
+    if st.session_state.get('data_root') != current_root():
+        st.session_state.data = get_shared_store(current_root()) if SHARED_STORE else load_data()
+        st.session_state.data_root = current_root()
 
     # 사이드바 
     with st.sidebar:
@@ -40,12 +84,25 @@ def main():
         
         view_option = st.radio(
             "보기 선택",
-            ["데이터 분석"]
+            ["데이터 분석", "코호트 분석"] if MULTI_USER else ["데이터 분석"]
         )
         
         if st.button('데이터 백업'):
-            backup_data()
-            st.success('데이터가 백업되었습니다!')
+            snapshot = backup_data()
+            st.success(f'데이터가 백업되었습니다! ({snapshot})')
+
+        if STORAGE_MODE == 'journal' and st.button('변경 로그 압축'):
+            compact_data(st.session_state.data)
+            st.success('변경 로그가 CSV로 압축되었습니다!')
+
+        if SHARED_STORE and WRITE_BEHIND:
+            render_save_status()
+
+        st.markdown("---")
+        render_search()
+
+        st.markdown("---")
+        render_import_panel()
 
     # 타이틀 표시
     st.title('일일 학습 체크리스트')
@@ -53,7 +110,10 @@ def main():
     # 날짜 선택을 위한 열 생성
     date_col1, date_col2 = st.columns([2, 3])
     with date_col1:
-        selected_date = st.date_input("날짜 선택", datetime.now(seoul_tz))
+        # 검색 결과에서 날짜를 바꿀 수 있도록 세션 스테이트로 관리
+        if 'selected_date' not in st.session_state:
+            st.session_state.selected_date = seoul_now().date()
+        selected_date = st.date_input("날짜 선택", key='selected_date')
 
     # 메인 컨텐츠 (체크리스트)
     render_checklist(selected_date)
@@ -67,8 +127,13 @@ def main():
     
     # 데이터 분석 선택시 표시
     if view_option == "데이터 분석":
+        from pages.analysis import show_data_analysis
         st.markdown("---")
         show_data_analysis()
+    elif view_option == "코호트 분석":
+        from pages.cohort import render_cohort
+        st.markdown("---")
+        render_cohort()
 
 if __name__ == "__main__":
     main()
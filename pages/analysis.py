@@ -1,38 +1,95 @@
 import streamlit as st
-import pandas as pd
-import os
-from utils.data_manager import format_time_display
+import tempfile
+from datetime import timedelta
+from utils.data_manager import (
+    format_time_display, get_aggregates, get_activity_pager, get_goal_report, get_range_index,
+    iter_saved_activities
+)
+from utils.profiling import profiled
 
+DISPLAY_COLUMNS = {
+    'date': '날짜',
+    'activity_type': '활동 유형',
+    'hours': '시간',
+    'memo': '메모',
+    'timestamp': '기록 시각'
+}
+
+ACTIVITY_LABELS = {
+    'study': '학습',
+    'break': '휴식'
+}
+
+DAY_TYPE_LABELS = {
+    'mwf': '월/수/금',
+    'tt': '화/목',
+    'saturday': '토요일',
+    'sunday': '일요일'
+}
+
+WEEKDAY_LABELS = ['월', '화', '수', '목', '금', '토', '일']
+
+# 기간 분석 탭의 묶음 단위 (사용자 지정은 N일씩)
+GRANULARITIES = {
+    '일': 'day',
+    '주 (일요일 시작)': 'week',
+    '월': 'month',
+    '사용자 지정 (N일)': 'custom'
+}
+
+RANGE_PRESETS = {
+    '최근 7일': 7,
+    '최근 30일': 30,
+    '최근 90일': 90,
+    '최근 1년': 365,
+    '전체': None,
+    '직접 선택': 0
+}
+
+GROUP_COLUMNS = {
+    'study': '학습 합계', 'break': '휴식 합계', 'days': '기록 일수',
+    'study_avg': '평균 학습', 'break_avg': '평균 휴식'
+}
+
+PAGE_SIZES = [50, 100, 500]
+
+# 내보내기 시 한 번에 만드는 행 수
+EXPORT_CHUNK_ROWS = 5_000
+
+def to_display(df):
+    """열 이름과 활동 유형을 한글로"""
+    df = df.rename(columns=DISPLAY_COLUMNS)
+    df['활동 유형'] = df['활동 유형'].map(ACTIVITY_LABELS)
+    return df
+
+def iter_csv_bytes(frames):
+    """DataFrame 청크를 CSV 바이트로 하나씩 변환 (헤더는 처음 한 번)"""
+    header = True
+    for frame in frames:
+        yield to_display(frame).to_csv(index=False, header=header).encode('utf-8')
+        header = False
+    if header:
+        yield ','.join(DISPLAY_COLUMNS.values()).encode('utf-8') + b'\n'
+
+@profiled()
 def show_data_analysis():
     st.markdown("### 학습 데이터 분석")
     
-    if not os.path.exists('data/activities_data.csv'):
+    # 집계는 세션 데이터와 함께 증분으로 유지되므로 매 rerun마다 다시 계산하지 않음
+    aggregates = get_aggregates(st.session_state.data)
+    if not aggregates.daily:
         st.warning("아직 저장된 데이터가 없습니다.")
         return
-        
-    # 데이터 로드
-    df = pd.read_csv('data/activities_data.csv')
-    df['date'] = pd.to_datetime(df['date'])
     
     # 탭 생성
-    tab1, tab2, tab3 = st.tabs(["일별 분석", "월별 분석", "상세 데이터"])
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["일별 분석", "월별 분석", "상세 데이터", "목표 달성", "기간 분석"])
     
     with tab1:
         st.subheader("일별 학습/휴식 시간")
         
-        # 일별 총계 계산
-        daily_summary = df.pivot_table(
-            index='date',
-            columns='activity_type',
-            values='hours',
-            aggfunc='sum'
-        ).reset_index().fillna(0)
-        
-        daily_summary = daily_summary.sort_values('date')
-        
         # 차트 생성
         st.line_chart(
-            daily_summary.set_index('date')[['study', 'break']],
+            aggregates.daily_frame().set_index('date')[['study', 'break']],
             use_container_width=True
         )
         
@@ -41,40 +98,32 @@ def show_data_analysis():
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            avg_study = daily_summary['study'].mean()
+            avg_study = aggregates.average('study')
             st.metric("평균 학습 시간", f"{avg_study:.1f}시간")
             
         with col2:
-            avg_break = daily_summary['break'].mean()
+            avg_break = aggregates.average('break')
             st.metric("평균 휴식 시간", f"{avg_break:.1f}시간")
             
         with col3:
-            study_days = len(daily_summary[daily_summary['study'] > 0])
+            study_days = aggregates.study_days()
             st.metric("총 학습 일수", f"{study_days}일")
     
     with tab2:
         st.subheader("월별 학습/휴식 시간")
         
         # 월별 총계 계산
-        df['month'] = df['date'].dt.strftime('%Y-%m')
-        monthly_summary = df.pivot_table(
-            index='month',
-            columns='activity_type',
-            values='hours',
-            aggfunc='sum'
-        ).reset_index().fillna(0)
-        
-        monthly_summary = monthly_summary.sort_values('month')
+        monthly = aggregates.monthly_frame()
         
         # 차트 생성
         st.bar_chart(
-            monthly_summary.set_index('month')[['study', 'break']],
+            monthly.set_index('month')[['study', 'break']],
             use_container_width=True
         )
         
         # 월별 상세 데이터
         st.markdown("#### 월별 상세 데이터")
-        st.dataframe(monthly_summary.style.format({
+        st.dataframe(monthly.style.format({
             'study': '{:.1f}시간',
             'break': '{:.1f}시간'
         }))
@@ -82,34 +131,163 @@ def show_data_analysis():
     with tab3:
         st.subheader("전체 기록 데이터")
         
-        # 데이터 정렬 및 포맷팅
-        display_df = df.sort_values('date', ascending=False).copy()
-        display_df['date'] = display_df['date'].dt.strftime('%Y-%m-%d')
-        display_df = display_df.rename(columns={
-            'date': '날짜',
-            'activity_type': '활동 유형',
-            'hours': '시간',
-            'memo': '메모',
-            'timestamp': '기록 시각'
-        })
-        
-        # 활동 유형 한글화
-        display_df['활동 유형'] = display_df['활동 유형'].map({
-            'study': '학습',
-            'break': '휴식'
-        })
-        
+        # 최신 날짜부터 현재 페이지의 행만 만들어 표시
+        pager = get_activity_pager(st.session_state.data)
+        total_rows = pager.total_rows()
+
+        page_col1, page_col2 = st.columns([1, 1])
+        with page_col1:
+            page_size = st.selectbox("페이지당 행 수", PAGE_SIZES, key='detail_page_size')
+        page_count = max(1, -(-total_rows // page_size))
+        with page_col2:
+            page = st.number_input("페이지", min_value=1, max_value=page_count, value=1, key='detail_page')
+
+        start = (page - 1) * page_size
+        st.caption(f"전체 {total_rows}행 중 {start + 1 if total_rows else 0}-{min(start + page_size, total_rows)}행")
         st.dataframe(
-            display_df,
+            to_display(pager.page(page - 1, page_size)),
             use_container_width=True,
             hide_index=True
         )
         
-        # CSV 다운로드 버튼
-        csv = display_df.to_csv(index=False)
-        st.download_button(
-            label="CSV 다운로드",
-            data=csv,
-            file_name="학습기록.csv",
-            mime="text/csv"
+        # CSV는 버튼을 눌렀을 때만 디스크의 기록을 청크 단위로 임시 파일에 써서 만들고,
+        # 이번 실행의 다운로드 버튼에만 넘김 (세션에 보관하지 않음)
+        if st.button("CSV 만들기", key='build_export'):
+            with tempfile.TemporaryFile(buffering=0) as f:
+                frames = iter_saved_activities(st.session_state.data, chunksize=EXPORT_CHUNK_ROWS)
+                for chunk in iter_csv_bytes(frames):
+                    f.write(chunk)
+                st.download_button(
+                    label="CSV 다운로드",
+                    data=f,
+                    file_name="학습기록.csv",
+                    mime="text/csv"
+                )
+
+    with tab4:
+        render_goal_report(get_goal_report(st.session_state.data))
+
+    with tab5:
+        render_range_analysis(get_range_index(st.session_state.data))
+
+def select_range(first, last):
+    """기간 선택 (마지막 기록일 기준 최근 N일, 전체, 직접 선택)"""
+    preset = st.radio("기간", list(RANGE_PRESETS), horizontal=True, key='range_preset')
+    days = RANGE_PRESETS[preset]
+    if days is None:
+        return first, last
+    if days:
+        return max(first, last - timedelta(days=days - 1)), last
+    picked = st.date_input(
+        "시작일 - 종료일", value=(max(first, last - timedelta(days=29)), last),
+        min_value=first, max_value=last, key='range_dates'
+    )
+    # 시작일만 고른 상태에서는 하루로 처리
+    return (picked[0], picked[-1]) if picked else (first, last)
+
+def render_range_analysis(index):
+    """선택한 기간의 합계, 단위별 추이, 7/30일 이동 평균, 요일/스케줄 종류별 비교"""
+    st.subheader("기간 분석")
+    if index.is_empty():
+        st.info("기록이 없습니다.")
+        return
+    start, end = select_range(*index.bounds())
+
+    totals = index.totals(start, end)
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("총 학습 시간", format_time_display(totals['study']))
+    with col2:
+        st.metric("평균 학습 시간", f"{totals['study_avg']:.1f}시간", help="기록한 날 기준")
+    with col3:
+        st.metric("평균 휴식 시간", f"{totals['break_avg']:.1f}시간", help="기록한 날 기준")
+    with col4:
+        st.metric("기록 일수", f"{totals['days']}/{totals['calendar_days']}일")
+
+    unit_col1, unit_col2 = st.columns([2, 1])
+    with unit_col1:
+        freq = GRANULARITIES[st.selectbox("묶음 단위", list(GRANULARITIES), key='range_granularity')]
+    if freq == 'custom':
+        with unit_col2:
+            freq = int(st.number_input("N일", min_value=2, max_value=365, value=14, key='range_bucket_days'))
+    series = index.series(start, end, freq)
+    st.bar_chart(series.set_index('period')[['study', 'break']], use_container_width=True)
+
+    st.markdown("#### 이동 평균 (하루 평균, 기록 없는 날은 0시간)")
+    rolling = index.rolling(start, end).set_index('date').rename(columns={
+        'study_7': '학습 7일', 'study_30': '학습 30일', 'break_7': '휴식 7일', 'break_30': '휴식 30일'
+    })
+    st.line_chart(rolling[['학습 7일', '학습 30일', '휴식 7일', '휴식 30일']], use_container_width=True)
+
+    group_col1, group_col2 = st.columns(2)
+    group_format = {'학습 합계': '{:.1f}시간', '휴식 합계': '{:.1f}시간', '평균 학습': '{:.1f}시간', '평균 휴식': '{:.1f}시간'}
+    with group_col1:
+        st.markdown("#### 요일별")
+        by_weekday = index.by_weekday(start, end)
+        by_weekday['weekday'] = by_weekday['weekday'].map(WEEKDAY_LABELS.__getitem__)
+        st.dataframe(
+            by_weekday[['weekday'] + list(GROUP_COLUMNS)].rename(columns={'weekday': '요일', **GROUP_COLUMNS})
+            .style.format(group_format),
+            hide_index=True
+        )
+    with group_col2:
+        st.markdown("#### 스케줄 종류별")
+        by_type = index.by_day_type(start, end)
+        by_type['day_type'] = by_type['day_type'].map(lambda name: DAY_TYPE_LABELS.get(name, name))
+        st.dataframe(
+            by_type[['day_type'] + list(GROUP_COLUMNS)].rename(columns={'day_type': '유형', **GROUP_COLUMNS})
+            .style.format(group_format),
+            hide_index=True
+        )
+
+def render_goal_report(report):
+    """전체 기간의 목표 달성률, 연속 달성, 휴식 경고, 체크리스트 완료율"""
+    overall = report['overall']
+    st.subheader("학습 목표 달성")
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("달성률", f"{overall['rate'] * 100:.0f}%",
+                  help=f"GOOD {overall['good']}일 / BAD {overall['bad']}일 (미입력 {overall['missing']}일 제외)")
+    with col2:
+        st.metric("현재 연속 달성", f"{overall['current_streak']}일")
+    with col3:
+        st.metric("최장 연속 달성", f"{overall['longest_streak']}일")
+    with col4:
+        st.metric("휴식 경고", f"{overall['warning'] + overall['emergency']}회",
+                  help=f"WARNING {overall['warning']}회 / EMERGENCY {overall['emergency']}회")
+
+    st.markdown("#### 월별 달성률")
+    monthly = report['monthly']
+    st.bar_chart(monthly.set_index('month')[['rate']], use_container_width=True)
+
+    st.markdown("#### 요일 유형별")
+    by_type = report['by_day_type'].copy()
+    by_type['day_type'] = by_type['day_type'].map(lambda name: DAY_TYPE_LABELS.get(name, name))
+    st.dataframe(
+        by_type.rename(columns={
+            'day_type': '유형', 'target': '목표', 'days': '일수',
+            'good': 'GOOD', 'bad': 'BAD', 'missing': '미입력', 'rate': '달성률'
+        }).style.format({'목표': '{:.1f}시간', '달성률': '{:.0%}'}),
+        hide_index=True
+    )
+
+    st.markdown("#### 휴식 경고 (월별)")
+    st.dataframe(
+        monthly[['month', 'warning', 'emergency']].rename(
+            columns={'month': '월', 'warning': 'WARNING', 'emergency': 'EMERGENCY'}
+        ),
+        hide_index=True
+    )
+
+    st.markdown("#### 체크리스트 완료율")
+    checklist = report['checklist']
+    if checklist.empty:
+        st.info("체크리스트 기록이 없습니다.")
+    else:
+        st.dataframe(
+            checklist[['label', 'checked', 'days', 'ratio']].rename(
+                columns={'label': '항목', 'checked': '완료', 'days': '예정 일수', 'ratio': '완료율'}
+            ).style.format({'완료율': '{:.0%}'}),
+            hide_index=True
         )
@@ -0,0 +1,39 @@
+import io
+import tempfile
+import streamlit as st
+
+# 업로드할 수 있는 확장자
+UPLOAD_TYPES = ['csv', 'json', 'jsonl']
+
+def render_import_panel():
+    """사이드바 기록 가져오기/내보내기 (pandas는 사용할 때만 import)"""
+    with st.expander('기록 가져오기/내보내기'):
+        with st.form('bulk_import', clear_on_submit=True):
+            uploaded = st.file_uploader('CSV 또는 JSON 파일', type=UPLOAD_TYPES)
+            dry_run = st.checkbox('검사만 하기', value=False)
+            submitted = st.form_submit_button('가져오기')
+        if submitted and uploaded is not None:
+            from utils import bulk_io
+            text = bulk_io.open_text(uploaded)
+            fmt = bulk_io.detect_format(uploaded.name.lower(), text.read(64))
+            text.seek(0)
+            try:
+                report = bulk_io.ingest(st.session_state.data, text, fmt, dry_run=dry_run)
+            except ValueError as error:
+                st.error(str(error))
+            else:
+                # 사이드바가 본문보다 먼저 그려지므로 새 기록이 이번 실행에 바로 반영됨
+                st.session_state.bulk_report = bulk_io.format_report(report)
+        if st.session_state.get('bulk_report'):
+            st.text(st.session_state.bulk_report)
+
+        export_format = st.selectbox('내보내기 형식', ['csv', 'jsonl'])
+        if st.button('내보내기 파일 만들기'):
+            from utils import bulk_io
+            # 세션에 남기지 않고 임시 파일에 청크 단위로 쓴 뒤 이번 실행의 다운로드 버튼에만 넘김
+            with tempfile.TemporaryFile(buffering=0) as f:
+                text = io.TextIOWrapper(f, encoding='utf-8', newline='')
+                bulk_io.export_records(st.session_state.data, text, export_format)
+                text.flush()
+                text.detach()
+                st.download_button('파일 받기', f, file_name=f'activities.{export_format}')
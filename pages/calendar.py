@@ -1,123 +1,130 @@
 import streamlit as st
-from datetime import datetime, timedelta
-from utils.data_manager import format_time_display
+import calendar
+from datetime import date
+from html import escape
+from utils.data_manager import format_time_display, get_calendar_index
+from utils.profiling import profiled
+from utils.render_cache import get_render_cache
+
+WEEKDAYS = ['일', '월', '화', '수', '목', '금', '토']
+
+# 셀 HTML 모양을 바꾸면 올려서 디스크에 남은 이전 렌더 결과를 무효화
+RENDER_FORMAT = 1
+
+CALENDAR_STYLE = """
+<style>
+.calendar-table {
+    width: 100%;
+    table-layout: fixed;
+    border-collapse: collapse;
+}
+.calendar-table th, .calendar-table td {
+    border: none;
+    vertical-align: top;
+}
+.calendar-header {
+    font-weight: bold;
+    text-align: center;
+    padding: 5px;
+    margin-bottom: 10px;
+}
+.calendar-cell {
+    text-align: center;
+    padding: 8px;
+    min-height: 80px;
+}
+.day-number {
+    font-weight: bold;
+    font-size: 1.2em;
+    margin-bottom: 5px;
+}
+.activity-info {
+    font-size: 0.9em;
+    margin-top: 3px;
+}
+</style>
+"""
 
 def create_calendar_grid(selected_date):
-    # 해당 월의 첫 날과 마지막 날 구하기
-    first_day = selected_date.replace(day=1)
-    if selected_date.month == 12:
-        last_day = selected_date.replace(year=selected_date.year + 1, month=1, day=1) - timedelta(days=1)
-    else:
-        last_day = selected_date.replace(month=selected_date.month + 1, day=1) - timedelta(days=1)
-
-    # 요일 계산 수정
-    first_weekday = calendar.weekday(first_day.year, first_day.month, first_day.day)
-
-    # 달력 시작 날짜 수정
-    start_date = first_day - timedelta(days=first_weekday - 6)
-  
-
-    # 달력 생성
-    calendar_days = []
-    current_date = start_date
-  
-    while len(calendar_days) < 42:  # 6주 분량
-        week = []
-        for _ in range(7):
-            if current_date.month == selected_date.month:
-                week.append(current_date.day)
-            else:
-                week.append(None)
-            current_date += timedelta(days=1)
-        calendar_days.append(week)
-
-        # 마지막 주가 모두 다음 달이면 중단
-        if current_date > last_day and all(d is None for d in week):
-            calendar_days.pop()
-            break
-            
-    return calendar_days
+    # 일요일부터 시작하는 주 단위 달력 (해당 월이 아닌 칸은 None)
+    weeks = calendar.Calendar(firstweekday=6).monthdayscalendar(selected_date.year, selected_date.month)
+    return [[day or None for day in week] for week in weeks]
 
-def render_calendar(selected_date):
-    st.markdown("""
-    <style>
-    .calendar-header {
-        font-weight: bold;
-        text-align: center;
-        padding: 5px;
-        margin-bottom: 10px;
-    }
-    .calendar-cell {
-        text-align: center;
-        padding: 8px;
-        min-height: 80px;
-    }
-    .day-number {
-        font-weight: bold;
-        font-size: 1.2em;
-        margin-bottom: 5px;
-    }
-    .activity-info {
-        font-size: 0.9em;
-        margin-top: 3px;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+def weekday_color(idx):
+    return '#ff4b4b' if idx == 0 else '#4b7bff' if idx == 6 else '#ffffff'
 
-    # 월 표시
-    st.markdown(f"### {selected_date.year}년 {selected_date.month}월")
-
-    # 요일 헤더
-    cols = st.columns(7)
-    weekdays = ['일', '월', '화', '수', '목', '금', '토']
-    for idx, day in enumerate(weekdays):
-        with cols[idx]:
-            color = '#ff4b4b' if idx == 0 else '#4b7bff' if idx == 6 else '#ffffff'
-            st.markdown(
-                f"<div class='calendar-header' style='color: {color};'>{day}</div>",
-                unsafe_allow_html=True
+def render_day_cell(day, idx, summary):
+    html_content = [
+        "<div class='calendar-cell'>",
+        f"<div class='day-number' style='color: {weekday_color(idx)};'>{day}</div>"
+    ]
+
+    if summary is not None:
+        for subject, hours in summary['subjects']:
+            html_content.append(
+                f"<div class='activity-info' style='color: #ffffff;'>"
+                f"공부: {escape(str(subject))} ({hours}시간)</div>"
+            )
+
+        if summary['break'] > 0:
+            html_content.append(
+                f"<div class='activity-info' style='color: #ffffff;'>"
+                f"휴식: {format_time_display(summary['break'])}</div>"
             )
+        if summary['target'] > 0 and summary['study'] >= summary['target']:
+            html_content.append(
+                "<div class='activity-info' style='color: #4bff7b;'>목표 달성</div>"
+            )
+        if summary['has_review']:
+            html_content.append(
+                "<div class='activity-info' style='color: #ffffff;'>📝</div>"
+            )
+
+    html_content.append("</div>")
+    return "".join(html_content)
 
-    # 달력 그리드 생성
-    calendar_days = create_calendar_grid(selected_date)
-    for week in calendar_days:
-        cols = st.columns(7)
+def render_calendar_html(selected_date, month_summary):
+    """한 달 전체를 하나의 HTML 표로 생성"""
+    rows = ["<table class='calendar-table'><thead><tr>"]
+    for idx, day in enumerate(WEEKDAYS):
+        rows.append(
+            f"<th><div class='calendar-header' style='color: {weekday_color(idx)};'>{day}</div></th>"
+        )
+    rows.append("</tr></thead><tbody>")
+
+    for week in create_calendar_grid(selected_date):
+        rows.append("<tr>")
         for idx, day in enumerate(week):
-            with cols[idx]:
-                if day is not None:
-                    date_str = f"{selected_date.year}-{selected_date.month:02d}-{day:02d}"
-                    study_records = st.session_state.data['activities'].get(date_str, {}).get('study', [])
-                    break_records = st.session_state.data['activities'].get(date_str, {}).get('break', [])
-                    total_study = sum(record['hours'] for record in study_records)
-                    total_break = sum(record['hours'] for record in break_records)
-                    has_review = date_str in st.session_state.data['reviews']
-
-                    # 날짜 색상 설정
-                    color = '#ff4b4b' if idx == 0 else '#4b7bff' if idx == 6 else '#ffffff'
-
-                    html_content = [
-                        f"<div class='calendar-cell'>",
-                        f"<div class='day-number' style='color: {color};'>{day}</div>"
-                    ]
-
-                    # Iterate through all study records and display information
-                    for record in study_records:
-                        html_content.append(
-                            f"<div class='activity-info' style='color: #ffffff;'>"
-                            f"공부: {record['subject']} ({record['hours']}시간)</div>"
-                        )
-
-                    if total_break > 0:
-                        html_content.append(
-                            f"<div class='activity-info' style='color: #ffffff;'>"
-                            f"휴식: {format_time_display(total_break)}</div>"
-                        )
-                    if has_review:
-                        html_content.append(
-                            "<div class='activity-info' style='color: #ffffff;'>📝</div>"
-                        )
-
-                    html_content.append("</div>")
-                    st.markdown("".join(html_content), unsafe_allow_html=True)
-                else:
-                    st.write("")
+            if day is None:
+                rows.append("<td></td>")
+                continue
+            date_str = f"{selected_date.year}-{selected_date.month:02d}-{day:02d}"
+            rows.append(f"<td>{render_day_cell(day, idx, month_summary.get(date_str))}</td>")
+        rows.append("</tr>")
+
+    rows.append("</tbody></table>")
+    return "".join(rows)
+
+def build_month_view(year, month, month_summary):
+    """렌더 캐시에 넣을 한 달 화면 (격자와 HTML)"""
+    first_day = date(year, month, 1)
+    return {
+        'grid': create_calendar_grid(first_day),
+        'html': render_calendar_html(first_day, month_summary)
+    }
+
+@profiled()
+def render_calendar(selected_date):
+    year, month = selected_date.year, selected_date.month
+    # 월 표시
+    st.markdown(f"### {year}년 {month}월")
+
+    # 월 요약은 기록이 바뀔 때만 다시 계산하고, 화면은 그 달의 데이터 버전이 같으면 재사용
+    index = get_calendar_index(st.session_state.data)
+    version = f"{RENDER_FORMAT}-{index.month_version(year, month)}"
+    view = get_render_cache('calendar').get(
+        year, month, version, lambda: build_month_view(year, month, index.month(year, month))
+    )
+
+    # 42개 칸을 각각의 요소로 그리지 않고 한 번에 출력
+    st.markdown(CALENDAR_STYLE + view['html'], unsafe_allow_html=True)
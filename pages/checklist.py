@@ -1,15 +1,13 @@
 import streamlit as st
-import pandas as pd
-from datetime import datetime
-from utils.data_manager import get_day_type, format_time_display
-from datetime import datetime
-import pytz
-
-# 서울 시간대 설정
-seoul_tz = pytz.timezone('Asia/Seoul')
-
-# 현재 서울 시간 가져오기
-current_time = datetime.now(seoul_tz).strftime('%H:%M')
+from utils.data_manager import (
+    get_day_type, format_time_display, save_data,
+    set_checklist_item, add_activity, reset_activities, set_review
+)
+from utils.activity_store import EMPTY_DAY
+from utils.clock import current_time
+from utils.schedule import get_schedule_book
+from utils.fragments import fragment, request_app_rerun, finish_fragment
+from utils.profiling import profiled
 
 def init_session_state(activity_type):
     """세션 스테이트 초기화"""
@@ -18,17 +16,44 @@ def init_session_state(activity_type):
     if f'new_{activity_type}_memo' not in st.session_state:
         st.session_state[f'new_{activity_type}_memo'] = ''
 
+# 버튼 콜백은 스크립트 실행 전에 처리되므로 st.rerun()으로 한 번 더 실행할 필요가 없음
+def adjust_hours(activity_type, delta):
+    """-30분/+30분 버튼"""
+    key = f'new_{activity_type}_hours'
+    if st.session_state[key] + delta >= 0:
+        st.session_state[key] += delta
+
+def add_activity_record(date_key, activity_type):
+    """시간 추가 버튼"""
+    hours = st.session_state[f'new_{activity_type}_hours']
+    if hours > 0:
+        add_activity(
+            st.session_state.data,
+            date_key,
+            activity_type,
+            hours,
+            st.session_state[f'memo_{activity_type}'],
+            current_time()
+        )
+        st.session_state[f'new_{activity_type}_hours'] = 0.0
+        # 캘린더/분석에도 반영되도록 전체 rerun
+        request_app_rerun()
+
+def reset_activity_records(date_key, activity_type):
+    """기록 초기화 버튼"""
+    reset_activities(st.session_state.data, date_key, activity_type)
+    st.session_state[f'new_{activity_type}_hours'] = 0.0
+    request_app_rerun()
+
 def render_activity_section(activity_type, date_key, title):
     """활동(학습/휴식) 섹션 렌더링"""
     
     # 세션 스테이트 초기화
     init_session_state(activity_type)
     
-    if date_key not in st.session_state.data['activities']:
-        st.session_state.data['activities'][date_key] = {'study': [], 'break': []}
-    
-    activities = st.session_state.data['activities'][date_key][activity_type]
-    total_hours = sum(record['hours'] for record in activities)
+    day = st.session_state.data['activities'].get(date_key, EMPTY_DAY)
+    activities = day[activity_type]
+    total_hours = day.total(activity_type)
     
     if activities:
         st.write(f"오늘의 {title} 기록:")
@@ -42,147 +67,84 @@ def render_activity_section(activity_type, date_key, title):
     col1, col2, col3 = st.columns([1, 1, 2])
     
     with col1:
-        if st.button("-30분", key=f"minus_{activity_type}"):
-            if st.session_state[f'new_{activity_type}_hours'] >= 0.5:
-                st.session_state[f'new_{activity_type}_hours'] -= 0.5
-                st.rerun()
+        st.button("-30분", key=f"minus_{activity_type}", on_click=adjust_hours, args=(activity_type, -0.5))
 
     with col2:
-        if st.button("+30분", key=f"plus_{activity_type}"):
-            st.session_state[f'new_{activity_type}_hours'] += 0.5
-            st.rerun()
+        st.button("+30분", key=f"plus_{activity_type}", on_click=adjust_hours, args=(activity_type, 0.5))
 
     with col3:
         st.markdown(f"**선택된 시간: {format_time_display(st.session_state[f'new_{activity_type}_hours'])}**")
 
     # 메모 입력
-    memo = st.text_input(f'{title} 내용', key=f'memo_{activity_type}')
+    st.text_input(f'{title} 내용', key=f'memo_{activity_type}')
 
     # 시간 추가 버튼
-    if st.button(f'{title} 시간 추가', key=f'add_{activity_type}'):
-        if st.session_state[f'new_{activity_type}_hours'] > 0:
-            st.session_state.data['activities'][date_key][activity_type].append({
-                'hours': st.session_state[f'new_{activity_type}_hours'],
-                'memo': memo,
-                'timestamp': datetime.now().strftime('%H:%M')
-            })
-            st.session_state[f'new_{activity_type}_hours'] = 0.0
-            st.rerun()
+    st.button(
+        f'{title} 시간 추가', key=f'add_{activity_type}',
+        on_click=add_activity_record, args=(date_key, activity_type)
+    )
 
     # 초기화 버튼
-    if st.button(f'오늘 {title} 기록 초기화', key=f'reset_{activity_type}'):
-        st.session_state.data['activities'][date_key][activity_type] = []
-        st.session_state[f'new_{activity_type}_hours'] = 0.0
-        st.rerun()
+    st.button(
+        f'오늘 {title} 기록 초기화', key=f'reset_{activity_type}',
+        on_click=reset_activity_records, args=(date_key, activity_type)
+    )
     
     return total_hours
 
-def render_checklist(selected_date):
-    """체크리스트 페이지 렌더링"""
-    
-    date_key = selected_date.strftime("%Y-%m-%d")
-    
-    # 스케줄 정의
-    schedules = {
-        'mwf': [
-            {'id': 'wake', 'label': '기상 시간 (6:00)', 'time': '6:00'},
-            {'id': 'sleep', 'label': '수면 시간 (7:00)', 'time': '7:00'},
-            {'id': 'class', 'label': '수업 (3:30)', 'time': '3:30'},
-            {'id': 'meal', 'label': '식사 및 휴식 (3:00↓)', 'time': '3:00'},
-            {'id': 'tkd', 'label': '태권도 (1:30↓)', 'time': '1:30'},
-            {'id': 'study', 'label': '학습 (8:00↑)', 'time': '8:00'},
-            {'id': 'screen', 'label': '수업 화면 녹화 확인', 'time': '-'},
-            {'id': 'focus', 'label': '전자기기 목적 외 사용 없음', 'time': '-'}
-        ],
-        'tt': [
-            {'id': 'wake', 'label': '기상 시간 (6:00)', 'time': '6:00'},
-            {'id': 'sleep', 'label': '수면 시간 (7:00)', 'time': '7:00'},
-            {'id': 'class', 'label': '수업 (3:30)', 'time': '3:30'},
-            {'id': 'meal', 'label': '식사 및 휴식 (3:00↓)', 'time': '3:00'},
-            {'id': 'study', 'label': '학습 (9:30↑)', 'time': '9:30'},
-            {'id': 'screen', 'label': '수업 화면 녹화 확인', 'time': '-'},
-            {'id': 'focus', 'label': '전자기기 목적 외 사용 없음', 'time': '-'}
-        ],
-        'saturday': [
-            {'id': 'wake', 'label': '기상 시간 (6:00)', 'time': '6:00'},
-            {'id': 'sleep', 'label': '수면 시간 (7:00)', 'time': '7:00'},
-            {'id': 'class', 'label': '수업 (10:30)', 'time': '10:30'},
-            {'id': 'meal', 'label': '식사 및 휴식 (3:30)', 'time': '3:30'},
-            {'id': 'study', 'label': '학습 (3:00)', 'time': '3:00'},
-            {'id': 'screen', 'label': '수업 화면 녹화 확인', 'time': '-'},
-            {'id': 'focus', 'label': '전자기기 목적 외 사용 없음', 'time': '-'}
-        ],
-        'sunday': [
-            {'id': 'wake', 'label': '기상 시간 (6:00)', 'time': '6:00'},
-            {'id': 'sleep', 'label': '수면 시간 (7:00)', 'time': '7:00'},
-            {'id': 'meal', 'label': '식사 및 휴식 (4:00)', 'time': '4:00'},
-            {'id': 'study', 'label': '학습 (11:00↑)', 'time': '11:00'},
-            {'id': 'focus', 'label': '전자기기 목적 외 사용 없음', 'time': '-'}
-        ]
-    }
-
-    target_study_hours = {
-        'mwf': 8,
-        'tt': 9.5,
-        'saturday': 3,
-        'sunday': 11
-    }
+def evaluate_study(study_hours, target_hours):
+    if study_hours >= target_hours:
+        return 'GOOD', 'green'
+    elif study_hours > 0:
+        return 'BAD', 'red'
+    return '미입력', 'gray'
+
+def evaluate_break(break_hours):
+    limits = get_schedule_book().break_limits
+    if break_hours > limits['emergency']:
+        return 'EMERGENCY', 'red'
+    elif break_hours > limits['warning']:
+        return 'WARNING', 'orange'
+    return 'NORMAL', 'green'
+
+@fragment
+def render_activity_panel(activity_type, date_key, title, target_hours=None):
+    """활동 기록과 평가 (이 안의 버튼은 이 섹션만 다시 실행)"""
+    section_col, evaluation_col = st.columns([3, 1])
+    with section_col:
+        st.subheader(f'{title} 시간 기록')
+        hours = render_activity_section(activity_type, date_key, title)
+    with evaluation_col:
+        st.markdown(f"##### {title} 평가")
+        if activity_type == 'study':
+            evaluation, color = evaluate_study(hours, target_hours)
+        else:
+            evaluation, color = evaluate_break(hours)
+        st.markdown(f":{color}[{evaluation}]")
 
-    day_type = get_day_type(selected_date)
-    current_schedule = schedules[day_type]
+    save_data(st.session_state.data)
+    finish_fragment()
 
-    # 체크리스트
+@fragment
+def render_checklist_items(date_key, schedule):
+    """체크리스트 (다른 섹션에 보이지 않으므로 체크 시 이 섹션만 다시 실행)"""
     st.subheader('오늘의 체크리스트')
     
-    if date_key not in st.session_state.data['checklist']:
-        st.session_state.data['checklist'][date_key] = {}
+    checked_items = st.session_state.data['checklist'].get(date_key, {})
 
-    for item in current_schedule:
+    for item in schedule:
         checked = st.checkbox(
             f"{item['label']} ({item['time']})",
             key=f"check_{date_key}_{item['id']}",
-            value=st.session_state.data['checklist'][date_key].get(item['id'], False)
+            value=checked_items.get(item['id'], False)
         )
-        st.session_state.data['checklist'][date_key][item['id']] = checked
-
-    # 학습 시간 섹션과 평가
-    study_col1, study_col2 = st.columns([3, 1])
-    with study_col1:
-        st.subheader('학습 시간 기록')
-        study_hours = render_activity_section('study', date_key, '학습')
-    with study_col2:
-        st.markdown("##### 학습 평가")
-        target_hours = target_study_hours[day_type]
-        if study_hours >= target_hours:
-            evaluation = 'GOOD'
-            color = 'green'
-        elif study_hours > 0:
-            evaluation = 'BAD'
-            color = 'red'
-        else:
-            evaluation = '미입력'
-            color = 'gray'
-        st.markdown(f":{color}[{evaluation}]")
+        set_checklist_item(st.session_state.data, date_key, item['id'], checked)
 
-    # 휴식 시간 섹션과 평가
-    break_col1, break_col2 = st.columns([3, 1])
-    with break_col1:
-        st.subheader('휴식 시간 기록')
-        break_hours = render_activity_section('break', date_key, '휴식')
-    with break_col2:
-        st.markdown("##### 휴식 평가")
-        if break_hours > 3:
-            evaluation = 'EMERGENCY'
-            color = 'red'
-        elif break_hours > 2.5:
-            evaluation = 'WARNING'
-            color = 'orange'
-        else:
-            evaluation = 'NORMAL'
-            color = 'green'
-        st.markdown(f":{color}[{evaluation}]")
+    save_data(st.session_state.data)
 
-    # 일일 총평
+@fragment
+def render_review(date_key):
+    """일일 총평"""
     st.subheader('오늘의 총평')
     
     review_content = st.session_state.data['reviews'].get(date_key, {}).get('content', '')
@@ -194,8 +156,27 @@ def render_checklist(selected_date):
         placeholder="오늘의 성과, 부족한 점, 내일의 계획 등을 기록해보세요."
     )
 
-    if daily_review:
-        st.session_state.data['reviews'][date_key] = {
-            'content': daily_review,
-            'timestamp': datetime.now().strftime('%H:%M')
-        }
+    if daily_review and daily_review != review_content:
+        set_review(st.session_state.data, date_key, daily_review, current_time())
+        # 캘린더의 총평 표시 갱신
+        request_app_rerun()
+
+    save_data(st.session_state.data)
+    finish_fragment()
+
+@profiled()
+def render_checklist(selected_date):
+    """체크리스트 페이지 렌더링"""
+    
+    date_key = selected_date.strftime("%Y-%m-%d")
+    
+    # 스케줄과 목표 시간은 설정 파일에서 한 번만 읽어 둔 표에서 조회
+    book = get_schedule_book()
+    day_type = get_day_type(selected_date)
+    day_spec = book.day_types[day_type]
+
+    # 섹션마다 독립적으로 다시 실행되는 프래그먼트
+    render_checklist_items(date_key, day_spec['items'])
+    render_activity_panel('study', date_key, '학습', day_spec['target_study_hours'])
+    render_activity_panel('break', date_key, '휴식')
+    render_review(date_key)
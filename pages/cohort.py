@@ -0,0 +1,48 @@
+import streamlit as st
+import pandas as pd
+from utils.cohort import get_cohort_stats
+from utils.profiling import profiled
+
+COHORT_COLUMNS = {
+    'user_id': '사용자',
+    'days': '기록 일수',
+    'study_total': '총 학습',
+    'study_avg': '평균 학습',
+    'rate': '달성률',
+    'current_streak': '현재 연속',
+    'longest_streak': '최장 연속',
+    'warning': 'WARNING',
+    'emergency': 'EMERGENCY',
+    'last_date': '마지막 기록'
+}
+
+@profiled()
+def render_cohort():
+    """전체 사용자 요약 (저장된 데이터 기준, 바뀐 사용자만 다시 집계)"""
+    st.markdown("### 코호트 분석")
+
+    summaries = pd.DataFrame(get_cohort_stats().summaries(), columns=list(COHORT_COLUMNS) + ['first_date', 'break_total'])
+    active = summaries[summaries['days'] > 0]
+    if active.empty:
+        st.warning("아직 저장된 사용자 데이터가 없습니다.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("사용자 수", f"{len(active)}명")
+    with col2:
+        st.metric("평균 학습 시간", f"{active['study_avg'].mean():.1f}시간")
+    with col3:
+        st.metric("평균 달성률", f"{active['rate'].mean() * 100:.0f}%")
+
+    st.bar_chart(active.set_index('user_id')[['study_avg']], use_container_width=True)
+
+    st.dataframe(
+        summaries[list(COHORT_COLUMNS)].rename(columns=COHORT_COLUMNS).style.format({
+            '총 학습': '{:.1f}시간',
+            '평균 학습': '{:.1f}시간',
+            '달성률': '{:.0%}'
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
@@ -0,0 +1,42 @@
+import streamlit as st
+import pandas as pd
+from utils.profiling import history_frame_rows, export_json, export_csv
+
+def format_bytes(nbytes):
+    if nbytes >= 1024 * 1024:
+        return f"{nbytes / 1024 / 1024:.1f} MB"
+    return f"{nbytes / 1024:.1f} KB"
+
+def render_profile_panel(history):
+    """사이드바 성능 계측 패널 (PROFILING=1 일 때)"""
+    with st.sidebar.expander('성능 계측', expanded=False):
+        if not history:
+            st.caption('아직 기록이 없습니다.')
+            return
+
+        last = history[-1]
+        st.metric('마지막 rerun', f"{last['total'] * 1000:.0f} ms")
+        st.caption(
+            f"요소 {last['elements']}개 · 전송 {format_bytes(last['payload_bytes'])} · "
+            f"읽기 {format_bytes(last['bytes_read'])} · 쓰기 {format_bytes(last['bytes_written'])}"
+        )
+
+        # 구간별 시간 (ms)
+        st.dataframe(
+            pd.DataFrame(
+                [
+                    (name, seconds * 1000, last['calls'][name])
+                    for name, seconds in sorted(last['timings'].items(), key=lambda item: -item[1])
+                ],
+                columns=['구간', 'ms', '호출']
+            ),
+            hide_index=True,
+            use_container_width=True
+        )
+
+        # 최근 rerun 추이
+        history_df = pd.DataFrame(history_frame_rows(history))
+        st.line_chart(history_df['total'], use_container_width=True)
+
+        st.download_button('JSON 내보내기', export_json(history), 'profile.json', 'application/json')
+        st.download_button('CSV 내보내기', export_csv(history), 'profile.csv', 'text/csv')
@@ -0,0 +1,41 @@
+import streamlit as st
+from datetime import date
+from utils.data_manager import search_records
+
+FIELD_LABELS = {
+    'memo': '메모',
+    'review': '총평'
+}
+
+# 사이드바에 보여 줄 최대 결과 수
+RESULT_LIMIT = 20
+SNIPPET_LENGTH = 40
+
+def go_to_date(date_key):
+    """결과 버튼: 해당 날짜의 체크리스트로 이동"""
+    st.session_state.selected_date = date.fromisoformat(date_key)
+
+def snippet(text):
+    text = ' '.join(text.split())
+    return text if len(text) <= SNIPPET_LENGTH else text[:SNIPPET_LENGTH] + '…'
+
+def render_search():
+    """사이드바 메모/총평 검색"""
+    query = st.text_input('기록 검색', key='search_query', placeholder='메모나 총평의 단어')
+    if not query.strip():
+        return
+
+    results = search_records(st.session_state.data, query, RESULT_LIMIT)
+    if not results:
+        st.caption('검색 결과가 없습니다.')
+        return
+
+    st.caption(f'{len(results)}일' + (' (최근 순 일부)' if len(results) == RESULT_LIMIT else ''))
+    for result in results:
+        st.button(
+            result['date'], key=f"search_{result['date']}",
+            on_click=go_to_date, args=(result['date'],),
+            use_container_width=True
+        )
+        for field in result['fields']:
+            st.caption(f"{FIELD_LABELS[field]}: {snippet(result['snippets'][field])}")
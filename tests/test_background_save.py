@@ -0,0 +1,76 @@
+"""백그라운드 저장이 공유 저장소 잠금 밖에서 쓰고, 그 사이의 변경을 잃지 않는지 확인"""
+import threading
+
+import pytest
+
+from utils import data_manager
+from utils.data_manager import add_activity, load_data, set_checklist_item
+from utils.shared_store import SharedStore
+from utils.writer import BackgroundWriter
+
+DATE = '2024-03-05'
+
+
+@pytest.fixture(params=['csv', 'partitioned', 'sqlite', 'journal'])
+def store(request, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(data_manager, 'STORAGE_MODE', request.param)
+    (tmp_path / 'data').mkdir()
+    yield SharedStore(load_data())
+    for journal in data_manager._journals.values():
+        journal.close()
+    data_manager._journals.clear()
+
+
+def test_edits_during_write_stay_dirty(store, monkeypatch):
+    add_activity(store, DATE, 'study', 1.0, '저장 중', '08:00')
+    write_changes = data_manager._write_changes
+
+    def write_while_editing(data):
+        # 다른 스레드가 잠금을 기다리지 않고 변경할 수 있어야 함
+        editor = threading.Thread(target=lambda: (
+            add_activity(store, DATE, 'study', 2.0, '저장 후', '09:00'),
+            set_checklist_item(store, DATE, 'wake', True)
+        ))
+        editor.start()
+        editor.join(timeout=5)
+        assert not editor.is_alive()
+        return write_changes(data)
+
+    monkeypatch.setattr(data_manager, '_write_changes', write_while_editing)
+    data_manager._save_now(store)
+
+    current = store.current
+    memos = [record['memo'] for record in current['activities'][DATE]['study']]
+    assert memos == ['저장 중', '저장 후']
+    assert current['activities'].dirty == {DATE}
+    assert current['checklist'].dirty == {DATE}
+
+    monkeypatch.setattr(data_manager, '_write_changes', write_changes)
+    data_manager._save_now(store)
+    assert not store.current.is_dirty()
+    reloaded = load_data()
+    assert [record['memo'] for record in reloaded['activities'][DATE]['study']] == ['저장 중', '저장 후']
+    assert reloaded['checklist'][DATE] == {'wake': True}
+
+
+def test_error_clears_after_successful_write():
+    failures = [OSError('디스크 가득 참')]
+
+    def persist(target):
+        if failures:
+            raise failures.pop()
+
+    writer = BackgroundWriter(persist, interval=0.01)
+    try:
+        writer.submit('a')
+        assert writer.flush(timeout=5)
+        assert writer.health()['last_error'] == 'OSError: 디스크 가득 참'
+
+        writer.submit('a')
+        assert writer.flush(timeout=5)
+        health = writer.health()
+        assert health['last_error'] is None
+        assert health['errors'] == 1
+    finally:
+        writer.stop()
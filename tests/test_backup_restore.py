@@ -0,0 +1,71 @@
+"""스냅샷 이후 생긴 파일이 복원 결과에 다시 적용되지 않는지 확인"""
+import pytest
+
+from utils import backup, data_manager
+from utils.data_manager import add_activity, load_data, save_data
+
+DATE = '2024-03-05'
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    yield
+    for journal in data_manager._journals.values():
+        journal.close()
+    data_manager._journals.clear()
+
+
+def _memos(data):
+    return [record['memo'] for record in data['activities'].get(DATE, {'study': []})['study']]
+
+
+def test_restore_after_journal_writes(workdir, tmp_path, monkeypatch):
+    monkeypatch.setattr(data_manager, 'STORAGE_MODE', 'journal')
+    data = load_data()
+    add_activity(data, DATE, 'study', 1.0, '백업 전', '08:00')
+    save_data(data)
+    data_manager.compact_data(data)
+    name = backup.create_snapshot()
+
+    add_activity(data, DATE, 'study', 2.0, '백업 후', '09:00')
+    save_data(data)
+    assert (tmp_path / 'data' / 'journal.jsonl').stat().st_size > 0
+    assert _memos(load_data()) == ['백업 전', '백업 후']
+
+    backup.restore_snapshot(name)
+    assert _memos(load_data()) == ['백업 전']
+
+
+def test_files_created_after_snapshot_are_quarantined(workdir, tmp_path, monkeypatch):
+    monkeypatch.setattr(data_manager, 'STORAGE_MODE', 'partitioned')
+    data = load_data()
+    add_activity(data, DATE, 'study', 1.0, '백업 전', '08:00')
+    save_data(data)
+    name = backup.create_snapshot()
+
+    add_activity(data, '2024-04-01', 'study', 2.0, '백업 후', '09:00')
+    save_data(data)
+
+    restored, moved = backup.restore_snapshot(name)
+    assert moved == ['months/2024-04/activities.csv']
+    assert not list((tmp_path / 'data').rglob('*2024-04*'))
+    assert list((tmp_path / 'backup' / 'quarantine').rglob('*2024-04*'))
+    assert load_data()['activities'].get('2024-04-01') is None
+
+
+def test_corrupt_snapshot_leaves_data_untouched(workdir, tmp_path, monkeypatch):
+    monkeypatch.setattr(data_manager, 'STORAGE_MODE', 'journal')
+    data = load_data()
+    add_activity(data, DATE, 'study', 1.0, '백업 전', '08:00')
+    save_data(data)
+    name = backup.create_snapshot()
+    for path in (tmp_path / 'backup' / 'objects').rglob('*'):
+        if path.is_file():
+            path.write_bytes(b'broken')
+
+    before = sorted(path.name for path in (tmp_path / 'data').iterdir())
+    with pytest.raises(ValueError):
+        backup.restore_snapshot(name)
+    assert sorted(path.name for path in (tmp_path / 'data').iterdir()) == before
@@ -0,0 +1,37 @@
+"""가져오기 날짜/시간 열 정리 확인"""
+import pandas as pd
+
+from utils.bulk_io import normalize_chunk
+
+
+def test_mixed_timezone_offsets_keep_written_date_and_time():
+    raw = pd.DataFrame({
+        'date': [
+            '2024-01-01T23:30+09:00', '2024-01-02T10:00-05:00', '2024-01-03',
+            '2024-01-04 08:15Z', '2024-01-05T07:00:30+0900', '어제'
+        ],
+        'activity_type': ['study'] * 6,
+        'hours': [1] * 6
+    })
+    frame, errors, invalid = normalize_chunk(raw, 2)
+
+    assert frame['date'].tolist() == ['2024-01-01', '2024-01-02', '2024-01-04', '2024-01-05']
+    assert frame['timestamp'].tolist() == ['23:30', '10:00', '08:15', '07:00']
+    # 시각이 없는 날짜와 읽을 수 없는 날짜는 행 오류
+    assert invalid == 2
+    assert errors == [(7, '날짜를 읽을 수 없습니다'), (4, '기록 시각(HH:MM)이 없습니다')]
+
+
+def test_minutes_fill_rows_without_hours():
+    # JSON Lines에서 레코드마다 hours 또는 minutes만 적힌 경우
+    raw = pd.DataFrame([
+        {'date': '2024-01-01T09:00', 'activity_type': 'study', 'hours': 1.5},
+        {'date': '2024-01-01T11:00', 'activity_type': 'study', 'minutes': 30},
+        {'date': '2024-01-01T13:00', 'activity_type': 'break', 'hours': '', 'minutes': '90'},
+        {'date': '2024-01-01T15:00', 'activity_type': 'break'}
+    ])
+    frame, errors, invalid = normalize_chunk(raw, 2)
+
+    assert frame['hours'].tolist() == [1.5, 0.5, 1.5]
+    assert invalid == 1
+    assert errors == [(5, '시간은 0보다 크고 24 이하여야 합니다')]
@@ -0,0 +1,40 @@
+"""달력 렌더 캐시 키가 월 요약을 만들지 않고도 데이터 변경을 구분하는지 확인"""
+import pytest
+
+from utils import data_manager
+from utils.data_manager import add_activity, get_calendar_index, load_data, save_data
+
+
+@pytest.fixture(params=['csv', 'partitioned'])
+def storage(request, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(data_manager, 'STORAGE_MODE', request.param)
+    (tmp_path / 'data').mkdir()
+    data = load_data()
+    add_activity(data, '2024-03-05', 'study', 1.0, '수학', '09:00')
+    add_activity(data, '2024-04-01', 'study', 1.0, '영어', '09:00')
+    save_data(data)
+    return request.param
+
+
+def test_month_version_tracks_changes(storage):
+    data = load_data()
+    index = get_calendar_index(data)
+    march = index.month_version(2024, 3)
+    april = index.month_version(2024, 4)
+    if storage == 'partitioned':
+        # 파티션을 읽거나 요약을 만들지 않고 파일 버전으로 구분
+        assert not data['activities'].loaded_months
+        assert not index.months
+
+    # 월을 읽어 와도 내용이 같으면 버전은 그대로, 다시 읽은 데이터에서도 같음
+    index.month(2024, 3)
+    assert index.month_version(2024, 3) == march
+    assert get_calendar_index(load_data()).month_version(2024, 3) == march
+
+    add_activity(data, '2024-03-06', 'study', 2.0, '국어', '10:00')
+    changed = index.month_version(2024, 3)
+    assert changed != march
+    assert index.month_version(2024, 4) == april
+    add_activity(data, '2024-03-06', 'study', 0.5, '국어', '11:00')
+    assert index.month_version(2024, 3) not in (march, changed)
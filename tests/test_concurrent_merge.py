@@ -0,0 +1,60 @@
+"""같은 날짜를 두 세션이 따로 바꿔도 양쪽 변경이 모두 남는지 확인"""
+import pytest
+
+from utils import data_manager
+from utils.data_manager import add_activity, load_data, save_data, set_checklist_item
+
+DATE = '2024-03-05'
+
+
+@pytest.fixture(params=['csv', 'journal', 'partitioned', 'arrow', 'sqlite'])
+def storage(request, tmp_path, monkeypatch):
+    if request.param == 'arrow':
+        pytest.importorskip('pyarrow')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(data_manager, 'STORAGE_MODE', request.param)
+    (tmp_path / 'data').mkdir()
+    yield request.param
+    for journal in data_manager._journals.values():
+        journal.close()
+    data_manager._journals.clear()
+
+
+def test_both_sessions_keep_their_edits(storage):
+    first = load_data()
+    add_activity(first, DATE, 'study', 1.0, '공통', '08:00')
+    save_data(first)
+
+    mine, theirs = load_data(), load_data()
+    add_activity(mine, DATE, 'study', 2.0, '수학', '09:00')
+    set_checklist_item(mine, DATE, 'wake', True)
+    add_activity(theirs, DATE, 'study', 1.5, '영어', '10:00')
+    add_activity(theirs, DATE, 'break', 0.5, '산책', '10:30')
+    set_checklist_item(theirs, DATE, 'lunch', True)
+    save_data(theirs)
+    save_data(mine)
+    if storage == 'journal':
+        # 저널 모드에서 다른 세션의 변경은 압축할 때 메모리에 반영됨
+        data_manager.compact_data(mine)
+
+    for data in (load_data(), mine):
+        day = data['activities'][DATE]
+        assert sorted(record['memo'] for record in day['study']) == ['공통', '수학', '영어']
+        assert [record['memo'] for record in day['break']] == ['산책']
+        assert data['checklist'][DATE] == {'wake': True, 'lunch': True}
+    assert not mine.is_dirty()
+
+
+def test_removal_is_merged(storage):
+    first = load_data()
+    add_activity(first, DATE, 'study', 1.0, '공통', '08:00')
+    save_data(first)
+
+    mine, theirs = load_data(), load_data()
+    data_manager.reset_activities(mine, DATE, 'study')
+    add_activity(theirs, DATE, 'study', 1.5, '영어', '10:00')
+    save_data(theirs)
+    save_data(mine)
+
+    day = load_data()['activities'][DATE]
+    assert [record['memo'] for record in day['study']] == ['영어']
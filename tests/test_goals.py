@@ -0,0 +1,47 @@
+"""목표 분석의 체크리스트 비율이 스케줄에 있던 날을 분모로 세는지 확인"""
+from utils.activity_store import DailyTotals
+from utils.goals import CHECKLIST_COLUMNS, build_report, checklist_frame
+from utils.schedule import ScheduleBook
+
+ITEM = {'label': '', 'time': '-'}
+BOOK = ScheduleBook({
+    'weekdays': {'mon': 'weekday', 'tue': 'weekday', 'wed': 'weekday', 'thu': 'weekday',
+                 'fri': 'weekday', 'sat': 'weekend', 'sun': 'weekend'},
+    'day_types': {
+        'weekday': {'target_study_hours': 2, 'items': [{'id': 'wake', **ITEM}, {'id': 'tkd', **ITEM}]},
+        'weekend': {'target_study_hours': 1, 'items': [{'id': 'wake', **ITEM}]}
+    }
+})
+
+
+def test_checklist_frame_columns():
+    frame = checklist_frame({'2024-03-04': {'wake': True, 'tkd': False}})
+    assert list(frame.columns) == CHECKLIST_COLUMNS
+    assert frame['checked'].tolist() == [True, False]
+    assert list(checklist_frame({}).columns) == CHECKLIST_COLUMNS
+
+
+def test_completion_counts_scheduled_days():
+    # 활동은 월(3/4)~금(3/8), 체크리스트는 토(3/9)까지 기록됨
+    totals = DailyTotals.from_rows([('2024-03-04', 1.0, 0.0), ('2024-03-08', 2.0, 0.0)])
+    checklist = checklist_frame({
+        '2024-03-04': {'wake': True},
+        '2024-03-05': {'tkd': True},
+        # 열어 보기만 하고 해제한 날은 분모에 영향 없음
+        '2024-03-06': {'wake': False},
+        # 토요일에는 tkd가 스케줄에 없으므로 세지 않음
+        '2024-03-09': {'wake': True, 'tkd': True}
+    })
+
+    result = build_report(totals, checklist, BOOK)['checklist'].set_index('item_id')
+
+    assert result.loc['wake', 'days'] == 6
+    assert result.loc['wake', 'checked'] == 2
+    assert result.loc['tkd', 'days'] == 5
+    assert result.loc['tkd', 'checked'] == 1
+    assert result.loc['tkd', 'ratio'] == 0.2
+
+
+def test_completion_without_records_is_empty():
+    result = build_report(DailyTotals.from_rows([]), checklist_frame({}), BOOK)['checklist']
+    assert result.empty
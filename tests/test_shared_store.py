@@ -0,0 +1,55 @@
+"""공유 저장소의 변경이 이전 스냅샷을 바꾸지 않고, 건드리지 않은 섹션/파생 데이터는 복사하지 않는지 확인"""
+import pytest
+
+from utils import data_manager
+from utils.data_manager import (
+    add_activity, get_aggregates, load_data, save_data, search_records, set_checklist_item
+)
+from utils.shared_store import SharedStore
+
+DATE = '2024-03-05'
+
+
+@pytest.fixture(params=['csv', 'partitioned'])
+def store(request, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(data_manager, 'STORAGE_MODE', request.param)
+    (tmp_path / 'data').mkdir()
+    data = load_data()
+    add_activity(data, DATE, 'study', 1.0, '수학 문제', '08:00')
+    add_activity(data, '2024-04-01', 'study', 2.0, '영어 단어', '09:00')
+    save_data(data)
+    store = SharedStore(load_data())
+    # 파생 데이터를 미리 만들어 둠
+    get_aggregates(store)
+    search_records(store, '수학')
+    return store
+
+
+def test_update_leaves_previous_snapshot_unchanged(store):
+    before = store.current
+    add_activity(store, DATE, 'study', 0.5, '물리 정리', '10:00')
+    after = store.current
+
+    assert len(before['activities'][DATE]['study']) == 1
+    assert len(after['activities'][DATE]['study']) == 2
+    assert get_aggregates(before).daily[DATE]['study'] == 1.0
+    assert get_aggregates(after).daily[DATE]['study'] == 1.5
+    assert search_records(before, '물리') == []
+    assert [hit['date'] for hit in search_records(after, '물리')] == [DATE]
+    # 다른 월의 색인은 두 스냅샷이 그대로 찾음
+    assert [hit['date'] for hit in search_records(before, '영어')] == ['2024-04-01']
+    assert [hit['date'] for hit in search_records(after, '영어')] == ['2024-04-01']
+
+
+def test_checklist_update_does_not_copy_activity_views(store):
+    before = store.current
+    set_checklist_item(store, DATE, 'wake', True)
+    after = store.current
+
+    assert after.views['aggregates'] is before.views['aggregates']
+    assert after.views['search_index'] is before.views['search_index']
+    if data_manager.STORAGE_MODE == 'csv':
+        assert after['activities'] is before['activities']
+    assert before['checklist'].get(DATE) is None
+    assert after['checklist'][DATE] == {'wake': True}
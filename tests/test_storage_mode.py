@@ -0,0 +1,23 @@
+"""저장 방식을 고를 때 잘못된 이름이나 빠진 패키지를 바로 알리는지 확인"""
+import pytest
+
+from utils import columnar
+from utils.data_manager import STORAGE_MODES, check_storage_mode
+
+
+@pytest.mark.parametrize('mode', STORAGE_MODES)
+def test_known_modes(mode):
+    if mode == 'arrow':
+        pytest.importorskip('pyarrow')
+    assert check_storage_mode(mode) == mode
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError, match='STORAGE_MODE'):
+        check_storage_mode('parquet')
+
+
+def test_arrow_without_pyarrow(monkeypatch):
+    monkeypatch.setattr(columnar, 'pa', None)
+    with pytest.raises(RuntimeError, match='pyarrow'):
+        check_storage_mode('arrow')
@@ -0,0 +1,35 @@
+"""날짜별/월별 합계가 아직 압축되지 않은 변경 로그까지 반영하는지 확인"""
+import pytest
+
+from utils import data_manager
+from utils.data_manager import (
+    add_activity, daily_summary, iter_activity_chunks, load_data, monthly_summary, save_data
+)
+
+
+@pytest.fixture(params=['csv', 'journal', 'partitioned', 'sqlite'])
+def storage(request, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(data_manager, 'STORAGE_MODE', request.param)
+    (tmp_path / 'data').mkdir()
+    yield request.param
+    for journal in data_manager._journals.values():
+        journal.close()
+    data_manager._journals.clear()
+
+
+def test_daily_and_monthly_summaries_agree(storage):
+    data = load_data()
+    add_activity(data, '2024-03-05', 'study', 2.0, '수학', '09:00')
+    add_activity(data, '2024-03-06', 'break', 0.5, '산책', '10:00')
+    add_activity(data, '2024-04-01', 'study', 1.5, '영어', '11:00')
+    save_data(data)
+
+    daily = daily_summary()
+    assert daily['date'].dt.strftime('%Y-%m-%d').tolist() == ['2024-03-05', '2024-03-06', '2024-04-01']
+    monthly = monthly_summary()
+    assert monthly.values.tolist() == [['2024-03', 2.0, 0.5], ['2024-04', 1.5, 0.0]]
+    assert monthly['study'].sum() == daily['study'].sum()
+
+    rows = sum(len(chunk) for chunk in iter_activity_chunks(chunksize=2))
+    assert rows == 3
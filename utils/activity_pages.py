@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+
+COLUMNS = ['date', 'activity_type', 'hours', 'memo', 'timestamp']
+
+
+class ActivityPager:
+    """상세 데이터 탭용 페이지 조회 (최신 날짜부터)
+
+    날짜 목록과 누적 행 수만 유지하고, 요청한 구간의 행만 만든다.
+    날짜별 기록 수가 바뀌면 목록을 버리고 다음 조회 때 다시 만든다.
+
+    read_counts(data)를 주면 날짜별 기록 수를 섹션 전체 대신 그 결과
+    [(날짜, 기록 수), ...]로 구한다 (지연 로딩 섹션을 모두 읽지 않도록).
+    """
+
+    SECTIONS = ('activities',)
+
+    def __init__(self, data, read_counts=None):
+        self.data = data
+        self.read_counts = read_counts
+        self._index = None
+        self._counts = None
+
+    def copy(self, data):
+        new = ActivityPager(data, self.read_counts)
+        new._index = self._index
+        new._counts = self._counts
+        return new
+
+    def on_change(self, section, key, old, new):
+        if section != 'activities' or self._counts is None:
+            return
+        # 메모만 바뀌었거나 이미 센 월을 나중에 읽어 온 경우는 목록이 그대로
+        count = 0 if new is None else len(new['study']) + len(new['break'])
+        if self._counts.get(key, 0) != count:
+            self._index = None
+            self._counts = None
+
+    def _build(self):
+        if self.read_counts is not None:
+            counts = {date: count for date, count in self.read_counts(self.data) if count}
+        else:
+            counts = {
+                date: len(day['study']) + len(day['break'])
+                for date, day in self.data['activities'].items()
+            }
+        dates = sorted(counts, reverse=True)
+        self._counts = counts
+        return dates, np.cumsum(np.fromiter((counts[date] for date in dates), dtype=np.int64, count=len(dates)))
+
+    def _get_index(self):
+        if self._index is None:
+            self._index = self._build()
+        return self._index
+
+    def total_rows(self):
+        _, cumulative = self._get_index()
+        return int(cumulative[-1]) if len(cumulative) else 0
+
+    def iter_rows(self, start=0, stop=None):
+        """start~stop 행을 (date, activity_type, hours, memo, timestamp)로 순회"""
+        dates, cumulative = self._get_index()
+        stop = self.total_rows() if stop is None else min(stop, self.total_rows())
+        # start 행이 들어 있는 날짜부터 시작
+        position = int(np.searchsorted(cumulative, start, side='right'))
+        skip = start - (int(cumulative[position - 1]) if position else 0)
+        remaining = stop - start
+        activities = self.data['activities']
+        while remaining > 0 and position < len(dates):
+            date = dates[position]
+            day = activities[date]
+            for activity_type in ('study', 'break'):
+                records = day[activity_type]
+                if skip >= len(records):
+                    skip -= len(records)
+                    continue
+                for record in records[skip:skip + remaining]:
+                    yield date, activity_type, record['hours'], record['memo'], record['timestamp']
+                    remaining -= 1
+                skip = 0
+                if remaining <= 0:
+                    break
+            position += 1
+
+    def page(self, page, page_size):
+        """0부터 시작하는 page번째 페이지의 DataFrame"""
+        start = page * page_size
+        return pd.DataFrame(list(self.iter_rows(start, start + page_size)), columns=COLUMNS)
+
+    def iter_frames(self, chunk_rows):
+        """전체 기록을 chunk_rows행씩 DataFrame으로 순회 (내보내기용)"""
+        for start in range(0, self.total_rows(), chunk_rows):
+            yield pd.DataFrame(list(self.iter_rows(start, start + chunk_rows)), columns=COLUMNS)
@@ -0,0 +1,194 @@
+"""메모리 절약형 활동 기록
+
+기록마다 {'hours', 'memo', 'timestamp'} dict를 두는 대신 __slots__ 객체를 쓰고,
+반복되는 메모/시각 문자열은 하나의 객체로 공유한다. 기존 코드의
+day['study'], record['hours'] 같은 접근 방식은 그대로 쓸 수 있다.
+"""
+import sys
+from collections.abc import Mapping
+from datetime import date as date_cls
+
+import numpy as np
+
+ACTIVITY_TYPES = ('study', 'break')
+
+# date.toordinal() 기준 1970-01-01 (numpy datetime64로 변환할 때 사용)
+EPOCH_ORDINAL = date_cls(1970, 1, 1).toordinal()
+
+
+# 0.5시간 단위라 값 종류가 적은 시간도 같은 float 객체를 공유
+_hours_table = {}
+
+
+def intern_text(text):
+    """같은 내용의 메모/시각 문자열은 한 객체만 메모리에 유지"""
+    return sys.intern(str(text))
+
+
+def intern_hours(hours):
+    hours = float(hours)
+    return _hours_table.setdefault(hours, hours)
+
+
+class ActivityRecord:
+    """활동 기록 하나 (record['hours'] 형태의 읽기 접근 지원)"""
+
+    __slots__ = ('hours', 'memo', 'timestamp')
+
+    def __init__(self, hours, memo, timestamp):
+        self.hours = intern_hours(hours)
+        self.memo = intern_text(memo)
+        self.timestamp = intern_text(timestamp)
+
+    @classmethod
+    def of(cls, record):
+        if isinstance(record, cls):
+            return record
+        return cls(record['hours'], record['memo'], record['timestamp'])
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def keys(self):
+        return self.__slots__
+
+    def to_dict(self):
+        return {'hours': self.hours, 'memo': self.memo, 'timestamp': self.timestamp}
+
+    def __eq__(self, other):
+        if isinstance(other, ActivityRecord):
+            return (self.hours, self.memo, self.timestamp) == (other.hours, other.memo, other.timestamp)
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'ActivityRecord({self.hours!r}, {self.memo!r}, {self.timestamp!r})'
+
+
+class ActivityDay(Mapping):
+    """하루치 학습/휴식 기록 (불변, 합계는 생성할 때 한 번 계산)
+
+    day['study'], day['break']는 ActivityRecord 튜플이다. 바꿀 때는
+    replace()로 새 객체를 만든다.
+    """
+
+    __slots__ = ('study', 'rest', 'study_total', 'break_total')
+
+    def __init__(self, study=(), rest=()):
+        self.study = tuple(ActivityRecord.of(record) for record in study)
+        self.rest = tuple(ActivityRecord.of(record) for record in rest)
+        self.study_total = sum(record.hours for record in self.study)
+        self.break_total = sum(record.hours for record in self.rest)
+
+    def __getitem__(self, key):
+        if key == 'study':
+            return self.study
+        if key == 'break':
+            return self.rest
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(ACTIVITY_TYPES)
+
+    def __len__(self):
+        return len(ACTIVITY_TYPES)
+
+    def total(self, activity_type):
+        return self.study_total if activity_type == 'study' else self.break_total
+
+    def is_empty(self):
+        return not (self.study or self.rest)
+
+    def replace(self, activity_type, records):
+        if activity_type == 'study':
+            return ActivityDay(records, self.rest)
+        return ActivityDay(self.study, records)
+
+    def to_dict(self):
+        return {
+            activity_type: [record.to_dict() for record in self[activity_type]]
+            for activity_type in ACTIVITY_TYPES
+        }
+
+    def __eq__(self, other):
+        if isinstance(other, ActivityDay):
+            return self.study == other.study and self.rest == other.rest
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'ActivityDay(study={list(self.study)!r}, break={list(self.rest)!r})'
+
+
+EMPTY_DAY = ActivityDay()
+
+
+def compact_day(day):
+    """{'study': [...], 'break': [...]} 형태를 ActivityDay로 변환 (없으면 빈 날)"""
+    if isinstance(day, ActivityDay):
+        return day
+    if not day:
+        return EMPTY_DAY
+    return ActivityDay(day.get('study', ()), day.get('break', ()))
+
+
+class DailyTotals:
+    """날짜 서수 순으로 정렬한 하루 합계 배열
+
+    날짜별 합계와 구간 합계를 Python 루프 없이 NumPy 연산으로 구한다.
+    """
+
+    def __init__(self, ordinals, study, rest):
+        self.ordinals = ordinals
+        self.study = study
+        self.rest = rest
+
+    @classmethod
+    def from_rows(cls, rows):
+        """(date, study, break) 행 목록으로 생성"""
+        rows = sorted(rows)
+        return cls(
+            np.fromiter((date_cls.fromisoformat(row[0]).toordinal() for row in rows), dtype=np.int32, count=len(rows)),
+            np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows)),
+            np.fromiter((row[2] for row in rows), dtype=np.float64, count=len(rows))
+        )
+
+    def __len__(self):
+        return len(self.ordinals)
+
+    def dates(self):
+        """numpy datetime64[D] 배열"""
+        return (self.ordinals - EPOCH_ORDINAL).astype('datetime64[D]')
+
+    def _bounds(self, start, end):
+        lo = np.searchsorted(self.ordinals, _ordinal(start), side='left') if start is not None else 0
+        hi = np.searchsorted(self.ordinals, _ordinal(end), side='right') if end is not None else len(self.ordinals)
+        return lo, hi
+
+    def per_day(self, start=None, end=None):
+        """start~end(포함) 구간의 (날짜 배열, 학습 배열, 휴식 배열)"""
+        lo, hi = self._bounds(start, end)
+        return self.dates()[lo:hi], self.study[lo:hi], self.rest[lo:hi]
+
+    def range_totals(self, start=None, end=None):
+        """start~end(포함) 구간의 학습/휴식 합계"""
+        lo, hi = self._bounds(start, end)
+        return {
+            'study': float(self.study[lo:hi].sum()),
+            'break': float(self.rest[lo:hi].sum())
+        }
+
+
+def _ordinal(value):
+    if isinstance(value, str):
+        value = date_cls.fromisoformat(value)
+    return value.toordinal()
@@ -0,0 +1,110 @@
+import pandas as pd
+
+from utils.activity_store import ActivityDay, DailyTotals
+
+
+def day_totals(day):
+    """하루치 {'study': [...], 'break': [...]}의 시간 합계 (기록이 없으면 None)"""
+    if isinstance(day, ActivityDay):
+        # 합계는 ActivityDay를 만들 때 이미 계산됨
+        return None if day.is_empty() else {'study': day.study_total, 'break': day.break_total}
+    if not day or not (day.get('study') or day.get('break')):
+        return None
+    return {
+        'study': sum(record['hours'] for record in day.get('study', [])),
+        'break': sum(record['hours'] for record in day.get('break', []))
+    }
+
+
+class ActivityAggregates:
+    """날짜별/월별 학습·휴식 합계와 학습 일수를 증분으로 유지"""
+
+    SECTIONS = ('activities',)
+
+    def __init__(self):
+        self.daily = {}
+        self.monthly = {}
+        self._frames = {}
+
+    @classmethod
+    def from_activities(cls, activities):
+        aggregates = cls()
+        for date, day in activities.items():
+            aggregates._set_day(date, day_totals(day))
+        return aggregates
+
+    @classmethod
+    def from_daily_rows(cls, rows):
+        """(date, study, break) 행 목록으로 생성"""
+        aggregates = cls()
+        for date, study, break_ in rows:
+            aggregates._set_day(date, {'study': study, 'break': break_})
+        return aggregates
+
+    def copy(self, data=None):
+        new = ActivityAggregates()
+        new.daily = dict(self.daily)
+        # 월 합계 dict는 바꿀 때 새로 만들므로 복사본끼리 함께 써도 됨
+        new.monthly = dict(self.monthly)
+        new._frames = dict(self._frames)
+        return new
+
+    def _set_day(self, date, totals):
+        self._frames = {}
+        month_key = date[:7]
+        month = dict(self.monthly.get(month_key) or {'study': 0.0, 'break': 0.0, 'days': 0, 'study_days': 0})
+        old = self.daily.pop(date, None)
+        if old is not None:
+            month['study'] -= old['study']
+            month['break'] -= old['break']
+            month['days'] -= 1
+            month['study_days'] -= old['study'] > 0
+        if totals is not None:
+            self.daily[date] = totals
+            month['study'] += totals['study']
+            month['break'] += totals['break']
+            month['days'] += 1
+            month['study_days'] += totals['study'] > 0
+        if month['days'] == 0:
+            self.monthly.pop(month_key, None)
+        else:
+            self.monthly[month_key] = month
+
+    def on_change(self, section, key, old, new):
+        if section == 'activities':
+            self._set_day(key, day_totals(new))
+
+    def daily_totals(self):
+        """날짜순 합계 배열 (구간 합계용)"""
+        if 'totals' not in self._frames:
+            self._frames['totals'] = DailyTotals.from_rows(
+                (date, totals['study'], totals['break']) for date, totals in self.daily.items()
+            )
+        return self._frames['totals']
+
+    def daily_frame(self):
+        if 'daily' not in self._frames:
+            dates, study, rest = self.daily_totals().per_day()
+            self._frames['daily'] = pd.DataFrame({
+                'date': pd.to_datetime(dates),
+                'study': study,
+                'break': rest
+            })
+        return self._frames['daily']
+
+    def monthly_frame(self):
+        if 'monthly' not in self._frames:
+            self._frames['monthly'] = pd.DataFrame(
+                [(month, totals['study'], totals['break']) for month, totals in self.monthly.items()],
+                columns=['month', 'study', 'break']
+            ).sort_values('month')
+        return self._frames['monthly']
+
+    def average(self, activity_type):
+        """기록이 있는 날 기준 하루 평균 시간"""
+        days = sum(totals['days'] for totals in self.monthly.values())
+        total = sum(totals[activity_type] for totals in self.monthly.values())
+        return total / days if days else 0.0
+
+    def study_days(self):
+        return sum(totals['study_days'] for totals in self.monthly.values())
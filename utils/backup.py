@@ -0,0 +1,234 @@
+"""내용 주소 기반 증분 백업
+
+data/ 아래 파일을 줄 단위 청크로 나누고, 각 청크를 SHA-256 이름으로
+backup/objects/에 한 번만 저장한다. 스냅샷(backup/snapshots/*.json)은
+파일별 청크 목록만 기록하므로 바뀐 청크만 새로 쌓인다.
+
+    python -m utils.backup create
+    python -m utils.backup list
+    python -m utils.backup restore <스냅샷 이름>
+    python -m utils.backup prune --keep 10
+"""
+import argparse
+import hashlib
+import json
+import os
+import zlib
+from datetime import datetime
+
+from utils.safe_io import atomic_write
+
+DATA_DIR = 'data'
+BACKUP_DIR = 'backup'
+
+# 청크 경계: 줄의 crc32 하위 8비트가 0인 줄 뒤 (평균 256줄), 최대 1MB
+CHUNK_MASK = 0xFF
+MAX_CHUNK_SIZE = 1 << 20
+
+# 잠금/임시 파일과 SQLite 보조 파일은 백업하지 않음
+SKIP_SUFFIXES = ('.lock', '-wal', '-shm')
+
+
+def objects_dir(backup_dir=BACKUP_DIR):
+    return os.path.join(backup_dir, 'objects')
+
+
+def snapshots_dir(backup_dir=BACKUP_DIR):
+    return os.path.join(backup_dir, 'snapshots')
+
+
+def _object_path(digest, backup_dir):
+    return os.path.join(objects_dir(backup_dir), digest[:2], digest)
+
+
+def split_chunks(content):
+    """줄 경계에서 내용 기반으로 청크 분할
+
+    경계가 내용으로 정해지므로 중간에 행이 추가/삭제되어도 그 주변 청크만 바뀐다.
+    """
+    chunks = []
+    start = 0
+    position = 0
+    for line in content.splitlines(keepends=True):
+        position += len(line)
+        if (zlib.crc32(line) & CHUNK_MASK) == 0 or position - start >= MAX_CHUNK_SIZE:
+            chunks.append(content[start:position])
+            start = position
+    if start < len(content):
+        chunks.append(content[start:])
+    return chunks
+
+
+def _store_chunk(chunk, backup_dir):
+    digest = hashlib.sha256(chunk).hexdigest()
+    path = _object_path(digest, backup_dir)
+    if not os.path.exists(path):
+        atomic_write(path, lambda f: f.write(chunk), binary=True)
+    return digest
+
+
+def _data_files(data_dir):
+    for root, dirs, files in os.walk(data_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.startswith('.tmp-') or name.endswith(SKIP_SUFFIXES):
+                continue
+            path = os.path.join(root, name)
+            yield os.path.relpath(path, data_dir).replace(os.sep, '/'), path
+
+
+def list_snapshots(backup_dir=BACKUP_DIR):
+    directory = snapshots_dir(backup_dir)
+    if not os.path.isdir(directory):
+        return []
+    return sorted(name[:-len('.json')] for name in os.listdir(directory) if name.endswith('.json'))
+
+
+def load_snapshot(name, backup_dir=BACKUP_DIR):
+    with open(os.path.join(snapshots_dir(backup_dir), f'{name}.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def create_snapshot(data_dir=DATA_DIR, backup_dir=BACKUP_DIR):
+    """현재 data/ 상태의 스냅샷 생성, 스냅샷 이름 반환"""
+    snapshots = list_snapshots(backup_dir)
+    previous = load_snapshot(snapshots[-1], backup_dir)['files'] if snapshots else {}
+
+    files = {}
+    for relpath, path in _data_files(data_dir):
+        stat = os.stat(path)
+        entry = previous.get(relpath)
+        # 크기와 수정 시각이 같으면 읽지도 않고 이전 청크 목록을 그대로 참조
+        if entry is not None and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            files[relpath] = entry
+            continue
+        with open(path, 'rb') as f:
+            content = f.read()
+        files[relpath] = {
+            'size': len(content),
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': hashlib.sha256(content).hexdigest(),
+            'chunks': [_store_chunk(chunk, backup_dir) for chunk in split_chunks(content)]
+        }
+
+    name = datetime.now().strftime('%Y%m%d_%H%M%S')
+    suffix = 1
+    while name in snapshots:
+        name = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{suffix}"
+        suffix += 1
+    atomic_write(
+        os.path.join(snapshots_dir(backup_dir), f'{name}.json'),
+        lambda f: json.dump({'created': datetime.now().isoformat(), 'files': files}, f, indent=1)
+    )
+    return name
+
+
+def _quarantine_extra_files(keep, data_dir, backup_dir):
+    """스냅샷에 없는 data/ 파일을 backup/quarantine/<시각>/으로 옮김
+
+    스냅샷 이후에 생긴 저널, SQLite -wal/-shm, 새 월 파티션 등이 남아 있으면
+    다음 실행 때 복원한 내용 위에 다시 적용되므로 지우지 않고 따로 보관한다.
+    """
+    target = os.path.join(backup_dir, 'quarantine', datetime.now().strftime('%Y%m%d_%H%M%S_%f'))
+    moved = []
+    for root, dirs, files in os.walk(data_dir):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            relpath = os.path.relpath(path, data_dir).replace(os.sep, '/')
+            if relpath in keep:
+                continue
+            if name.endswith('.lock'):
+                # 남기는 파일의 잠금은 그대로 두고, 옮기는 파일의 빈 잠금 파일은 삭제
+                if relpath[:-len('.lock')] not in keep:
+                    os.remove(path)
+                continue
+            destination = os.path.join(target, relpath)
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            os.replace(path, destination)
+            moved.append(relpath)
+    # 비게 된 월 파티션 디렉터리도 정리 (list_months()에 남지 않도록)
+    for root, dirs, files in os.walk(data_dir, topdown=False):
+        if root != data_dir and not os.listdir(root):
+            os.rmdir(root)
+    return moved
+
+
+def restore_snapshot(name, data_dir=DATA_DIR, backup_dir=BACKUP_DIR):
+    """data/를 스냅샷 시점 상태로 복원
+
+    스냅샷에 없는 파일은 backup/quarantine/ 아래로 옮긴다. 청크를 모두 읽어
+    검증한 뒤에만 data/를 바꾸므로 손상된 스냅샷이면 아무것도 바뀌지 않는다.
+    실행 중인 앱은 메모리에 이전 데이터를 들고 있으므로 앱을 멈춘 뒤 실행한다.
+    반환: (복원한 파일, 옮긴 파일)
+    """
+    files = load_snapshot(name, backup_dir)['files']
+    contents = {}
+    for relpath, entry in files.items():
+        parts = []
+        for digest in entry['chunks']:
+            with open(_object_path(digest, backup_dir), 'rb') as f:
+                parts.append(f.read())
+        content = b''.join(parts)
+        if hashlib.sha256(content).hexdigest() != entry['sha256']:
+            raise ValueError(f'{name}: {relpath} 복원 내용이 손상되었습니다.')
+        contents[relpath] = content
+
+    moved = _quarantine_extra_files(contents, data_dir, backup_dir)
+    for relpath, content in contents.items():
+        atomic_write(os.path.join(data_dir, relpath), lambda f: f.write(content), binary=True)
+    return list(contents), moved
+
+
+def prune(keep, backup_dir=BACKUP_DIR):
+    """최근 keep개 스냅샷만 남기고, 더 이상 참조되지 않는 청크 삭제"""
+    snapshots = list_snapshots(backup_dir)
+    removed = snapshots[:-keep] if keep > 0 else snapshots
+    for name in removed:
+        os.remove(os.path.join(snapshots_dir(backup_dir), f'{name}.json'))
+
+    referenced = set()
+    for name in list_snapshots(backup_dir):
+        for entry in load_snapshot(name, backup_dir)['files'].values():
+            referenced.update(entry['chunks'])
+
+    freed = 0
+    for root, _, names in os.walk(objects_dir(backup_dir)):
+        for digest in names:
+            if digest not in referenced:
+                path = os.path.join(root, digest)
+                freed += os.path.getsize(path)
+                os.remove(path)
+    return removed, freed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='증분 백업 관리')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('create')
+    subparsers.add_parser('list')
+    restore_parser = subparsers.add_parser('restore')
+    restore_parser.add_argument('name')
+    prune_parser = subparsers.add_parser('prune')
+    prune_parser.add_argument('--keep', type=int, default=10)
+    args = parser.parse_args()
+
+    if args.command == 'create':
+        print(f'스냅샷 생성: {create_snapshot()}')
+    elif args.command == 'list':
+        for name in list_snapshots():
+            snapshot = load_snapshot(name)
+            size = sum(entry['size'] for entry in snapshot['files'].values())
+            print(f"{name}  파일 {len(snapshot['files'])}개  {size:,} bytes")
+    elif args.command == 'restore':
+        restored, moved = restore_snapshot(args.name)
+        print(f'{len(restored)}개 파일을 복원했습니다.')
+        if moved:
+            print(f'스냅샷에 없던 파일 {len(moved)}개를 {BACKUP_DIR}/quarantine/ 으로 옮겼습니다.')
+    elif args.command == 'prune':
+        removed, freed = prune(args.keep)
+        print(f'스냅샷 {len(removed)}개 삭제, {freed:,} bytes 정리')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,301 @@
+"""외부 시간 기록 가져오기/내보내기
+
+CSV, JSON 배열, JSON Lines 파일을 청크 단위로 읽어 검증하고
+(date, activity_type, timestamp)로 중복을 걸러 낸 뒤, 모든 기록을
+import_activities 한 번과 save_data 한 번으로 저장한다.
+
+열 이름은 영문(date, activity_type/type, hours/minutes, memo, timestamp)과
+분석 탭 CSV의 한글 열(날짜, 활동 유형, 시간, 메모, 기록 시각)을 모두 받는다.
+날짜는 ISO 형식(2024-01-05, 2024-01-05T09:30 등)이어야 한다.
+
+저장소 루트에서 실행:
+    python -m utils.bulk_io import tracker_export.csv
+    python -m utils.bulk_io import records.jsonl --dry-run
+    python -m utils.bulk_io export backup.jsonl
+"""
+import argparse
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils import data_manager
+from utils.activity_store import EMPTY_DAY
+from utils.tenancy import shard_path, use_user
+
+CHUNK_ROWS = 10_000
+# 보고서에 남길 오류 줄 수
+MAX_ERRORS = 20
+# JSON 배열을 읽을 때 한 번에 읽는 문자 수
+READ_SIZE = 1 << 16
+
+FIELDS = ['date', 'activity_type', 'hours', 'memo', 'timestamp']
+
+COLUMN_ALIASES = {
+    '날짜': 'date',
+    'day': 'date',
+    '활동 유형': 'activity_type',
+    'type': 'activity_type',
+    'category': 'activity_type',
+    '시간': 'hours',
+    'duration': 'hours',
+    'duration_minutes': 'minutes',
+    '메모': 'memo',
+    'note': 'memo',
+    'description': 'memo',
+    '기록 시각': 'timestamp',
+    'time': 'timestamp',
+    'start': 'timestamp'
+}
+
+TYPE_ALIASES = {
+    'study': 'study',
+    '학습': 'study',
+    'break': 'break',
+    'rest': 'break',
+    '휴식': 'break'
+}
+
+# 날짜 값 끝의 시간대 표기 (시각 뒤의 +09:00, -0500, Z)
+TZ_SUFFIX = r'(\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?)\s*(?:Z|[+-]\d{2}:?\d{2})$'
+
+
+def detect_format(name, head=''):
+    if name.endswith('.jsonl') or name.endswith('.ndjson'):
+        return 'jsonl'
+    if name.endswith('.json'):
+        return 'json' if head.lstrip().startswith('[') else 'jsonl'
+    return 'csv'
+
+
+def _iter_json_array(f):
+    """큰 JSON 배열을 한 번에 올리지 않고 객체 하나씩 읽기"""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    started = False
+    while True:
+        chunk = f.read(READ_SIZE)
+        buffer += chunk
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+            if not started:
+                if position == len(buffer):
+                    break
+                if buffer[position] != '[':
+                    raise ValueError('JSON 파일은 객체 배열이어야 합니다')
+                started = True
+                position += 1
+                continue
+            if position < len(buffer) and buffer[position] == ']':
+                return
+            try:
+                record, position = decoder.raw_decode(buffer, position)
+            except ValueError:
+                if not chunk:
+                    raise ValueError('JSON 배열이 중간에 끝났습니다') from None
+                break
+            yield record
+        buffer = buffer[position:]
+        if not chunk:
+            if buffer.strip() or not started:
+                raise ValueError('JSON 배열이 중간에 끝났습니다')
+            return
+
+
+def _iter_json_lines(f):
+    for number, line in enumerate(f, 1):
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except ValueError:
+                raise ValueError(f'{number}번째 줄이 올바른 JSON이 아닙니다') from None
+
+
+def _batched(records, size):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield pd.DataFrame(batch, dtype=object)
+            batch = []
+    if batch:
+        yield pd.DataFrame(batch, dtype=object)
+
+
+def read_chunks(f, fmt, chunk_rows=CHUNK_ROWS):
+    """원본 행을 chunk_rows행씩 (문자열) DataFrame으로 순회 (f는 텍스트 파일 객체)"""
+    if fmt == 'csv':
+        yield from pd.read_csv(f, dtype=str, keep_default_na=False, chunksize=chunk_rows)
+    elif fmt == 'json':
+        yield from _batched(_iter_json_array(f), chunk_rows)
+    elif fmt == 'jsonl':
+        yield from _batched(_iter_json_lines(f), chunk_rows)
+    else:
+        raise ValueError(f'지원하지 않는 형식입니다: {fmt}')
+
+
+def normalize_chunk(raw, first_row):
+    """열 이름/값을 정리하고 검사
+
+    반환: (정상 행 DataFrame[FIELDS], [(행 번호, 오류), ...], 오류 행 수)
+    first_row는 이 청크 첫 행의 파일 내 번호(보고서용)다.
+    """
+    raw = raw.rename(columns=lambda name: str(name).strip().lower())
+    raw = raw.rename(columns=COLUMN_ALIASES)
+    rows = pd.RangeIndex(first_row, first_row + len(raw))
+    missing = [name for name in ('date', 'activity_type') if name not in raw]
+    if 'hours' not in raw and 'minutes' not in raw:
+        missing.append('hours')
+    if missing:
+        raise ValueError(f"필수 열이 없습니다: {', '.join(missing)}")
+
+    def text(name):
+        if name not in raw:
+            return pd.Series('', index=raw.index)
+        return raw[name].fillna('').astype(str).str.strip()
+
+    # 시간대 표기(+09:00, Z 등)는 떼고 파일에 적힌 날짜/시각 그대로 사용
+    # (오프셋이 섞이거나 있는 값과 없는 값이 섞여도 datetime 열이 되도록)
+    local = text('date').str.replace(TZ_SUFFIX, r'\1', regex=True)
+    stamp = pd.to_datetime(local, errors='coerce', format='ISO8601')
+    activity_type = text('activity_type').str.lower().map(TYPE_ALIASES)
+    hours = pd.to_numeric(text('hours'), errors='coerce')
+    if 'minutes' in raw:
+        # JSON 레코드마다 hours/minutes 중 하나만 있을 수 있으므로 hours가 빈 행은 minutes로 계산
+        hours = hours.where(text('hours') != '', pd.to_numeric(text('minutes'), errors='coerce') / 60)
+    timestamp = text('timestamp')
+    # 시각 열이 없으면 날짜에 들어 있는 시각 사용 (2024-01-01T09:30 등)
+    timestamp = timestamp.where(timestamp != '', stamp.dt.strftime('%H:%M').where(stamp.dt.normalize() != stamp, ''))
+    timestamp = timestamp.str.extract(r'^(\d{1,2}:\d{2})', expand=False)
+    timestamp = timestamp.str.zfill(5)
+
+    checks = [
+        (stamp.isna(), '날짜를 읽을 수 없습니다'),
+        (activity_type.isna(), '활동 유형은 study/break(학습/휴식)이어야 합니다'),
+        (~hours.between(0, 24, inclusive='right'), '시간은 0보다 크고 24 이하여야 합니다'),
+        (timestamp.isna(), '기록 시각(HH:MM)이 없습니다')
+    ]
+    invalid = np.zeros(len(raw), dtype=bool)
+    errors = []
+    for mask, message in checks:
+        mask = mask.to_numpy() & ~invalid
+        errors.extend((int(row), message) for row in rows[mask][:MAX_ERRORS])
+        invalid |= mask
+
+    valid = ~invalid
+    frame = pd.DataFrame({
+        'date': stamp[valid].dt.strftime('%Y-%m-%d'),
+        'activity_type': activity_type[valid],
+        'hours': hours[valid].astype(float),
+        'memo': text('memo')[valid],
+        'timestamp': timestamp[valid]
+    })
+    return frame, errors, int(invalid.sum())
+
+
+def ingest(data, f, fmt, dry_run=False, chunk_rows=CHUNK_ROWS):
+    """파일 하나를 검증/중복 제거 후 한 번에 저장하고 보고서 반환"""
+    report = {'rows': 0, 'imported': 0, 'duplicates_in_file': 0, 'duplicates_existing': 0,
+              'invalid': 0, 'errors': []}
+    seen = set()
+    records = []
+    # CSV는 헤더가 1행이므로 데이터는 2행부터
+    first_row = 2 if fmt == 'csv' else 1
+    for raw in read_chunks(f, fmt, chunk_rows):
+        frame, errors, invalid = normalize_chunk(raw, first_row + report['rows'])
+        report['rows'] += len(raw)
+        report['invalid'] += invalid
+        report['errors'].extend(errors[:MAX_ERRORS - len(report['errors'])])
+        for record in zip(frame['date'], frame['activity_type'], frame['hours'], frame['memo'], frame['timestamp']):
+            key = (record[0], record[1], record[4])
+            if key in seen:
+                report['duplicates_in_file'] += 1
+                continue
+            seen.add(key)
+            records.append(record)
+
+    if dry_run:
+        activities = data['activities']
+        existing = sum(
+            1 for date, activity_type, _, _, timestamp in records
+            if any(r['timestamp'] == timestamp for r in activities.get(date, EMPTY_DAY)[activity_type])
+        )
+        report['duplicates_existing'] = existing
+        report['imported'] = len(records) - existing
+        return report
+
+    added, skipped = data_manager.import_activities(data, records)
+    report['imported'] = added
+    report['duplicates_existing'] = skipped
+    if added:
+        data_manager.save_data(data)
+    return report
+
+
+def open_text(binary):
+    """업로드된 바이너리 파일을 텍스트로 (엑셀 CSV의 BOM 제거)"""
+    return io.TextIOWrapper(binary, encoding='utf-8-sig', newline='')
+
+
+def export_records(data, f, fmt):
+    """메모리의 활동 기록 전체를 CSV 또는 JSON Lines로 청크 단위 저장, 행 수 반환"""
+    pager = data_manager.get_activity_pager(data)
+    rows = 0
+    header = True
+    for frame in pager.iter_frames(CHUNK_ROWS):
+        if fmt == 'csv':
+            frame.to_csv(f, index=False, header=header)
+            header = False
+        else:
+            frame.to_json(f, orient='records', lines=True, force_ascii=False)
+            if len(frame):
+                f.write('\n')
+        rows += len(frame)
+    if fmt == 'csv' and header:
+        f.write(','.join(FIELDS) + '\n')
+    return rows
+
+
+def format_report(report):
+    lines = [
+        f"읽은 행 {report['rows']}, 추가 {report['imported']}, "
+        f"파일 내 중복 {report['duplicates_in_file']}, 기존 기록과 중복 {report['duplicates_existing']}, "
+        f"오류 {report['invalid']}"
+    ]
+    lines.extend(f'  {row}행: {message}' for row, message in report['errors'])
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='활동 기록 가져오기/내보내기')
+    parser.add_argument('command', choices=['import', 'export'])
+    parser.add_argument('path')
+    parser.add_argument('--format', choices=['csv', 'json', 'jsonl'], help='기본값: 파일 확장자로 판단')
+    parser.add_argument('--dry-run', action='store_true', help='검사만 하고 저장하지 않음')
+    parser.add_argument('--user', help='MULTI_USER 모드의 사용자 ID')
+    args = parser.parse_args()
+
+    with use_user(args.user):
+        os.makedirs(shard_path('data'), exist_ok=True)
+        data = data_manager.load_data()
+        if args.command == 'import':
+            with open(args.path, encoding='utf-8-sig', newline='') as f:
+                fmt = args.format or detect_format(args.path, f.read(64))
+                f.seek(0)
+                report = ingest(data, f, fmt, dry_run=args.dry_run)
+            print(format_report(report))
+        else:
+            fmt = args.format or ('csv' if args.path.endswith('.csv') else 'jsonl')
+            os.makedirs(os.path.dirname(args.path) or '.', exist_ok=True)
+            with open(args.path, 'w', encoding='utf-8', newline='') as f:
+                rows = export_records(data, f, fmt)
+            print(f'{rows}개 기록을 {args.path}에 저장했습니다.')
+        data_manager.flush_writes()
+
+
+if __name__ == '__main__':
+    main()
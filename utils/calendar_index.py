@@ -0,0 +1,96 @@
+import calendar
+import itertools
+import json
+import os
+import zlib
+
+from utils.aggregates import day_totals
+from utils.schedule import get_schedule_book
+
+# 메모리에서 바뀐 월의 버전 (프로세스마다 달라서 디스크 캐시의 다른 실행 결과와 겹치지 않음)
+_PROCESS = os.urandom(4).hex()
+_changes = itertools.count(1)
+
+
+class CalendarIndex:
+    """월별 날짜 요약 (date -> study, break, target, subjects, has_review)
+
+    한 달치 요약은 처음 요청될 때 한 번 만들고, 해당 월의 기록이 바뀌면 버린다.
+
+    month_version()은 렌더 캐시 키로 쓰는 월 데이터 버전이다. 이 데이터에서
+    바뀐 월은 바뀔 때마다 새 번호를, 그 밖의 월은 storage_version(data, month)가
+    주는 저장소 버전(월 파티션 파일 버전 등)을 쓰므로 캐시를 조회할 때 요약을
+    만들거나 파티션을 읽지 않는다. storage_version이 없거나 None을 돌려주면
+    요약의 체크섬을 쓴다.
+    """
+
+    SECTIONS = ('activities', 'reviews')
+
+    def __init__(self, data, storage_version=None):
+        self.data = data
+        self.storage_version = storage_version
+        self.months = {}
+        self.versions = {}
+        self.changes = {}
+
+    def copy(self, data):
+        new = CalendarIndex(data, self.storage_version)
+        new.months = dict(self.months)
+        new.versions = dict(self.versions)
+        new.changes = dict(self.changes)
+        return new
+
+    def month(self, year, month):
+        key = f"{year}-{month:02d}"
+        if key not in self.months:
+            self.months[key] = self._build(year, month)
+        return self.months[key]
+
+    def month_version(self, year, month):
+        """해당 월의 데이터 버전 (그 달의 활동/총평/목표가 바뀔 때만 달라짐)"""
+        key = f"{year}-{month:02d}"
+        # 목표 시간은 설정 파일에서 오므로 한 달치 목표로 따로 구분
+        targets = zlib.crc32(json.dumps(
+            get_schedule_book().resolve_month(year, month)['target_study_hours'].tolist()
+        ).encode('utf-8'))
+        if key in self.changes:
+            return f"{targets:08x}-m{_PROCESS}-{self.changes[key]}"
+        stored = self.storage_version(self.data, key) if self.storage_version is not None else None
+        if stored is not None:
+            return f"{targets:08x}-f{stored}"
+        if key not in self.versions:
+            summary = self.month(year, month)
+            self.versions[key] = zlib.crc32(json.dumps(summary, sort_keys=True).encode('utf-8'))
+        return f"{targets:08x}-c{self.versions[key]:08x}"
+
+    def _build(self, year, month):
+        summary = {}
+        # 한 달치 목표 시간을 한 번에 조회
+        targets = get_schedule_book().resolve_month(year, month)['target_study_hours'].tolist()
+        for day in range(1, calendar.monthrange(year, month)[1] + 1):
+            date_str = f"{year}-{month:02d}-{day:02d}"
+            activities = self.data['activities'].get(date_str)
+            totals = day_totals(activities)
+            has_review = date_str in self.data['reviews']
+            if totals is None and not has_review:
+                continue
+            summary[date_str] = {
+                'study': totals['study'] if totals else 0.0,
+                'break': totals['break'] if totals else 0.0,
+                'target': targets[day - 1],
+                'subjects': [
+                    (record['memo'], record['hours'])
+                    for record in (activities or {}).get('study', [])
+                ],
+                'has_review': has_review
+            }
+        return summary
+
+    def on_change(self, section, key, old, new):
+        if section not in ('activities', 'reviews'):
+            return
+        self.months.pop(key[:7], None)
+        self.versions.pop(key[:7], None)
+        # 저장소에서 읽어 온 값(지연 로딩, 다른 세션이 저장한 내용)은 저장소 버전에 이미 반영됨
+        if old is not None or key in self.data[section].dirty:
+            self.changes[key[:7]] = next(_changes)
@@ -0,0 +1,18 @@
+from datetime import datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+
+@lru_cache(maxsize=None)
+def seoul_tz():
+    """서울 시간대 (처음 쓸 때 한 번만 읽음)"""
+    return ZoneInfo('Asia/Seoul')
+
+
+def seoul_now():
+    return datetime.now(seoul_tz())
+
+
+def current_time():
+    """현재 서울 시간 'HH:MM' (import 시점이 아니라 호출 시점 기준)"""
+    return seoul_now().strftime('%H:%M')
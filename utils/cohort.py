@@ -0,0 +1,117 @@
+"""여러 사용자의 학습 통계 (코호트 분석)
+
+사용자마다 디스크에 저장된 날짜별 합계를 읽어 요약을 만든다. 요약은 샤드의
+데이터 파일 버전(mtime, 크기) 목록과 함께 캐시하므로, 한 사용자가 저장하면
+그 사용자만 다시 읽고 나머지는 파일 stat만 확인한다. 다시 읽을 사용자가
+여럿이면 프로세스 풀에서 나누어 처리한다.
+"""
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from utils import data_manager
+from utils.activity_store import DailyTotals
+from utils.goals import build_report, checklist_frame
+from utils.safe_io import file_version
+from utils.schedule import get_schedule_book
+from utils.search_index import INDEX_DIR
+from utils.tenancy import list_users, use_user, user_root
+
+COHORT_WORKERS = int(os.environ.get('COHORT_WORKERS', os.cpu_count() or 1))
+
+# 내용이 바뀌어도 통계와 무관한 파일/디렉터리
+IGNORED_FILES = ('.lock',)
+IGNORED_DIRS = (os.path.basename(INDEX_DIR),)
+
+_pool = None
+_pool_lock = threading.Lock()
+_stats = None
+
+
+def shard_version(user_id):
+    """사용자 data/ 아래 파일들의 (경로, 버전) 목록"""
+    data_dir = os.path.join(user_root(user_id), 'data')
+    versions = []
+    for directory, dirs, files in os.walk(data_dir):
+        dirs[:] = [name for name in dirs if name not in IGNORED_DIRS]
+        for name in files:
+            if not name.endswith(IGNORED_FILES):
+                path = os.path.join(directory, name)
+                versions.append((path, file_version(path)))
+    return tuple(sorted(versions))
+
+
+def summarize_user(user_id):
+    """한 사용자의 요약 (프로세스 풀 작업자에서도 실행)"""
+    with use_user(user_id):
+        daily = data_manager.daily_summary()
+        book = get_schedule_book()
+        totals = DailyTotals.from_rows(zip(
+            daily['date'].dt.strftime('%Y-%m-%d'), daily['study'], daily['break']
+        ))
+        overall = build_report(totals, checklist_frame({}), book)['overall']
+    days = len(totals)
+    study = float(totals.study.sum())
+    return {
+        'user_id': user_id,
+        'days': days,
+        'first_date': daily['date'].min().strftime('%Y-%m-%d') if days else None,
+        'last_date': daily['date'].max().strftime('%Y-%m-%d') if days else None,
+        'study_total': study,
+        'break_total': float(totals.rest.sum()),
+        'study_avg': study / days if days else 0.0,
+        'rate': overall['rate'],
+        'current_streak': overall['current_streak'],
+        'longest_streak': overall['longest_streak'],
+        'warning': overall['warning'],
+        'emergency': overall['emergency']
+    }
+
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Streamlit 서버는 여러 스레드로 돌기 때문에 fork 대신 spawn
+            _pool = ProcessPoolExecutor(COHORT_WORKERS, mp_context=multiprocessing.get_context('spawn'))
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+class CohortStats:
+    """사용자별 요약 캐시 (user_id -> (샤드 버전, 요약))"""
+
+    def __init__(self):
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def summaries(self):
+        users = list_users()
+        versions = {user_id: shard_version(user_id) for user_id in users}
+        with self._lock:
+            stale = [
+                user_id for user_id in users
+                if user_id not in self._cache or self._cache[user_id][0] != versions[user_id]
+            ]
+        if stale:
+            for user_id, summary in zip(stale, self._compute(stale)):
+                with self._lock:
+                    self._cache[user_id] = (versions[user_id], summary)
+        with self._lock:
+            for user_id in set(self._cache) - set(users):
+                del self._cache[user_id]
+            return [self._cache[user_id][1] for user_id in users]
+
+    def _compute(self, users):
+        if len(users) == 1 or COHORT_WORKERS <= 1:
+            return [summarize_user(user_id) for user_id in users]
+        return list(get_pool().map(summarize_user, users))
+
+
+def get_cohort_stats():
+    global _stats
+    if _stats is None:
+        _stats = CohortStats()
+    return _stats
@@ -0,0 +1,151 @@
+"""Arrow IPC(Feather v2) 스냅샷
+
+열 단위로 타입이 고정된 파일이라 CSV처럼 텍스트를 다시 파싱하지 않고,
+읽을 때는 메모리 매핑으로 필요한 열만 꺼낸다.
+
+CSV 스냅샷과 서로 변환:
+    python -m utils.columnar import   # CSV -> Arrow
+    python -m utils.columnar export   # Arrow -> CSV
+"""
+import argparse
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # arrow 저장 방식을 쓰지 않으면 필요 없음
+    pa = None
+
+from utils.safe_io import atomic_write
+
+ARROW_FILES = {
+    'checklist': 'data/checklist_data.arrow',
+    'activities': 'data/activities_data.arrow',
+    'reviews': 'data/reviews_data.arrow'
+}
+
+SUMMARY_COLUMNS = ['date', 'activity_type', 'hours']
+
+
+def require_pyarrow():
+    if pa is None:
+        raise RuntimeError('arrow 저장 방식에는 pyarrow가 필요합니다 (pip install pyarrow)')
+
+
+def schema(section):
+    require_pyarrow()
+    # 값 종류가 적은 열은 dictionary(범주형)로 저장
+    category = pa.dictionary(pa.int8(), pa.string())
+    return {
+        'checklist': pa.schema([
+            ('date', pa.date32()),
+            ('item_id', pa.dictionary(pa.int16(), pa.string())),
+            ('checked', pa.bool_())
+        ]),
+        'activities': pa.schema([
+            ('date', pa.date32()),
+            ('activity_type', category),
+            ('hours', pa.float64()),
+            ('memo', pa.string()),
+            ('timestamp', pa.string())
+        ]),
+        'reviews': pa.schema([
+            ('date', pa.date32()),
+            ('content', pa.string()),
+            ('timestamp', pa.string())
+        ])
+    }[section]
+
+
+def _column(field, values):
+    if pa.types.is_date(field.type):
+        return pa.array(values, pa.string()).cast(field.type)
+    if pa.types.is_dictionary(field.type):
+        return pa.array(values, pa.string()).dictionary_encode().cast(field.type)
+    return pa.array(values, field.type)
+
+
+def write_table(path, section, records):
+    """CSV 행과 같은 형식의 dict 목록을 Arrow 파일로 원자적으로 저장"""
+    table_schema = schema(section)
+    table = pa.Table.from_arrays(
+        [_column(field, [record[field.name] for record in records]) for field in table_schema],
+        schema=table_schema
+    )
+    # 메모리 매핑으로 바로 읽을 수 있도록 압축하지 않음
+    atomic_write(path, lambda f: feather.write_feather(table, f, compression='uncompressed'), binary=True)
+
+
+def read_table(path, columns=None):
+    """필요한 열만 메모리 매핑으로 읽기 (파일이 없으면 None)"""
+    require_pyarrow()
+    if not os.path.exists(path):
+        return None
+    return feather.read_table(path, columns=columns, memory_map=True)
+
+
+def _to_frame(table):
+    # 날짜는 다른 저장 방식과 같은 'YYYY-MM-DD' 문자열로
+    if 'date' in table.column_names:
+        index = table.column_names.index('date')
+        table = table.set_column(index, 'date', table.column('date').cast(pa.string()))
+    return table.to_pandas()
+
+
+def read_frame(path, columns=None):
+    table = read_table(path, columns)
+    return None if table is None else _to_frame(table)
+
+
+def iter_frames(path, columns=None, chunksize=65536):
+    """메모리 매핑한 파일을 레코드 배치 단위 DataFrame으로 순회"""
+    table = read_table(path, columns)
+    if table is None:
+        return
+    for batch in table.to_batches(max_chunksize=chunksize):
+        yield _to_frame(pa.Table.from_batches([batch]))
+
+
+def _totals(path, key):
+    table = read_table(path, SUMMARY_COLUMNS)
+    if table is None:
+        return []
+    # 매핑된 버퍼 위에서 바로 날짜/종류별 합계를 구한 뒤 key 단위로 합침
+    grouped = table.group_by(['date', 'activity_type']).aggregate([('hours', 'sum')])
+    totals = {}
+    for date, activity_type, hours in zip(
+        grouped.column('date').cast(pa.string()).to_pylist(),
+        grouped.column('activity_type').to_pylist(),
+        grouped.column('hours_sum').to_pylist()
+    ):
+        row = totals.setdefault(key(date), [0.0, 0.0])
+        row[0 if activity_type == 'study' else 1] += hours
+    return [(name, study, rest) for name, (study, rest) in sorted(totals.items())]
+
+
+def daily_rows(path=ARROW_FILES['activities']):
+    """날짜별 학습/휴식 합계 [(date, study, break), ...]"""
+    return _totals(path, lambda date: date)
+
+
+def monthly_rows(path=ARROW_FILES['activities']):
+    """월별 학습/휴식 합계 [(month, study, break), ...]"""
+    return _totals(path, lambda date: date[:7])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Arrow 스냅샷 관리')
+    parser.add_argument('command', choices=['import', 'export'])
+    args = parser.parse_args()
+
+    from utils.data_manager import migrate_to_arrow, export_to_csv
+    if args.command == 'import':
+        count = migrate_to_arrow()
+        print(f'{count}개 날짜를 Arrow 스냅샷으로 옮겼습니다.')
+    else:
+        count = export_to_csv()
+        print(f'{count}개 날짜를 CSV 스냅샷으로 내보냈습니다.')
+
+
+if __name__ == '__main__':
+    main()
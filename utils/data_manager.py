@@ -1,110 +1,818 @@
 import pandas as pd
 import os
-from datetime import datetime
+import atexit
+import threading
+from utils.journal import Journal, read_entries, JOURNAL_PATH
+from utils.tracking import TrackedData, SECTIONS
+from utils.partitions import LazySection, list_months, month_of, partition_path
+from utils import sqlite_store, backup, columnar
+from utils.aggregates import ActivityAggregates
+from utils.activity_store import ActivityDay, ActivityRecord, compact_day
+from utils.calendar_index import CalendarIndex
+from utils.activity_pages import ActivityPager
+from utils.goals import GoalAnalytics, CHECKLIST_COLUMNS, checklist_frame
+from utils.range_query import RangeAnalytics
+from utils.search_index import SearchIndex, INDEX_DIR
+from utils.tenancy import shard_path, use_root, current_root
+from utils.safe_io import FileLock, atomic_write, file_version
+from utils.merge import merge_entry, record_changes, apply_record_changes
+from utils.shared_store import SharedStore
+from utils.writer import BackgroundWriter
+from utils.profiling import profiled, timed, count_file_read
+from utils.schedule import get_schedule_book
 
-def load_data():
-    data = {
-        'activities': {},
-        'checklist': {},
-        'reviews': {}
+# 저장 방식
+#   'csv': 섹션별 CSV 스냅샷
+#   'journal': 변경 로그 + 시작 시 CSV로 압축
+#   'partitioned': 월별 파티션 (data/months/YYYY-MM/) + 지연 로딩
+#   'sqlite': data/study.db (WAL 모드, 날짜 단위 upsert)
+#   'arrow': 섹션별 Arrow IPC 스냅샷 (타입 고정 열, 메모리 매핑 읽기, pyarrow 필요)
+STORAGE_MODES = ('csv', 'journal', 'partitioned', 'sqlite', 'arrow')
+
+def check_storage_mode(mode):
+    """저장 방식 이름 확인 (모르는 이름이거나 필요한 패키지가 없으면 시작할 때 바로 실패)"""
+    if mode not in STORAGE_MODES:
+        raise ValueError(f"알 수 없는 STORAGE_MODE입니다: {mode!r} ({', '.join(STORAGE_MODES)} 중 하나)")
+    if mode == 'arrow':
+        columnar.require_pyarrow()
+    return mode
+
+STORAGE_MODE = check_storage_mode(os.environ.get('STORAGE_MODE', 'csv'))
+
+# 세션마다 데이터를 따로 읽지 않고 프로세스 전체가 하나의 저장소를 공유할지 여부
+SHARED_STORE = os.environ.get('SHARED_STORE', '1') != '0'
+
+# 공유 저장소의 저장을 백그라운드 스레드에서 모아서 처리할지 여부
+WRITE_BEHIND = os.environ.get('WRITE_BEHIND', '1') != '0'
+
+SNAPSHOT_FILES = {
+    'checklist': 'data/checklist_data.csv',
+    'activities': 'data/activities_data.csv',
+    'reviews': 'data/reviews_data.csv'
+}
+
+COLUMNS = {
+    'checklist': ['date', 'item_id', 'checked'],
+    'activities': ['date', 'activity_type', 'hours', 'memo', 'timestamp'],
+    'reviews': ['date', 'content', 'timestamp']
+}
+
+# 분석 집계에 필요한 열
+SUMMARY_COLUMNS = ['date', 'activity_type', 'hours']
+
+# 분석용으로 파일을 나누어 읽는 단위 (행)
+CHUNK_ROWS = 50_000
+
+DTYPES = {
+    'checklist': {'date': str, 'item_id': str, 'checked': bool},
+    'activities': {'date': str, 'activity_type': str, 'hours': float, 'memo': str, 'timestamp': str},
+    'reviews': {'date': str, 'content': str, 'timestamp': str}
+}
+
+# 사용자 샤드별 변경 로그 (경로 -> Journal)
+_journals = {}
+_writer = None
+# 백그라운드 저장과 종료 시 저장이 같은 스냅샷을 동시에 쓰지 않도록
+_save_lock = threading.Lock()
+
+def get_journal():
+    path = shard_path(JOURNAL_PATH)
+    journal = _journals.get(path)
+    if journal is None:
+        journal = _journals[path] = Journal(path)
+        atexit.register(journal.close)
+    return journal
+
+def _csv_files():
+    return {section: shard_path(path) for section, path in SNAPSHOT_FILES.items()}
+
+def _arrow_files():
+    return {section: shard_path(path) for section, path in columnar.ARROW_FILES.items()}
+
+def _snapshot_files():
+    return _arrow_files() if STORAGE_MODE == 'arrow' else _csv_files()
+
+def _db_path():
+    return shard_path(sqlite_store.DB_PATH)
+
+def _read_csv(path, section, columns=None):
+    if not os.path.exists(path):
+        return None
+    # 텍스트 열은 빈 문자열을 NaN으로 바꾸지 않도록 문자열로 고정
+    return pd.read_csv(path, dtype=DTYPES[section], keep_default_na=False, usecols=columns)
+
+def _read_frame(path, section, columns=None):
+    with timed('io.read'):
+        count_file_read(path)
+        if path.endswith('.arrow'):
+            return columnar.read_frame(path, columns)
+        return _read_csv(path, section, columns)
+
+def _frame_to_section(section, df):
+    """CSV 프레임을 {날짜: 값} dict로 변환"""
+    # 행 단위 iterrows 대신 열을 리스트로 꺼내 한 번에 순회
+    result = {}
+    if df is None:
+        return result
+
+    if section == 'checklist':
+        for date, item_id, checked in zip(
+            df['date'].tolist(),
+            df['item_id'].tolist(),
+            df['checked'].tolist()
+        ):
+            items = result.get(date)
+            if items is None:
+                items = result[date] = {}
+            items[item_id] = checked
+
+    elif section == 'activities':
+        for date, activity_type, hours, memo, timestamp in zip(
+            df['date'].tolist(),
+            df['activity_type'].tolist(),
+            df['hours'].tolist(),
+            df['memo'].tolist(),
+            df['timestamp'].tolist()
+        ):
+            day = result.get(date)
+            if day is None:
+                day = result[date] = {'study': [], 'break': []}
+            day[activity_type].append(ActivityRecord(hours, memo, timestamp))
+        result = {date: ActivityDay(day['study'], day['break']) for date, day in result.items()}
+
+    elif section == 'reviews':
+        result = {
+            date: {'content': content, 'timestamp': timestamp}
+            for date, content, timestamp in zip(
+                df['date'].tolist(),
+                df['content'].tolist(),
+                df['timestamp'].tolist()
+            )
+        }
+
+    return result
+
+def _load_file(file_versions, path, section):
+    # 버전을 먼저 기록해야 읽는 도중 다른 세션이 파일을 바꿔도 다음 저장에서 병합됨
+    file_versions[path] = file_version(path)
+    return _frame_to_section(section, _read_frame(path, section))
+
+def _load_snapshots(file_versions):
+    return {
+        section: _load_file(file_versions, _snapshot_files()[section], section)
+        for section in SECTIONS
     }
-    
-    if os.path.exists('data/checklist_data.csv'):
-        checklist_df = pd.read_csv('data/checklist_data.csv')
-        for _, row in checklist_df.iterrows():
-            date = row['date']
-            if date not in data['checklist']:
-                data['checklist'][date] = {}
-            data['checklist'][date][row['item_id']] = row['checked']
-
-    if os.path.exists('data/activities_data.csv'):
-        activities_df = pd.read_csv('data/activities_data.csv')
-        for _, row in activities_df.iterrows():
-            date = row['date']
-            if date not in data['activities']:
-                data['activities'][date] = {'study': [], 'break': []}
-            activity_type = row['activity_type']
-            data['activities'][date][activity_type].append({
-                'hours': float(row['hours']),
-                'memo': row['memo'],
-                'timestamp': row['timestamp']
-            })
 
-    if os.path.exists('data/reviews_data.csv'):
-        reviews_df = pd.read_csv('data/reviews_data.csv')
-        for _, row in reviews_df.iterrows():
-            date = row['date']
-            data['reviews'][date] = {
-                'content': row['content'],
-                'timestamp': row['timestamp']
-            }
-    
+def _load_partition(data, section, month):
+    with use_root(data.root):
+        entries = _load_file(data.file_versions, partition_path(month, section), section)
+    # 나중에 읽힌 월(다른 세션이 만든 월 포함)도 집계 등 파생 데이터에 반영
+    for key, value in entries.items():
+        data.notify(section, key, None, value)
+    return entries
+
+@profiled()
+def load_data():
+    file_versions = {}
+
+    if STORAGE_MODE == 'partitioned':
+        if not list_months() and any(os.path.exists(path) for path in _csv_files().values()):
+            migrate_to_partitions()
+        # 월 파티션은 페이지가 실제로 접근할 때 읽어 옴
+        data = TrackedData(**{
+            section: LazySection(section, _load_partition) for section in SECTIONS
+        })
+
+    elif STORAGE_MODE == 'sqlite':
+        if not os.path.exists(_db_path()) and any(os.path.exists(path) for path in _csv_files().values()):
+            migrate_to_sqlite()
+        data = TrackedData(**sqlite_store.load(_db_path()))
+
+    elif STORAGE_MODE == 'arrow':
+        if not any(os.path.exists(path) for path in _arrow_files().values()) \
+                and any(os.path.exists(path) for path in _csv_files().values()):
+            migrate_to_arrow()
+        data = TrackedData(**_load_snapshots(file_versions))
+
+    elif STORAGE_MODE == 'journal':
+        # 다른 세션이 로그를 덧붙이는 도중에 압축하지 않도록 잠금
+        with FileLock(get_journal().path):
+            sections = _load_snapshots(file_versions)
+            # 시작 시 로그를 스냅샷 위에 재생한 뒤 CSV로 압축
+            if _replay_journal(sections):
+                _compact(sections, file_versions)
+        data = TrackedData(**sections)
+
+    else:
+        data = TrackedData(**_load_snapshots(file_versions))
+
+    data.file_versions = file_versions
+    data.root = current_root()
     return data
 
+def _snapshot(data):
+    """공유 저장소면 현재 스냅샷, 아니면 데이터 그대로"""
+    return data.current if isinstance(data, SharedStore) else data
+
+def _apply(data, mutate):
+    """변경 적용 (공유 저장소면 복사본에 적용한 뒤 새 스냅샷으로 공개)
+
+    버튼 콜백이나 백그라운드 저장 스레드에서도 데이터를 읽은 사용자의
+    샤드에 기록되도록 데이터의 루트를 기준으로 실행한다.
+    """
+    with use_root(_snapshot(data).root):
+        if isinstance(data, SharedStore):
+            return data.update(mutate)
+        return mutate(data)
+
+@profiled()
 def save_data(data):
-    os.makedirs('data', exist_ok=True)
-    
-    checklist_records = []
-    for date, items in data['checklist'].items():
-        for item_id, checked in items.items():
-            checklist_records.append({
-                'date': date,
-                'item_id': item_id,
-                'checked': checked
-            })
-    
-    if checklist_records:
-        checklist_df = pd.DataFrame(checklist_records)
-        checklist_df.to_csv('data/checklist_data.csv', index=False)
-
-    activity_records = []
-    for date, activities in data['activities'].items():
-        for activity_type, records in activities.items():
-            for record in records:
-                activity_records.append({
+    # 읽기만 한 rerun은 디스크를 건드리지 않음
+    if not _snapshot(data).is_dirty():
+        return
+    if WRITE_BEHIND and isinstance(data, SharedStore):
+        # 화면은 디스크를 기다리지 않고, 연달은 변경은 한 번의 저장으로 합쳐짐
+        get_writer().submit(data)
+        return
+    _apply(data, _persist)
+
+def _save_now(data):
+    """백그라운드 저장 (디스크 쓰기는 공유 저장소 잠금 밖에서)
+
+    공개된 스냅샷은 바뀌지 않으므로 잠금 없이 그대로 저장하고, 잠금 안에서는
+    저장한 값을 반영하기만 한다. 저장하는 동안 다시 바뀐 날짜는 변경 표시가
+    남아 다음 저장에 포함된다.
+    """
+    if not isinstance(data, SharedStore):
+        if data.is_dirty():
+            _apply(data, _persist)
+        return
+    with _save_lock:
+        written = data.current
+        if not written.is_dirty():
+            return
+        with use_root(written.root):
+            saved, versions = _write_changes(written)
+            _save_search_index(written)
+        data.update(lambda new: _publish(new, written, saved, versions))
+
+def get_writer():
+    global _writer
+    if _writer is None:
+        _writer = BackgroundWriter(_save_now)
+    return _writer
+
+def flush_writes(timeout=None):
+    """백그라운드 저장 대기분을 모두 디스크에 반영"""
+    return _writer is None or _writer.flush(timeout)
+
+def writer_status():
+    """백그라운드 저장 상태 (사용하지 않으면 None)"""
+    return None if _writer is None else _writer.health()
+
+def _persist(data):
+    saved, versions = _write_changes(data)
+    _save_search_index(data)
+    _publish(data, data, saved, versions)
+
+def _save_search_index(data):
+    # 검색 색인도 데이터와 함께 저장 (바뀐 날짜가 있을 때만)
+    index = data.views.get('search_index')
+    if index is not None:
+        index.save()
+
+def _replay_journal(sections):
+    replayed = 0
+    for entry in read_entries(get_journal().path):
+        _apply_journal_entry(sections, entry)
+        replayed += 1
+    return replayed
+
+def _compact(sections, file_versions):
+    for section, path in _csv_files().items():
+        with FileLock(path):
+            _write_csv(path, section, sections[section].items())
+            file_versions[path] = file_version(path)
+    get_journal().truncate()
+
+def compact_data(data):
+    """로그 내용을 CSV 스냅샷으로 합치고 로그 비우기"""
+    flush_writes()
+    _apply(data, _compact_journal)
+
+def _compact_journal(data):
+    journal = get_journal()
+    with FileLock(journal.path):
+        journal.sync()
+        # 다른 세션이 남긴 로그까지 합치기 위해 디스크에서 다시 읽음
+        sections = _load_snapshots(data.file_versions)
+        _replay_journal(sections)
+        _compact(sections, data.file_versions)
+    for section in SECTIONS:
+        _merge_from_disk(data, section, sections[section], set(), list(dict.items(data[section])))
+    data.clear_dirty()
+
+def _merge_from_disk(data, section, disk_entries, dirty_dates, scope_items):
+    """디스크 내용 중 이 세션이 바꾸지 않은 날짜를 메모리에 반영
+
+    scope_items는 해당 파일에 속하는 메모리 항목 (날짜, 값) 목록이다.
+    """
+    current = data[section]
+    for key, value in disk_entries.items():
+        old = dict.get(current, key)
+        if key not in dirty_dates and old != value:
+            # 변경 표시 없이 반영 (다른 세션이 이미 저장한 내용)
+            dict.__setitem__(current, key, value)
+            data.notify(section, key, old, value)
+    for key, old in scope_items:
+        if key not in disk_entries and key not in dirty_dates:
+            dict.__delitem__(current, key)
+            data.notify(section, key, old, None)
+
+def _write_changes(data):
+    """변경된 날짜를 저장소에 기록
+
+    다른 세션이 같은 날짜를 먼저 저장했으면 이 세션이 바꾼 기록/항목만 그 위에
+    병합한다. 반환: (저장한 값 {section: {date: value}}, 새 파일 버전 {path: version})
+    """
+    dirty_sections = data.dirty_sections()
+    saved = {}
+    versions = {}
+    if STORAGE_MODE == 'journal':
+        # 변경 사항은 이미 로그에 기록됨 - 배치 단위로만 동기화
+        get_journal().flush()
+        return {
+            section: {date: dict.get(data[section], date) for date in dates}
+            for section, dates in dirty_sections.items()
+        }, versions
+    if STORAGE_MODE == 'sqlite':
+        def merge(section, date, stored):
+            return merge_entry(section, data[section].base.get(date), data[section].get(date), stored)
+        return sqlite_store.save(data, dirty_sections, _db_path(), merge), versions
+
+    for section, dates in dirty_sections.items():
+        section_saved = saved.setdefault(section, {})
+        if STORAGE_MODE == 'partitioned':
+            # 변경된 날짜가 속한 월 파티션만 다시 쓰기
+            for month in sorted({month_of(date) for date in dates}):
+                _save_file(
+                    data, partition_path(month, section), section,
+                    {date for date in dates if month_of(date) == month},
+                    data[section].month_items(month), section_saved, versions
+                )
+        else:
+            _save_file(
+                data, _snapshot_files()[section], section, dates,
+                list(dict.items(data[section])), section_saved, versions
+            )
+    return saved, versions
+
+def _save_file(data, path, section, dirty_dates, scope_items, saved, versions):
+    """잠금을 잡고 파일 하나를 원자적으로 저장
+
+    scope_items는 해당 파일에 속하는 메모리 항목 (날짜, 값) 목록이다. 마지막으로
+    읽거나 쓴 뒤 다른 세션이 파일을 바꿨다면 디스크 내용 위에 이 세션이 바꾼
+    날짜의 변경분만 병합하고, 나머지 날짜는 디스크 내용을 따른다.
+    저장한 값은 saved에, 새 파일 버전은 versions에 기록한다.
+    """
+    entries = dict(scope_items)
+    result = {}
+    with FileLock(path):
+        if data.file_versions.get(path) != file_version(path):
+            disk_entries = _frame_to_section(section, _read_frame(path, section))
+            base = data[section].base
+            for key in disk_entries.keys() | entries.keys() | dirty_dates:
+                if key in dirty_dates:
+                    result[key] = merge_entry(section, base.get(key), entries.get(key), disk_entries.get(key))
+                else:
+                    result[key] = disk_entries.get(key)
+        else:
+            for key in dirty_dates:
+                result[key] = entries.get(key)
+        entries.update(result)
+        _write_frame(path, section, [(key, value) for key, value in sorted(entries.items()) if value is not None])
+        versions[path] = file_version(path)
+    saved.update(result)
+
+def _publish(data, written, saved, versions):
+    """저장한 값을 메모리에 반영하고, 그 값 그대로 저장된 날짜의 변경 표시를 지움
+
+    written은 저장할 때 읽은 데이터다. 그 뒤에 다시 바뀐 날짜는 변경 표시를
+    남겨 두고, 방금 저장한 값을 기준으로 다시 병합해 다음 저장에 맡긴다.
+    """
+    data.file_versions.update(versions)
+    for section, entries in saved.items():
+        current, before = data[section], written[section]
+        for key, value in entries.items():
+            old = dict.get(current, key)
+            if key in current.dirty and old is not dict.get(before, key):
+                value = merge_entry(section, dict.get(before, key), old, value)
+                current.base[key] = entries[key]
+            else:
+                current.mark_clean(key)
+            if value is None:
+                dict.pop(current, key, None)
+            else:
+                dict.__setitem__(current, key, value)
+            if old != value:
+                data.notify(section, key, old, value)
+
+def _section_records(section, entries):
+    """(날짜, 값) 목록을 CSV 행 목록으로 변환"""
+    records = []
+    if section == 'checklist':
+        for date, items in entries:
+            for item_id, checked in items.items():
+                records.append({
                     'date': date,
-                    'activity_type': activity_type,
-                    'hours': record['hours'],
-                    'memo': record['memo'],
-                    'timestamp': record['timestamp']
+                    'item_id': item_id,
+                    'checked': checked
                 })
-    
-    if activity_records:
-        activities_df = pd.DataFrame(activity_records)
-        activities_df.to_csv('data/activities_data.csv', index=False)
-
-    review_records = []
-    for date, review in data['reviews'].items():
-        review_records.append({
-            'date': date,
-            'content': review['content'],
-            'timestamp': review['timestamp']
+    elif section == 'activities':
+        for date, activities in entries:
+            for activity_type, activity_records in activities.items():
+                for record in activity_records:
+                    records.append({
+                        'date': date,
+                        'activity_type': activity_type,
+                        'hours': record['hours'],
+                        'memo': record['memo'],
+                        'timestamp': record['timestamp']
+                    })
+    elif section == 'reviews':
+        for date, review in entries:
+            records.append({
+                'date': date,
+                'content': review['content'],
+                'timestamp': review['timestamp']
+            })
+    return records
+
+def _write_csv(path, section, entries):
+    df = pd.DataFrame(_section_records(section, entries), columns=COLUMNS[section])
+    atomic_write(path, lambda f: df.to_csv(f, index=False))
+
+def _write_frame(path, section, entries):
+    if path.endswith('.arrow'):
+        columnar.write_table(path, section, _section_records(section, entries))
+    else:
+        _write_csv(path, section, entries)
+
+def migrate_to_partitions():
+    """기존 CSV 스냅샷을 월별 파티션으로 나누어 저장"""
+    for section in SECTIONS:
+        entries = _frame_to_section(section, _read_csv(_csv_files()[section], section))
+        by_month = {}
+        for date, value in entries.items():
+            by_month.setdefault(month_of(date), []).append((date, value))
+        for month, month_entries in by_month.items():
+            _write_csv(partition_path(month, section), section, month_entries)
+
+def migrate_to_sqlite(db_path=None):
+    """기존 CSV 스냅샷을 SQLite 파일로 옮기기"""
+    db_path = db_path or _db_path()
+    os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+    data = {
+        section: _frame_to_section(section, _read_csv(_csv_files()[section], section))
+        for section in SECTIONS
+    }
+    sqlite_store.save(data, {section: set(data[section]) for section in SECTIONS}, db_path)
+    return len(set().union(*(data[section] for section in SECTIONS)))
+
+def _convert_snapshots(sources, targets):
+    """섹션별 스냅샷 파일을 다른 형식으로 옮기기 (CSV <-> Arrow)"""
+    dates = set()
+    for section in SECTIONS:
+        entries = _frame_to_section(section, _read_frame(sources[section], section))
+        with FileLock(targets[section]):
+            _write_frame(targets[section], section, entries.items())
+        dates.update(entries)
+    return len(dates)
+
+def migrate_to_arrow():
+    """기존 CSV 스냅샷을 Arrow 스냅샷으로 옮기기"""
+    return _convert_snapshots(_csv_files(), _arrow_files())
+
+def export_to_csv():
+    """Arrow 스냅샷을 CSV 스냅샷으로 내보내기"""
+    return _convert_snapshots(_arrow_files(), _csv_files())
+
+def iter_activity_chunks(columns=None, chunksize=CHUNK_ROWS):
+    """활동 기록을 chunksize 행씩 DataFrame으로 순회 (전체를 한 번에 올리지 않음)"""
+    columns = list(columns or COLUMNS['activities'])
+    if STORAGE_MODE == 'sqlite':
+        for rows in sqlite_store.iter_activities(columns, chunksize, _db_path()):
+            yield pd.DataFrame(rows, columns=columns)
+        return
+    if STORAGE_MODE == 'arrow':
+        yield from columnar.iter_frames(_arrow_files()['activities'], columns, chunksize)
+        return
+    if STORAGE_MODE == 'journal' and _journal_pending():
+        # 아직 스냅샷에 합쳐지지 않은 변경 로그가 있으면 재생한 결과를 나눠서 반환
+        batch, rows = [], 0
+        for date, day in sorted(_journal_sections()['activities'].items()):
+            batch.append((date, day))
+            rows += len(day['study']) + len(day['break'])
+            if rows >= chunksize:
+                yield pd.DataFrame(_section_records('activities', batch), columns=COLUMNS['activities'])[columns]
+                batch, rows = [], 0
+        if batch:
+            yield pd.DataFrame(_section_records('activities', batch), columns=COLUMNS['activities'])[columns]
+        return
+    if STORAGE_MODE == 'partitioned':
+        paths = [partition_path(month, 'activities') for month in list_months()]
+    else:
+        paths = [_csv_files()['activities']]
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        count_file_read(path)
+        yield from pd.read_csv(
+            path, dtype=DTYPES['activities'], keep_default_na=False, usecols=columns, chunksize=chunksize
+        )
+
+def iter_saved_activities(data, columns=None, chunksize=CHUNK_ROWS):
+    """세션의 변경을 저장한 뒤 디스크의 활동 기록을 청크 단위로 순회 (내보내기용)
+
+    메모리 섹션을 순회하지 않으므로 partitioned 모드에서도 모든 월을 공유
+    저장소에 올리지 않는다. 순서는 저장소 순서(날짜 오름차순)다.
+    """
+    save_data(data)
+    flush_writes()
+    return iter_activity_chunks(columns, chunksize)
+
+def _fold_summary(by_month):
+    """청크마다 날짜(또는 월)/유형별 합계를 구해 누적 [(key, study, break), ...]"""
+    totals = {}
+    for chunk in iter_activity_chunks(SUMMARY_COLUMNS):
+        keys = chunk['date'].str[:7] if by_month else chunk['date']
+        grouped = chunk['hours'].groupby([keys, chunk['activity_type']]).sum()
+        for (key, activity_type), hours in grouped.items():
+            row = totals.setdefault(key, [0.0, 0.0])
+            row[0 if activity_type == 'study' else 1] += hours
+    return [(key, study, rest) for key, (study, rest) in sorted(totals.items())]
+
+def _summary_frame(rows, index):
+    return pd.DataFrame(rows, columns=[index, 'study', 'break'])
+
+def _daily_rows():
+    # 집계는 SQLite의 GROUP BY / Arrow 열 연산으로 처리
+    if STORAGE_MODE == 'sqlite':
+        return sqlite_store.daily_summary(_db_path())
+    return columnar.daily_rows(_arrow_files()['activities'])
+
+def _journal_pending():
+    path = get_journal().path
+    return os.path.exists(path) and os.path.getsize(path) > 0
+
+def _journal_sections():
+    # 아직 스냅샷에 합쳐지지 않은 변경 로그까지 읽기 전용으로 재생
+    sections = _load_snapshots({})
+    _replay_journal(sections)
+    return sections
+
+def _journal_daily_rows():
+    return [
+        (date, day.study_total, day.break_total)
+        for date, day in sorted(_journal_sections()['activities'].items()) if not day.is_empty()
+    ]
+
+def daily_summary():
+    """날짜별 학습/휴식 합계 (date, study, break)"""
+    if STORAGE_MODE in ('sqlite', 'arrow'):
+        summary = _summary_frame(_daily_rows(), 'date')
+    elif STORAGE_MODE == 'journal':
+        summary = _summary_frame(_journal_daily_rows(), 'date')
+    else:
+        summary = _summary_frame(_fold_summary(by_month=False), 'date')
+    summary['date'] = pd.to_datetime(summary['date'])
+    return summary.sort_values('date')
+
+def monthly_summary():
+    """월별 학습/휴식 합계 (month, study, break)"""
+    if STORAGE_MODE == 'sqlite':
+        summary = _summary_frame(sqlite_store.monthly_summary(_db_path()), 'month')
+    elif STORAGE_MODE == 'arrow':
+        summary = _summary_frame(columnar.monthly_rows(_arrow_files()['activities']), 'month')
+    else:
+        summary = _summary_frame(_fold_summary(by_month=True), 'month')
+    return summary.sort_values('month')
+
+def _log(op, **fields):
+    if STORAGE_MODE == 'journal':
+        get_journal().append(op, **fields)
+
+def _apply_journal_entry(data, entry):
+    # 체크리스트는 항목 하나, 활동은 빠진/추가된 기록만 담고 있어 여러 세션이
+    # 같은 날짜를 바꿔도 로그 순서대로 재생하면 양쪽 변경이 모두 남음
+    date = entry['date']
+    if entry['op'] == 'checklist':
+        items = dict(data['checklist'].get(date, {}))
+        items[entry['item_id']] = entry['checked']
+        data['checklist'][date] = items
+    elif entry['op'] == 'activities':
+        day = compact_day(data['activities'].get(date))
+        activity_type = entry['activity_type']
+        if 'records' in entry:
+            # 이전 형식: 변경 후의 전체 목록
+            records = entry['records']
+        else:
+            records = apply_record_changes(day[activity_type], entry['removed'], entry['added'])
+        data['activities'][date] = day.replace(activity_type, records)
+    elif entry['op'] == 'review':
+        data['reviews'][date] = {
+            'content': entry['content'],
+            'timestamp': entry['timestamp']
+        }
+
+def _replace_entry(data, section, date_key, value):
+    # 날짜 항목을 새 객체로 교체해 섹션이 변경을 감지하도록 하고 파생 데이터에 알림
+    old = data[section].get(date_key)
+    data[section][date_key] = value
+    data.notify(section, date_key, old, value)
+
+def set_checklist_item(data, date_key, item_id, checked):
+    # 기록이 없는 항목은 체크 해제로 보므로, 날짜만 골라도 False가 저장되지 않음
+    if _snapshot(data)['checklist'].get(date_key, {}).get(item_id, False) == checked:
+        return
+
+    def mutate(data):
+        items = data['checklist'].get(date_key, {})
+        _replace_entry(data, 'checklist', date_key, {**items, item_id: checked})
+        _log('checklist', date=date_key, item_id=item_id, checked=bool(checked))
+    _apply(data, mutate)
+
+def _replace_activities(data, date_key, activity_type, update_records):
+    def mutate(data):
+        old = compact_day(data['activities'].get(date_key))
+        day = old.replace(activity_type, update_records(old[activity_type]))
+        _replace_entry(data, 'activities', date_key, day)
+        removed, added = record_changes(old[activity_type], day[activity_type])
+        _log('activities', date=date_key, activity_type=activity_type, removed=removed, added=added)
+    _apply(data, mutate)
+
+def add_activity(data, date_key, activity_type, hours, memo, timestamp):
+    _replace_activities(data, date_key, activity_type, lambda records: records + (
+        ActivityRecord(hours, memo, timestamp),
+    ))
+
+def reset_activities(data, date_key, activity_type):
+    _replace_activities(data, date_key, activity_type, lambda records: ())
+
+def import_activities(data, records):
+    """여러 기록을 한 번의 변경으로 추가 (같은 날짜/유형/시각의 기록이 있으면 건너뜀)
+
+    records는 (date, activity_type, hours, memo, timestamp) 목록이다. 날짜마다
+    한 번만 교체하므로 저장은 save_data 한 번(파일 재작성/트랜잭션 한 번)으로 끝난다.
+    반환: (추가한 수, 이미 있어 건너뛴 수)
+    """
+    by_day = {}
+    for date_key, activity_type, hours, memo, timestamp in records:
+        by_day.setdefault(date_key, {'study': [], 'break': []})[activity_type].append(
+            ActivityRecord(hours, memo, timestamp)
+        )
+
+    def mutate(data):
+        added = skipped = 0
+        for date_key in sorted(by_day):
+            old = compact_day(data['activities'].get(date_key))
+            day = old
+            for activity_type, new_records in by_day[date_key].items():
+                timestamps = {record['timestamp'] for record in day[activity_type]}
+                fresh = []
+                for record in new_records:
+                    if record['timestamp'] in timestamps:
+                        skipped += 1
+                        continue
+                    timestamps.add(record['timestamp'])
+                    fresh.append(record)
+                if fresh:
+                    day = day.replace(activity_type, day[activity_type] + tuple(fresh))
+                    _log('activities', date=date_key, activity_type=activity_type,
+                         removed=[], added=[record.to_dict() for record in fresh])
+                    added += len(fresh)
+            if day is not old:
+                _replace_entry(data, 'activities', date_key, day)
+        return added, skipped
+    return _apply(data, mutate)
+
+def set_review(data, date_key, content, timestamp):
+    review = _snapshot(data)['reviews'].get(date_key)
+    if review is not None and review['content'] == content:
+        return
+
+    def mutate(data):
+        _replace_entry(data, 'reviews', date_key, {
+            'content': content,
+            'timestamp': timestamp
         })
-    
-    if review_records:
-        reviews_df = pd.DataFrame(review_records)
-        reviews_df.to_csv('data/reviews_data.csv', index=False)
+        _log('review', date=date_key, content=content, timestamp=timestamp)
+    _apply(data, mutate)
+
+def get_aggregates(data):
+    """분석 페이지용 날짜별/월별 합계 (처음 한 번 만든 뒤 변경 시 증분 갱신)"""
+    data = _snapshot(data)
+    aggregates = data.views.get('aggregates')
+    if aggregates is None:
+        if STORAGE_MODE in ('sqlite', 'arrow', 'partitioned'):
+            # 저장된 합계는 SQL/열 연산/파티션 파일 청크로 구하고 (월 파티션을 메모리에 올리지 않음)
+            with use_root(data.root):
+                rows = _fold_summary(by_month=False) if STORAGE_MODE == 'partitioned' else _daily_rows()
+            aggregates = ActivityAggregates.from_daily_rows(rows)
+            # 아직 저장하지 않은 날짜만 메모리 값으로 덮어씀
+            activities = data['activities']
+            for date in sorted(activities.dirty):
+                aggregates.on_change('activities', date, None, activities.get(date))
+        else:
+            aggregates = ActivityAggregates.from_activities(data['activities'])
+        data.add_view('aggregates', aggregates)
+    return aggregates
+
+def get_calendar_index(data):
+    """캘린더용 월별 날짜 요약 (해당 월이 바뀔 때만 다시 계산)"""
+    data = _snapshot(data)
+    return data.views.get('calendar_index') or data.add_view('calendar_index', CalendarIndex(
+        data, _month_partition_version if STORAGE_MODE == 'partitioned' else None
+    ))
+
+def _month_partition_version(data, month):
+    """월 파티션 파일 버전 (읽었거나 저장한 시점 값, 아직 읽지 않은 월은 현재 파일)"""
+    parts = []
+    with use_root(data.root):
+        for section in ('activities', 'reviews'):
+            path = partition_path(month, section)
+            version = data.file_versions[path] if path in data.file_versions else file_version(path)
+            parts.append('0' if version is None else f'{version[0]:x}.{version[1]:x}')
+    return '-'.join(parts)
+
+def get_activity_pager(data):
+    """상세 데이터 탭의 페이지 조회 (날짜 목록은 기록이 바뀔 때만 다시 만듦)"""
+    data = _snapshot(data)
+    pager = data.views.get('activity_pager')
+    if pager is None:
+        pager = data.add_view('activity_pager', ActivityPager(
+            data, _activity_counts if STORAGE_MODE == 'partitioned' else None
+        ))
+    return pager
+
+def _activity_counts(data):
+    """날짜별 활동 기록 수 (파티션 파일의 날짜 열만 세고, 저장 전 날짜는 메모리 값)"""
+    counts = {}
+    with use_root(data.root):
+        for chunk in iter_activity_chunks(['date']):
+            for date, count in chunk['date'].value_counts().items():
+                counts[date] = counts.get(date, 0) + int(count)
+    activities = data['activities']
+    for date in activities.dirty:
+        day = activities.get(date)
+        counts[date] = 0 if day is None else len(day['study']) + len(day['break'])
+    return counts.items()
+
+def get_goal_report(data):
+    """목표 달성 분석 (활동/체크리스트가 바뀔 때만 다시 계산)"""
+    data = _snapshot(data)
+    goals = data.views.get('goals') or data.add_view('goals', GoalAnalytics(data))
+    return goals.report(get_aggregates(data).daily_totals(), lambda: _checklist_frame(data))
+
+def _checklist_frame(data):
+    """목표 분석용 체크 기록 (partitioned는 월 파티션을 메모리에 올리지 않고 파일에서 읽음)"""
+    checklist = data['checklist']
+    if STORAGE_MODE != 'partitioned':
+        return checklist_frame(checklist)
+    with use_root(data.root):
+        frames = [_read_frame(partition_path(month, 'checklist'), 'checklist') for month in list_months()]
+    frames = [df for df in frames if df is not None]
+    disk = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=CHECKLIST_COLUMNS)
+    # 아직 저장하지 않은 날짜만 메모리 값으로 덮어씀
+    dirty = sorted(checklist.dirty)
+    memory = checklist_frame({date: checklist.get(date) or {} for date in dirty})
+    return pd.concat([disk[~disk['date'].isin(dirty)], memory], ignore_index=True).astype({'checked': bool})
+
+def get_range_index(data):
+    """임의 기간 합계/묶음/이동 평균/요일·스케줄 종류별 조회 (활동이 바뀔 때만 누적합을 다시 만듦)"""
+    data = _snapshot(data)
+    ranges = data.views.get('range_index') or data.add_view('range_index', RangeAnalytics(data))
+    return ranges.index(get_aggregates(data).daily_totals())
+
+def search_records(data, query, limit=50):
+    """메모와 총평에서 검색어의 모든 단어가 들어 있는 날짜 (최신순)"""
+    data = _snapshot(data)
+    index = data.views.get('search_index') or data.add_view(
+        'search_index', SearchIndex(data, os.path.join(data.root, INDEX_DIR))
+    )
+    return index.search(query, limit)
 
+@profiled()
 def backup_data():
-    backup_dir = 'backup'
-    os.makedirs(backup_dir, exist_ok=True)
-    backup_time = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    for filename in ['checklist_data.csv', 'activities_data.csv', 'reviews_data.csv']:
-        if os.path.exists(f'data/{filename}'):
-            df = pd.read_csv(f'data/{filename}')
-            df.to_csv(f'{backup_dir}/{filename.split(".")[0]}_{backup_time}.csv', index=False)
+    """data/ 전체의 증분 스냅샷 생성 (바뀐 청크만 backup/objects/에 추가)"""
+    flush_writes()
+    if STORAGE_MODE == 'sqlite':
+        sqlite_store.checkpoint(_db_path())
+    return backup.create_snapshot(shard_path(backup.DATA_DIR), shard_path(backup.BACKUP_DIR))
 
 def get_day_type(date):
-    day = date.weekday()
-    if day == 6:  # Sunday
-        return 'sunday'
-    elif day == 5:  # Saturday
-        return 'saturday'
-    elif day in [0, 2, 4]:  # Monday, Wednesday, Friday
-        return 'mwf'
-    else:  # Tuesday, Thursday
-        return 'tt'
+    """날짜의 스케줄 종류 (config/schedules.json의 요일 표와 예외를 따름)"""
+    return get_schedule_book().day_type(date)
 
 def format_time_display(total_hours):
     hours = int(total_hours)
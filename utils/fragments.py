@@ -0,0 +1,35 @@
+"""부분 rerun(프래그먼트) 지원
+
+st.fragment로 감싼 섹션 안의 위젯을 누르면 그 섹션만 다시 실행된다
+(Streamlit 1.37 이상, requirements.txt 참고).
+
+데이터를 바꾸는 조작은 콜백에서 request_app_rerun()을 호출해 두고,
+프래그먼트 본문 끝에서 finish_fragment()를 호출하면 캘린더/분석 등 다른
+섹션도 갱신되도록 전체 rerun으로 이어진다.
+"""
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+_APP_RERUN_KEY = '_app_rerun_requested'
+
+fragment = st.fragment
+
+
+def request_app_rerun():
+    """다른 섹션에도 보이는 데이터가 바뀌었음을 표시 (위젯 콜백 안에서 호출)"""
+    st.session_state[_APP_RERUN_KEY] = True
+
+
+def _in_fragment_run():
+    """프래그먼트만 다시 실행 중인지 (전체 실행 중이면 False)"""
+    ctx = get_script_run_ctx()
+    return bool(ctx and ctx.script_requests and ctx.script_requests.fragment_id_queue)
+
+
+def finish_fragment():
+    """프래그먼트 본문 끝에서 호출: 전체 rerun 요청이 있으면 실행
+
+    스크립트 전체가 실행 중이면 나머지 섹션도 이번 실행에서 그려지므로 요청만 지운다.
+    """
+    if st.session_state.pop(_APP_RERUN_KEY, False) and _in_fragment_run():
+        st.rerun()
@@ -0,0 +1,189 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from utils.activity_store import EPOCH_ORDINAL
+from utils.schedule import get_schedule_book
+
+# 평가 결과 (체크리스트 페이지의 evaluate_study/evaluate_break와 같은 기준)
+STUDY_STATUSES = ['GOOD', 'BAD', '미입력']
+BREAK_STATUSES = ['NORMAL', 'WARNING', 'EMERGENCY']
+
+CHECKLIST_COLUMNS = ['date', 'item_id', 'checked']
+
+
+def _runs(flags):
+    """True가 연속된 구간들의 (길이 배열, 끝 위치 배열)"""
+    padded = np.concatenate(([0], flags.astype(np.int8), [0]))
+    edges = np.flatnonzero(np.diff(padded))
+    starts, ends = edges[::2], edges[1::2]
+    return ends - starts, ends
+
+
+def _rate(good, bad):
+    attempted = good + bad
+    return np.divide(good, attempted, out=np.zeros(len(attempted)), where=attempted > 0)
+
+
+def evaluate_days(totals, book):
+    """첫 기록일부터 마지막 기록일까지 하루 단위 평가 DataFrame
+
+    기록이 없는 날은 학습/휴식 0시간으로 보고 연속 달성 계산에 포함한다.
+    """
+    first, last = (int(totals.ordinals[0]), int(totals.ordinals[-1])) if len(totals) else (0, -1)
+    ordinals = np.arange(first, last + 1, dtype=np.int64)
+    study = np.zeros(len(ordinals))
+    rest = np.zeros(len(ordinals))
+    study[totals.ordinals - first] = totals.study
+    rest[totals.ordinals - first] = totals.rest
+    day_types, targets = book.resolve_ordinals(ordinals)
+
+    limits = book.break_limits
+    study_codes = np.select([study >= targets, study > 0], [0, 1], 2)
+    break_codes = np.select([rest > limits['emergency'], rest > limits['warning']], [2, 1], 0)
+    return pd.DataFrame({
+        'date': (ordinals - EPOCH_ORDINAL).astype('datetime64[D]'),
+        'day_type': day_types,
+        'target': targets,
+        'study': study,
+        'break': rest,
+        'study_status': pd.Categorical.from_codes(study_codes, categories=STUDY_STATUSES),
+        'break_status': pd.Categorical.from_codes(break_codes, categories=BREAK_STATUSES)
+    })
+
+
+def checklist_frame(checklist):
+    """{날짜: {항목 id: 체크}} -> (date, item_id, checked) DataFrame"""
+    rows = [(date, item_id, checked) for date, items in checklist.items() for item_id, checked in items.items()]
+    return pd.DataFrame(rows, columns=CHECKLIST_COLUMNS).astype({'checked': bool})
+
+
+def _record_range(totals, checklist):
+    """활동 또는 체크리스트 기록이 있는 첫 날~마지막 날 (날짜 서수)"""
+    bounds = []
+    if len(totals):
+        bounds += [int(totals.ordinals[0]), int(totals.ordinals[-1])]
+    if len(checklist):
+        bounds += [date.fromisoformat(checklist['date'].min()).toordinal(),
+                   date.fromisoformat(checklist['date'].max()).toordinal()]
+    return (min(bounds), max(bounds)) if bounds else (0, -1)
+
+
+def checklist_completion(checklist, book, first, last):
+    """항목별 체크 비율
+
+    분모는 first~last(날짜 서수) 중 그 항목이 스케줄에 있던 날 수, 분자는 그중
+    체크한 날 수다. 체크리스트를 열어 보기만 한 날은 저장되지 않으므로 스케줄로 센다.
+    """
+    columns = ['item_id', 'label', 'checked', 'days', 'ratio']
+    if last < first:
+        return pd.DataFrame(columns=columns)
+    day_types, _ = book.resolve_ordinals(np.arange(first, last + 1, dtype=np.int64))
+    type_days = np.bincount(day_types.codes, minlength=len(book.names))
+    scheduled = set()
+    days = {}
+    for name, count in zip(book.names, type_days):
+        for item in book.day_types[name]['items']:
+            scheduled.add((name, item['id']))
+            days[item['id']] = days.get(item['id'], 0) + int(count)
+
+    checked = checklist[checklist['checked'].astype(bool)]
+    if len(checked):
+        checked_types, _ = book.resolve_dates(checked['date'])
+        on_schedule = [pair in scheduled for pair in zip(checked_types, checked['item_id'])]
+        counts = checked[on_schedule].groupby('item_id').size()
+    else:
+        counts = pd.Series(dtype=np.int64)
+
+    labels = book.item_labels()
+    result = pd.DataFrame({'item_id': list(days), 'days': list(days.values())})
+    result = result[result['days'] > 0]
+    result['checked'] = result['item_id'].map(counts).fillna(0).astype(int)
+    result['label'] = result['item_id'].map(labels).fillna(result['item_id'])
+    result['ratio'] = result['checked'] / result['days']
+    # 설정 파일에 적힌 순서대로
+    order = {item_id: index for index, item_id in enumerate(labels)}
+    result = result.sort_values('item_id', key=lambda ids: ids.map(order).fillna(len(order)))
+    return result[columns].reset_index(drop=True)
+
+
+def build_report(totals, checklist, book):
+    """checklist: checklist_frame() 형식의 체크 기록"""
+    days = evaluate_days(totals, book)
+    status = days['study_status'].cat.codes.to_numpy()
+    break_status = days['break_status'].cat.codes.to_numpy()
+    good = status == 0
+    lengths, ends = _runs(good)
+
+    by_type = days.assign(
+        good=good, bad=status == 1, missing=status == 2
+    ).groupby('day_type', observed=False).agg(
+        days=('date', 'count'),
+        good=('good', 'sum'), bad=('bad', 'sum'), missing=('missing', 'sum')
+    ).reset_index()
+    by_type.insert(1, 'target', [book.day_types[name]['target_study_hours'] for name in by_type['day_type']])
+    by_type['rate'] = _rate(by_type['good'].to_numpy(), by_type['bad'].to_numpy())
+
+    monthly = days.assign(
+        month=days['date'].dt.strftime('%Y-%m'),
+        good=good, bad=status == 1,
+        warning=break_status == 1, emergency=break_status == 2
+    ).groupby('month').agg(
+        good=('good', 'sum'), bad=('bad', 'sum'),
+        warning=('warning', 'sum'), emergency=('emergency', 'sum')
+    ).reset_index()
+    monthly['rate'] = _rate(monthly['good'].to_numpy(), monthly['bad'].to_numpy())
+
+    good_days = int(good.sum())
+    bad_days = int((status == 1).sum())
+    return {
+        'days': days,
+        'overall': {
+            'good': good_days,
+            'bad': bad_days,
+            'missing': int((status == 2).sum()),
+            'rate': good_days / (good_days + bad_days) if good_days + bad_days else 0.0,
+            'longest_streak': int(lengths.max()) if len(lengths) else 0,
+            # 마지막 기록일까지 이어지는 연속 달성
+            'current_streak': int(lengths[-1]) if len(ends) and ends[-1] == len(good) else 0,
+            'warning': int((break_status == 1).sum()),
+            'emergency': int((break_status == 2).sum())
+        },
+        'by_day_type': by_type,
+        'monthly': monthly,
+        'checklist': checklist_completion(checklist, book, *_record_range(totals, checklist))
+    }
+
+
+class GoalAnalytics:
+    """전체 기간의 목표 달성 분석
+
+    활동이나 체크리스트가 바뀌면 결과를 버리고 다음 조회 때 다시 계산한다.
+    """
+
+    SECTIONS = ('activities', 'checklist')
+
+    def __init__(self, data):
+        self.data = data
+        self._report = None
+
+    def copy(self, data):
+        new = GoalAnalytics(data)
+        new._report = self._report
+        return new
+
+    def on_change(self, section, key, old, new):
+        if section in ('activities', 'checklist'):
+            self._report = None
+
+    def report(self, totals, read_checklist=None):
+        """totals: 날짜별 합계 (ActivityAggregates.daily_totals())
+
+        read_checklist()는 checklist_frame() 형식의 체크 기록을 돌려준다 (다시 계산할
+        때만 호출, 없으면 메모리의 체크리스트 섹션 전체를 사용).
+        """
+        if self._report is None:
+            checklist = read_checklist() if read_checklist else checklist_frame(self.data['checklist'])
+            self._report = build_report(totals, checklist, get_schedule_book())
+        return self._report
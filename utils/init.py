@@ -1,4 +1,20 @@
 # utils/__init__.py
-from .data_manager import load_data, save_data, backup_data, get_day_type, format_time_display
+from .data_manager import (
+    load_data, save_data, flush_writes, writer_status, backup_data, compact_data,
+    get_day_type, format_time_display,
+    set_checklist_item, add_activity, reset_activities, set_review, import_activities,
+    iter_activity_chunks, iter_saved_activities, daily_summary, monthly_summary,
+    get_aggregates, get_calendar_index, get_activity_pager, get_goal_report,
+    get_range_index, search_records,
+    migrate_to_partitions, migrate_to_sqlite, migrate_to_arrow, export_to_csv
+)
 
-__all__ = ['load_data', 'save_data', 'backup_data', 'get_day_type', 'format_time_display']
+__all__ = [
+    'load_data', 'save_data', 'flush_writes', 'writer_status', 'backup_data', 'compact_data',
+    'get_day_type', 'format_time_display',
+    'set_checklist_item', 'add_activity', 'reset_activities', 'set_review', 'import_activities',
+    'iter_activity_chunks', 'iter_saved_activities', 'daily_summary', 'monthly_summary',
+    'get_aggregates', 'get_calendar_index', 'get_activity_pager', 'get_goal_report',
+    'get_range_index', 'search_records',
+    'migrate_to_partitions', 'migrate_to_sqlite', 'migrate_to_arrow', 'export_to_csv'
+]
@@ -0,0 +1,97 @@
+import json
+import os
+import threading
+import time
+
+from utils.safe_io import FileLock
+from utils.profiling import count_written, count_file_read
+
+JOURNAL_PATH = 'data/journal.jsonl'
+
+# fsync 배치 기준: 이 개수만큼 쌓이거나 이 시간(초)이 지나면 디스크에 동기화
+FSYNC_BATCH_SIZE = 20
+FSYNC_INTERVAL = 2.0
+
+
+class Journal:
+    """변경 사항을 한 줄씩 덧붙이는 append-only 로그"""
+
+    def __init__(self, path=JOURNAL_PATH, batch_size=FSYNC_BATCH_SIZE, interval=FSYNC_INTERVAL):
+        self.path = path
+        self.batch_size = batch_size
+        self.interval = interval
+        self._file = None
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        # 같은 프로세스의 세션들이 하나의 파일 객체를 공유하므로 스레드 간 직렬화
+        self._lock = threading.RLock()
+
+    def _open(self):
+        if self._file is None or self._file.closed:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        return self._file
+
+    def append(self, op, **fields):
+        entry = {'op': op, **fields}
+        # 여러 세션이 같은 로그에 쓰므로 한 줄씩 잠금 안에서 파일까지 내보냄
+        with FileLock(self.path), self._lock:
+            f = self._open()
+            line = json.dumps(entry, ensure_ascii=False) + '\n'
+            f.write(line)
+            f.flush()
+            count_written(len(line.encode('utf-8')))
+            self._pending += 1
+            if self._pending >= self.batch_size:
+                self.sync()
+
+    def flush(self):
+        """배치 주기가 지났으면 fsync"""
+        with self._lock:
+            if self._pending and time.monotonic() - self._last_sync >= self.interval:
+                self.sync()
+
+    def sync(self):
+        with self._lock:
+            if self._file is None or self._file.closed:
+                return
+            self._file.flush()
+            if self._pending:
+                os.fsync(self._file.fileno())
+            self._pending = 0
+            self._last_sync = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None and not self._file.closed:
+                self.sync()
+                self._file.close()
+            self._file = None
+
+    def truncate(self):
+        """스냅샷에 반영된 로그 비우기"""
+        with self._lock:
+            self.close()
+            if os.path.exists(self.path):
+                # 다른 프로세스가 append 모드로 열어 둔 파일도 유효하도록 제자리에서 비움
+                with open(self.path, 'w', encoding='utf-8') as f:
+                    f.flush()
+                    os.fsync(f.fileno())
+
+    def __len__(self):
+        return sum(1 for _ in read_entries(self.path))
+
+
+def read_entries(path=JOURNAL_PATH):
+    """로그 항목 순회 (쓰다 만 마지막 줄은 무시)"""
+    if not os.path.exists(path):
+        return
+    count_file_read(path)
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.endswith('\n'):
+                break
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                break
@@ -0,0 +1,91 @@
+"""같은 날짜를 여러 세션이 바꿨을 때의 3-way 병합
+
+base는 이 세션이 마지막으로 읽거나 저장한 값, mine은 이 세션의 현재 값,
+theirs는 저장소(다른 세션이 저장한 결과)의 값이다. 이 세션이 base에서
+바꾼 부분만 theirs 위에 적용한다.
+
+- 활동: 기록 단위 (유형, 시간, 메모, 시각이 같은 기록을 같은 기록으로 봄)
+- 체크리스트: 항목 단위
+- 총평: 날짜 단위 (이 세션이 바꿨으면 이 세션의 값)
+"""
+from collections import Counter
+
+from utils.activity_store import ACTIVITY_TYPES, ActivityDay, EMPTY_DAY
+
+
+def _key(record):
+    return (record['hours'], record['memo'], record['timestamp'])
+
+
+def _merge_records(base, mine, theirs):
+    removed = Counter(map(_key, base)) - Counter(map(_key, mine))
+    added = Counter(map(_key, mine)) - Counter(map(_key, base))
+    merged = []
+    for record in theirs:
+        key = _key(record)
+        if removed[key]:
+            removed[key] -= 1
+            continue
+        # 다른 세션이 같은 기록을 이미 저장했으면 한 번만
+        if added[key]:
+            added[key] -= 1
+        merged.append(record)
+    for record in mine:
+        key = _key(record)
+        if added[key]:
+            added[key] -= 1
+            merged.append(record)
+    return merged
+
+
+def _record_dicts(counter):
+    return [{'hours': hours, 'memo': memo, 'timestamp': timestamp} for hours, memo, timestamp in counter.elements()]
+
+
+def record_changes(before, after):
+    """before에서 after로 바뀔 때 (빠진 기록, 추가된 기록) - 저널에 기록 단위로 남기기 위함"""
+    before, after = Counter(map(_key, before)), Counter(map(_key, after))
+    return _record_dicts(before - after), _record_dicts(after - before)
+
+
+def apply_record_changes(records, removed, added):
+    """기록 목록에서 removed를 하나씩 빼고 added를 덧붙임 (저널 재생용)"""
+    return _merge_records(removed, (), records) + list(added)
+
+
+def merge_activities(base, mine, theirs):
+    base, mine, theirs = base or EMPTY_DAY, mine or EMPTY_DAY, theirs or EMPTY_DAY
+    day = ActivityDay(*(
+        _merge_records(base[activity_type], mine[activity_type], theirs[activity_type])
+        for activity_type in ACTIVITY_TYPES
+    ))
+    return None if day.is_empty() else day
+
+
+def merge_checklist(base, mine, theirs):
+    base, mine = base or {}, mine or {}
+    items = dict(theirs or {})
+    for item_id in base.keys() | mine.keys():
+        if base.get(item_id) == mine.get(item_id):
+            continue
+        if item_id in mine:
+            items[item_id] = mine[item_id]
+        else:
+            items.pop(item_id, None)
+    return items or None
+
+
+def merge_review(base, mine, theirs):
+    return theirs if mine == base else mine
+
+
+MERGERS = {
+    'activities': merge_activities,
+    'checklist': merge_checklist,
+    'reviews': merge_review
+}
+
+
+def merge_entry(section, base, mine, theirs):
+    """섹션 항목 하나의 병합 결과 (항목이 없어지면 None)"""
+    return MERGERS[section](base, mine, theirs)
@@ -0,0 +1,117 @@
+import os
+import threading
+
+from utils.tracking import TrackedSection
+from utils.tenancy import shard_path
+
+# 월별 파티션 위치: data/months/2025-01/activities.csv
+PARTITION_ROOT = 'data/months'
+
+
+def month_of(date_key):
+    return date_key[:7]
+
+
+def partition_path(month, section):
+    return os.path.join(shard_path(PARTITION_ROOT), month, f'{section}.csv')
+
+
+def list_months():
+    root = shard_path(PARTITION_ROOT)
+    if not os.path.isdir(root):
+        return []
+    return sorted(
+        name for name in os.listdir(root)
+        if os.path.isdir(os.path.join(root, name))
+    )
+
+
+class LazySection(TrackedSection):
+    """접근한 날짜가 속한 월의 파티션만 읽어 오는 섹션
+
+    loader(owner, section, month)는 해당 월의 {날짜: 값} dict를 돌려준다.
+    owner는 이 섹션을 가진 TrackedData다.
+    전체 순회(items, keys, len 등)를 할 때만 모든 파티션을 읽는다.
+    """
+
+    # 읽어 온 월을 owner의 파생 데이터에 알리므로 스냅샷마다 따로 복사
+    shareable = False
+
+    def __init__(self, section, loader):
+        super().__init__()
+        self.section = section
+        self.loader = loader
+        self.loaded_months = set()
+        self.owner = None
+        self._lock = threading.RLock()
+
+    def load_month(self, month):
+        if month in self.loaded_months:
+            return
+        with self._lock:
+            if month in self.loaded_months:
+                return
+            # 디스크에서 읽은 값은 변경으로 기록하지 않음
+            for key, value in self.loader(self.owner, self.section, month).items():
+                if not dict.__contains__(self, key):
+                    dict.__setitem__(self, key, value)
+            self.loaded_months.add(month)
+
+    def copy(self):
+        new = super().copy()
+        new.loaded_months = set(self.loaded_months)
+        return new
+
+    def load_all(self):
+        for month in list_months():
+            self.load_month(month)
+
+    def month_items(self, month):
+        """이미 읽어 둔 해당 월의 항목만 반환"""
+        self.load_month(month)
+        return [(key, value) for key, value in dict.items(self) if month_of(key) == month]
+
+    def __getitem__(self, key):
+        self.load_month(month_of(key))
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.load_month(month_of(key))
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        self.load_month(month_of(key))
+        return super().__contains__(key)
+
+    def __setitem__(self, key, value):
+        # 저장 시 월 파티션 전체를 다시 쓰므로 같은 월의 기존 항목을 먼저 읽어 둠
+        self.load_month(month_of(key))
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self.load_month(month_of(key))
+        super().__delitem__(key)
+
+    def pop(self, key, *default):
+        self.load_month(month_of(key))
+        return super().pop(key, *default)
+
+    def __iter__(self):
+        self.load_all()
+        return super().__iter__()
+
+    def __len__(self):
+        self.load_all()
+        return super().__len__()
+
+    def keys(self):
+        self.load_all()
+        return super().keys()
+
+    def values(self):
+        self.load_all()
+        return super().values()
+
+    def items(self):
+        self.load_all()
+        return super().items()
@@ -0,0 +1,186 @@
+"""rerun 단위 성능 계측 (PROFILING=1 일 때만 동작)
+
+한 번의 스크립트 실행 동안 구간별 시간, 디스크 읽기/쓰기 바이트,
+Streamlit 요소 개수를 모아 세션별 최근 기록에 남긴다.
+
+    with profiling.rerun(history):
+        with profiling.timed('render_calendar'):
+            ...
+"""
+import contextvars
+import csv
+import io
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+
+PROFILING = os.environ.get('PROFILING', '0') == '1'
+
+# 세션별로 보관하는 최근 rerun 기록 수
+HISTORY_SIZE = 50
+
+SUMMARY_FIELDS = ['started', 'total', 'elements', 'payload_bytes', 'bytes_read', 'bytes_written']
+
+# 세션마다 별도 스레드에서 스크립트가 실행되므로 현재 기록은 컨텍스트별로 유지
+_current = contextvars.ContextVar('rerun_profile', default=None)
+
+
+def new_history():
+    return deque(maxlen=HISTORY_SIZE)
+
+
+class RerunProfile:
+    def __init__(self):
+        self.started = datetime.now().isoformat(timespec='seconds')
+        self.total = 0.0
+        self.timings = {}
+        self.calls = {}
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.elements = 0
+        self.payload_bytes = 0
+
+    def add_time(self, name, seconds):
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def to_dict(self):
+        return {
+            'started': self.started,
+            'total': self.total,
+            'elements': self.elements,
+            'payload_bytes': self.payload_bytes,
+            'bytes_read': self.bytes_read,
+            'bytes_written': self.bytes_written,
+            'timings': dict(self.timings),
+            'calls': dict(self.calls)
+        }
+
+
+@contextmanager
+def rerun(history):
+    """스크립트 실행 한 번을 계측해 끝나면 history(deque)에 추가"""
+    if not PROFILING:
+        yield None
+        return
+    profile = RerunProfile()
+    token = _current.set(profile)
+    restore = _count_elements(profile)
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.total = time.perf_counter() - start
+        restore()
+        _current.reset(token)
+        history.append(profile.to_dict())
+
+
+@contextmanager
+def timed(name):
+    """현재 rerun 기록에 name 구간의 실행 시간 추가"""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_time(name, time.perf_counter() - start)
+
+
+def profiled(name=None):
+    """함수 실행 시간을 기록하는 데코레이터 (계측을 끄면 원래 함수 그대로)"""
+    def decorator(func):
+        if not PROFILING:
+            return func
+        label = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count_read(nbytes):
+    profile = _current.get()
+    if profile is not None:
+        profile.bytes_read += nbytes
+
+
+def count_written(nbytes):
+    profile = _current.get()
+    if profile is not None:
+        profile.bytes_written += nbytes
+
+
+def count_file_read(path):
+    if _current.get() is not None and os.path.exists(path):
+        count_read(os.path.getsize(path))
+
+
+def _count_elements(profile):
+    """브라우저로 보내는 메시지를 세도록 ScriptRunContext를 감싸고 복원 함수를 반환"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx(suppress_warning=True)
+    except ImportError:
+        ctx = None
+    if ctx is None or not hasattr(ctx, '_enqueue'):
+        return lambda: None
+
+    enqueue = ctx._enqueue
+
+    def counting_enqueue(msg):
+        if msg.HasField('delta') and msg.delta.HasField('new_element'):
+            profile.elements += 1
+        profile.payload_bytes += msg.ByteSize()
+        enqueue(msg)
+
+    ctx._enqueue = counting_enqueue
+
+    def restore():
+        ctx._enqueue = enqueue
+    return restore
+
+
+def _timing_names(history):
+    names = []
+    for record in history:
+        for name in record['timings']:
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def history_frame_rows(history):
+    """표/CSV용 평탄화된 행 목록 (구간 시간은 ms)"""
+    names = _timing_names(history)
+    rows = []
+    for record in history:
+        row = {field: record[field] for field in SUMMARY_FIELDS}
+        row['total'] = round(record['total'] * 1000, 2)
+        for name in names:
+            row[name] = round(record['timings'].get(name, 0.0) * 1000, 2)
+        rows.append(row)
+    return rows
+
+
+def export_json(history):
+    return json.dumps(list(history), ensure_ascii=False, indent=2)
+
+
+def export_csv(history):
+    rows = history_frame_rows(history)
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=SUMMARY_FIELDS + _timing_names(history))
+    writer.writeheader()
+    writer.writerows(rows)
+    return output.getvalue()
@@ -0,0 +1,199 @@
+"""임의 기간의 학습/휴식 시간 조회
+
+DailyTotals(기록이 있는 날만)를 첫 기록일부터 마지막 기록일까지 하루 한 칸의
+배열로 펼치고 누적합을 만들어 둔다. 어떤 기간의 합계든 누적합 두 값의
+차이라 O(1)이고, 요일별/스케줄 종류별 합계도 종류마다 누적합을 두어 같은
+방식으로 구한다. 주/월/N일 묶음과 이동 평균은 경계마다 누적합 차이를 구해
+Python 루프 없이 계산한다.
+
+기간은 date 또는 'YYYY-MM-DD'이고 양 끝을 포함한다. None이면 기록 범위의
+처음/끝이며, 기록 범위 밖의 날은 0으로 본다.
+"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from utils.activity_store import EPOCH_ORDINAL
+from utils.schedule import get_schedule_book
+
+# 묶음 단위 (정수 N은 시작일부터 N일씩)
+FREQUENCIES = ('day', 'week', 'month')
+
+# 주의 시작 요일 (캘린더와 같이 일요일, date.weekday() 기준)
+WEEK_START = 6
+
+# 누적합을 두는 값: 학습, 휴식, 기록한 날, 학습한 날, 달력 일수
+METRICS = ('study', 'break', 'days', 'study_days', 'calendar_days')
+
+
+def _to_ordinal(value):
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    return value.toordinal()
+
+
+def _dates(ordinals):
+    return pd.to_datetime((np.asarray(ordinals, dtype=np.int64) - EPOCH_ORDINAL).astype('datetime64[D]'))
+
+
+class RangeIndex:
+    """날짜 구간 합계/묶음/이동 평균/요일·스케줄 종류별 합계"""
+
+    def __init__(self, totals, book):
+        """totals: ActivityAggregates.daily_totals(), book: ScheduleBook"""
+        self.day_types = list(book.names)
+        if len(totals):
+            self.first = int(totals.ordinals[0])
+            self.last = int(totals.ordinals[-1])
+        else:
+            self.first, self.last = 1, 0
+        size = self.last - self.first + 1
+
+        # (값 종류, 날짜) 배열을 한 번에 누적, 맨 앞의 0 덕분에 [lo, hi) 합 = P[hi] - P[lo]
+        values = np.zeros((len(METRICS), size))
+        positions = np.asarray(totals.ordinals, dtype=np.int64) - self.first
+        values[0, positions] = totals.study
+        values[1, positions] = totals.rest
+        values[2, positions] = 1
+        values[3, positions] = totals.study > 0
+        values[4] = 1
+        self._prefix = np.concatenate((np.zeros((len(METRICS), 1)), np.cumsum(values, axis=1)), axis=1)
+
+        ordinals = np.arange(self.first, self.last + 1, dtype=np.int64)
+        # date.toordinal()의 1은 월요일 -> date.weekday()와 같은 0~6
+        self._weekday = self._group_prefix(values, (ordinals - 1) % 7, 7)
+        day_types, _ = book.resolve_ordinals(ordinals)
+        self._day_type = self._group_prefix(values, day_types.codes, len(self.day_types))
+
+    @staticmethod
+    def _group_prefix(values, groups, count):
+        """(종류, 값 종류, 날짜+1) 누적합"""
+        masks = groups[np.newaxis, :] == np.arange(count)[:, np.newaxis]
+        grouped = values[np.newaxis, :, :] * masks[:, np.newaxis, :]
+        return np.concatenate((np.zeros(grouped.shape[:2] + (1,)), np.cumsum(grouped, axis=2)), axis=2)
+
+    def is_empty(self):
+        return self.last < self.first
+
+    def bounds(self):
+        """(첫 기록일, 마지막 기록일), 기록이 없으면 None"""
+        if self.is_empty():
+            return None
+        return date.fromordinal(self.first), date.fromordinal(self.last)
+
+    def _span(self, start, end):
+        """누적합 배열의 [lo, hi) 위치 (기록 범위로 자름)"""
+        size = self.last - self.first + 1
+        lo = 0 if start is None else _to_ordinal(start) - self.first
+        hi = size if end is None else _to_ordinal(end) - self.first + 1
+        lo, hi = min(max(lo, 0), size), min(max(hi, 0), size)
+        return lo, max(lo, hi)
+
+    def totals(self, start=None, end=None):
+        """구간 합계 (평균은 기록한 날 기준, 분석 탭의 일별 통계와 같은 기준)"""
+        lo, hi = self._span(start, end)
+        sums = dict(zip(METRICS, (self._prefix[:, hi] - self._prefix[:, lo]).tolist()))
+        days = sums['days']
+        return {
+            'study': sums['study'],
+            'break': sums['break'],
+            'days': int(days),
+            'study_days': int(sums['study_days']),
+            'calendar_days': int(sums['calendar_days']),
+            'study_avg': sums['study'] / days if days else 0.0,
+            'break_avg': sums['break'] / days if days else 0.0
+        }
+
+    def _edges(self, lo, hi, freq):
+        """묶음 시작 위치 배열 (첫 값은 lo)"""
+        if freq == 'day':
+            return np.arange(lo, hi)
+        ordinals = np.arange(self.first + lo, self.first + hi, dtype=np.int64)
+        if freq == 'week':
+            starts = (ordinals - 1) % 7 == WEEK_START
+        elif freq == 'month':
+            days = (ordinals - EPOCH_ORDINAL).astype('datetime64[D]')
+            starts = days == days.astype('datetime64[M]').astype('datetime64[D]')
+        elif isinstance(freq, int) and freq > 0:
+            starts = np.arange(hi - lo) % freq == 0
+        else:
+            raise ValueError(f"묶음 단위는 {', '.join(FREQUENCIES)} 또는 양의 정수여야 합니다: {freq}")
+        starts[:1] = True
+        return lo + np.flatnonzero(starts)
+
+    def series(self, start=None, end=None, freq='day'):
+        """구간을 freq 단위로 묶은 합계
+
+        columns: period(묶음 시작일), study, break, days, study_days, calendar_days
+        첫 묶음은 start부터 시작하므로 주/월 중간이면 일부만 포함한다.
+        """
+        lo, hi = self._span(start, end)
+        edges = self._edges(lo, hi, freq)
+        bounds = np.append(edges, hi)
+        sums = self._prefix[:, bounds[1:]] - self._prefix[:, bounds[:-1]]
+        frame = pd.DataFrame(sums.T, columns=list(METRICS))
+        frame.insert(0, 'period', _dates(self.first + edges))
+        return frame.astype({'days': int, 'study_days': int, 'calendar_days': int})
+
+    def rolling(self, start=None, end=None, windows=(7, 30)):
+        """날짜별 직전 window일(당일 포함) 하루 평균 학습/휴식 시간
+
+        달력 일수로 나누므로 기록하지 않은 날은 0시간으로 계산한다. 구간 앞의
+        날도 창에 포함된다 (기록 범위 이전은 0).
+        columns: date, study_7, break_7, study_30, break_30, ...
+        """
+        lo, hi = self._span(start, end)
+        positions = np.arange(lo, hi) + 1
+        frame = pd.DataFrame({'date': _dates(self.first + positions - 1)})
+        for window in windows:
+            begin = np.maximum(positions - window, 0)
+            frame[f'study_{window}'] = (self._prefix[0, positions] - self._prefix[0, begin]) / window
+            frame[f'break_{window}'] = (self._prefix[1, positions] - self._prefix[1, begin]) / window
+        return frame
+
+    def _grouped(self, prefix, start, end):
+        lo, hi = self._span(start, end)
+        sums = prefix[:, :, hi] - prefix[:, :, lo]
+        frame = pd.DataFrame(sums, columns=list(METRICS))
+        days = frame['days']
+        frame['study_avg'] = np.divide(frame['study'], days, out=np.zeros(len(frame)), where=days > 0)
+        frame['break_avg'] = np.divide(frame['break'], days, out=np.zeros(len(frame)), where=days > 0)
+        return frame.astype({'days': int, 'study_days': int, 'calendar_days': int})
+
+    def by_weekday(self, start=None, end=None):
+        """요일별 합계 (weekday: 0=월 ... 6=일, 평균은 기록한 날 기준)"""
+        frame = self._grouped(self._weekday, start, end)
+        frame.insert(0, 'weekday', range(7))
+        return frame
+
+    def by_day_type(self, start=None, end=None):
+        """스케줄 종류별 합계 (get_day_type과 같은 기준, 평균은 기록한 날 기준)"""
+        frame = self._grouped(self._day_type, start, end)
+        frame.insert(0, 'day_type', self.day_types)
+        return frame
+
+
+class RangeAnalytics:
+    """구간 조회용 누적합 (활동이 바뀌면 버리고 다음 조회 때 다시 만듦)"""
+
+    SECTIONS = ('activities',)
+
+    def __init__(self, data):
+        self.data = data
+        self._index = None
+
+    def copy(self, data):
+        new = RangeAnalytics(data)
+        new._index = self._index
+        return new
+
+    def on_change(self, section, key, old, new):
+        if section == 'activities':
+            self._index = None
+
+    def index(self, totals):
+        """totals: 날짜별 합계 (ActivityAggregates.daily_totals())"""
+        if self._index is None:
+            self._index = RangeIndex(totals, get_schedule_book())
+        return self._index
@@ -0,0 +1,101 @@
+"""월 화면 렌더 캐시
+
+(사용자 샤드, 연, 월, 그 달의 데이터 버전)을 키로 미리 만든 화면(달력 격자와
+HTML 등)을 보관한다. 데이터 버전은 CalendarIndex가 월 요약을 만들 때 계산하는
+체크섬이라 그 달의 활동이나 총평이 바뀔 때만 달라지고, 지난 달은 한 번 그린
+결과를 계속 재사용한다.
+
+메모리에는 최근에 본 RENDER_CACHE_SIZE개월만 LRU로 둔다. RENDER_CACHE=disk 이면
+cache/<이름>/YYYY-MM.json 에도 저장해 서버를 다시 시작해도 재사용한다 (월마다
+파일 하나라 디스크 사용량도 월 수에 비례).
+"""
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from utils.safe_io import atomic_write
+from utils.tenancy import current_root, shard_path
+
+# memory 또는 disk
+RENDER_CACHE = os.environ.get('RENDER_CACHE', 'memory')
+RENDER_CACHE_SIZE = int(os.environ.get('RENDER_CACHE_SIZE', 36))
+
+CACHE_DIR = 'cache'
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+class RenderCache:
+    """월 단위 렌더 결과 LRU (모든 세션이 함께 사용)"""
+
+    def __init__(self, name, max_entries=RENDER_CACHE_SIZE, persist=RENDER_CACHE == 'disk'):
+        self.name = name
+        self.max_entries = max_entries
+        self.persist = persist
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, year, month, version, render):
+        """캐시된 렌더 결과, 없거나 버전이 다르면 render()로 만들어 저장
+
+        render()의 결과는 JSON으로 저장할 수 있는 값이어야 한다.
+        """
+        key = (current_root(), year, month, version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._read(year, month, version) if self.persist else None
+        if entry is None:
+            entry = render()
+            if self.persist:
+                self._write(year, month, version, entry)
+            with self._lock:
+                self.misses += 1
+        else:
+            with self._lock:
+                self.hits += 1
+
+        with self._lock:
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _path(self, year, month):
+        return shard_path(os.path.join(CACHE_DIR, self.name, f"{year}-{month:02d}.json"))
+
+    def _read(self, year, month, version):
+        try:
+            with open(self._path(year, month), encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return stored['entry'] if stored.get('version') == version else None
+
+    def _write(self, year, month, version, entry):
+        stored = {'version': version, 'entry': entry}
+        try:
+            atomic_write(self._path(year, month), lambda f: json.dump(stored, f, ensure_ascii=False))
+        except OSError:
+            # 디스크 캐시는 보조 수단이라 실패해도 화면은 그대로 표시
+            pass
+
+
+def get_render_cache(name):
+    """이름별 공유 캐시 (프로세스당 하나)"""
+    with _caches_lock:
+        if name not in _caches:
+            _caches[name] = RenderCache(name)
+        return _caches[name]
@@ -0,0 +1,101 @@
+import os
+import tempfile
+import threading
+
+from utils.profiling import timed, count_written
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """path + '.lock' 파일을 이용한 프로세스 간 배타 잠금
+
+    같은 프로세스 안의 세션(스레드)끼리는 threading.Lock으로 먼저 직렬화한다.
+    """
+
+    _thread_locks = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, path):
+        self.lock_path = f'{path}.lock'
+        with FileLock._registry_lock:
+            self._thread_lock = FileLock._thread_locks.setdefault(
+                os.path.abspath(self.lock_path), threading.RLock()
+            )
+        self._file = None
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        try:
+            os.makedirs(os.path.dirname(self.lock_path) or '.', exist_ok=True)
+            self._file = open(self.lock_path, 'a+')
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+        except BaseException:
+            self._release()
+            raise
+        return self
+
+    def __exit__(self, *exc):
+        self._release()
+
+    def _release(self):
+        if self._file is not None:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
+
+
+def file_version(path):
+    """파일이 바뀌었는지 비교하기 위한 (수정 시각, 크기), 파일이 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def atomic_write(path, write, binary=False):
+    """같은 디렉토리의 임시 파일에 쓴 뒤 rename으로 교체
+
+    write(f)는 열린 파일(binary=True면 바이너리)에 내용을 쓴다. 중간에
+    실패하거나 프로세스가 죽어도 기존 파일은 그대로 남는다.
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=os.path.basename(path))
+    with timed('io.write'):
+        try:
+            with (os.fdopen(fd, 'wb') if binary else os.fdopen(fd, 'w', encoding='utf-8', newline='')) as f:
+                write(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        _fsync_directory(directory)
+    count_written(os.path.getsize(path))
+
+
+def _fsync_directory(directory):
+    if fcntl is None:
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
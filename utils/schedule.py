@@ -0,0 +1,244 @@
+"""요일별 스케줄과 목표 학습 시간
+
+config/schedules.json (또는 .yaml)에서 프로세스당 한 번 읽고 검증한 뒤,
+요일 표와 날짜별 예외 표로 미리 펼쳐 둔다. 날짜 하나는 dict 조회 한 번,
+한 달이나 임의 구간은 numpy 배열로 한 번에 계산한다.
+
+설정 형식:
+    weekdays      요일(mon~sun) -> 스케줄 종류
+    day_types     스케줄 종류 -> {target_study_hours, items: [{id, label, time}, ...]}
+    break_limits  휴식 평가 기준 {warning, emergency} (시간)
+    overrides     기간 예외 [{name, start, end, day_type}, ...] (공휴일, 시험 기간 등)
+    dates         날짜별 예외 {'YYYY-MM-DD': day_type} (overrides보다 우선)
+
+SCHEDULE_CONFIG 환경 변수로 다른 설정 파일을 지정할 수 있고, 여러 사용자
+모드에서는 users/<id>/schedules.json이 있으면 그 사용자에게 우선 적용된다.
+"""
+import json
+import os
+import threading
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from utils.activity_store import EPOCH_ORDINAL
+from utils.tenancy import current_root
+
+SCHEDULE_CONFIG = os.environ.get(
+    'SCHEDULE_CONFIG',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'schedules.json')
+)
+
+# 사용자 샤드(users/<id>/)에 두는 개별 설정 파일 이름
+USER_CONFIG = 'schedules.json'
+
+WEEKDAY_NAMES = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+ITEM_FIELDS = ('id', 'label', 'time')
+
+
+def _parse_date(value, where):
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError(f"{where}: 날짜 형식이 올바르지 않습니다 ({value!r}, YYYY-MM-DD)") from None
+
+
+def _check_day_type(day_types, value, where):
+    if value not in day_types:
+        raise ValueError(f"{where}: 정의되지 않은 스케줄 종류입니다 ({value!r})")
+    return value
+
+
+def validate(config):
+    """설정을 검사해 정리된 dict로 반환 (문제가 있으면 ValueError)"""
+    if not isinstance(config, dict):
+        raise ValueError('스케줄 설정의 최상위는 객체여야 합니다')
+
+    raw_types = config.get('day_types')
+    if not isinstance(raw_types, dict) or not raw_types:
+        raise ValueError('day_types가 비어 있습니다')
+    day_types = {}
+    for name, spec in raw_types.items():
+        where = f'day_types.{name}'
+        target = spec.get('target_study_hours') if isinstance(spec, dict) else None
+        if isinstance(target, bool) or not isinstance(target, (int, float)) or target < 0:
+            raise ValueError(f'{where}.target_study_hours는 0 이상의 숫자여야 합니다')
+        items = spec.get('items')
+        if not isinstance(items, list):
+            raise ValueError(f'{where}.items는 목록이어야 합니다')
+        seen = set()
+        for index, item in enumerate(items):
+            if not isinstance(item, dict) or any(not isinstance(item.get(f), str) for f in ITEM_FIELDS):
+                raise ValueError(f'{where}.items[{index}]에는 문자열 id, label, time이 있어야 합니다')
+            if item['id'] in seen:
+                raise ValueError(f"{where}.items: id가 중복되었습니다 ({item['id']!r})")
+            seen.add(item['id'])
+        day_types[name] = {
+            'target_study_hours': float(target),
+            'items': tuple({f: item[f] for f in ITEM_FIELDS} for item in items)
+        }
+
+    weekdays = config.get('weekdays')
+    if not isinstance(weekdays, dict) or set(weekdays) != set(WEEKDAY_NAMES):
+        raise ValueError(f"weekdays에는 {', '.join(WEEKDAY_NAMES)}가 모두 있어야 합니다")
+    for name in WEEKDAY_NAMES:
+        _check_day_type(day_types, weekdays[name], f'weekdays.{name}')
+
+    limits = config.get('break_limits', {'warning': 2.5, 'emergency': 3})
+    if not isinstance(limits, dict) or any(
+        isinstance(limits.get(k), bool) or not isinstance(limits.get(k), (int, float))
+        for k in ('warning', 'emergency')
+    ):
+        raise ValueError('break_limits에는 숫자 warning, emergency가 있어야 합니다')
+    if limits['warning'] > limits['emergency']:
+        raise ValueError('break_limits.warning은 emergency보다 클 수 없습니다')
+
+    overrides = []
+    for index, override in enumerate(config.get('overrides') or []):
+        where = f'overrides[{index}]'
+        if not isinstance(override, dict):
+            raise ValueError(f'{where}는 객체여야 합니다')
+        start = _parse_date(override.get('start'), f'{where}.start')
+        end = _parse_date(override.get('end', override.get('start')), f'{where}.end')
+        if end < start:
+            raise ValueError(f'{where}: end가 start보다 앞설 수 없습니다')
+        overrides.append({
+            'name': str(override.get('name', '')),
+            'start': start,
+            'end': end,
+            'day_type': _check_day_type(day_types, override.get('day_type'), f'{where}.day_type')
+        })
+
+    dates = {}
+    for key, value in (config.get('dates') or {}).items():
+        dates[_parse_date(key, f'dates.{key}')] = _check_day_type(day_types, value, f'dates.{key}')
+
+    return {
+        'weekdays': [weekdays[name] for name in WEEKDAY_NAMES],
+        'day_types': day_types,
+        'break_limits': {'warning': float(limits['warning']), 'emergency': float(limits['emergency'])},
+        'overrides': overrides,
+        'dates': dates
+    }
+
+
+def read_config(path=SCHEDULE_CONFIG):
+    with open(path, encoding='utf-8') as f:
+        if path.endswith(('.yaml', '.yml')):
+            # JSON 설정만 쓰면 필요 없으므로 YAML 파일을 읽을 때만 import
+            try:
+                import yaml
+            except ImportError:
+                raise RuntimeError('YAML 스케줄 설정에는 PyYAML이 필요합니다 (pip install pyyaml)') from None
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+class ScheduleBook:
+    """검증된 설정을 날짜 -> 스케줄 조회 표로 펼친 것"""
+
+    def __init__(self, config):
+        config = validate(config)
+        self.day_types = config['day_types']
+        self.break_limits = config['break_limits']
+        self.names = list(self.day_types)
+        codes = {name: code for code, name in enumerate(self.names)}
+        self._targets = np.array([self.day_types[name]['target_study_hours'] for name in self.names])
+        self._weekday = [config['weekdays'][i] for i in range(7)]
+        self._weekday_codes = np.array([codes[name] for name in self._weekday], dtype=np.int16)
+
+        # 기간 예외를 날짜 단위로 펼치고, 날짜별 예외로 덮어씀 (뒤에 적힌 기간이 우선)
+        exceptions = {}
+        for override in config['overrides']:
+            day = override['start']
+            while day <= override['end']:
+                exceptions[day] = override['day_type']
+                day += timedelta(days=1)
+        exceptions.update(config['dates'])
+        self._exceptions = exceptions
+        ordered = sorted(exceptions)
+        self._exception_ordinals = np.array([d.toordinal() for d in ordered], dtype=np.int64)
+        self._exception_codes = np.array([codes[exceptions[d]] for d in ordered], dtype=np.int16)
+
+    def day_type(self, day):
+        if isinstance(day, datetime):
+            day = day.date()
+        return self._exceptions.get(day) or self._weekday[day.weekday()]
+
+    def schedule(self, day):
+        """체크리스트 항목 [{id, label, time}, ...]"""
+        return self.day_types[self.day_type(day)]['items']
+
+    def target_hours(self, day):
+        return self.day_types[self.day_type(day)]['target_study_hours']
+
+    def _codes(self, ordinals):
+        # date.toordinal()의 1은 월요일
+        codes = self._weekday_codes[(ordinals - 1) % 7]
+        if len(self._exception_ordinals):
+            position = np.searchsorted(self._exception_ordinals, ordinals)
+            position = np.minimum(position, len(self._exception_ordinals) - 1)
+            hit = self._exception_ordinals[position] == ordinals
+            codes = np.where(hit, self._exception_codes[position], codes)
+        return codes
+
+    def resolve_range(self, start, end):
+        """start~end(포함) 날짜별 스케줄 종류와 목표 시간 DataFrame
+
+        columns: date('YYYY-MM-DD'), day_type, target_study_hours
+        """
+        ordinals = np.arange(start.toordinal(), end.toordinal() + 1, dtype=np.int64)
+        codes = self._codes(ordinals)
+        return pd.DataFrame({
+            'date': pd.date_range(start, periods=len(ordinals)).strftime('%Y-%m-%d'),
+            'day_type': pd.Categorical.from_codes(codes, categories=self.names),
+            'target_study_hours': self._targets[codes]
+        })
+
+    def resolve_month(self, year, month):
+        first = date(year, month, 1)
+        last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        return self.resolve_range(first, last)
+
+    def resolve_dates(self, dates):
+        """'YYYY-MM-DD' 문자열 배열의 목표 시간 (분석용, 입력 순서 유지)"""
+        days = np.asarray(pd.to_datetime(dates).values.astype('datetime64[D]'), dtype=np.int64)
+        return self.resolve_ordinals(days + EPOCH_ORDINAL)
+
+    def resolve_ordinals(self, ordinals):
+        """date.toordinal() 배열의 (스케줄 종류 Categorical, 목표 시간 배열)"""
+        codes = self._codes(np.asarray(ordinals, dtype=np.int64))
+        return pd.Categorical.from_codes(codes, categories=self.names), self._targets[codes]
+
+    def item_labels(self):
+        """항목 id -> 이름 (시간 표기 제외, 처음 나온 것 기준)"""
+        labels = {}
+        for spec in self.day_types.values():
+            for item in spec['items']:
+                labels.setdefault(item['id'], item['label'].split(' (')[0])
+        return labels
+
+
+# 사용자 샤드 루트 -> ScheduleBook
+_books = {}
+_book_lock = threading.Lock()
+
+
+def get_schedule_book():
+    """프로세스 전체에서 한 번만 읽는 스케줄
+
+    사용자 샤드에 schedules.json이 있으면 그 사용자는 그 설정을 쓴다.
+    """
+    root = current_root()
+    book = _books.get(root)
+    if book is None:
+        with _book_lock:
+            book = _books.get(root)
+            if book is None:
+                override = os.path.join(root, USER_CONFIG) if root else None
+                path = override if override and os.path.exists(override) else SCHEDULE_CONFIG
+                book = _books[root] = ScheduleBook(read_config(path))
+    return book
@@ -0,0 +1,259 @@
+"""메모/총평 검색용 역색인
+
+날짜마다 활동 메모와 총평의 단어를 색인하고, 기록이 바뀌면 해당 날짜만
+다시 색인한다. 색인은 data/search_index/YYYY-MM.json에 월별로 나눠 저장하고
+(바뀐 날짜가 있는 월만 다시 씀), 다음 실행 때 내용 체크섬이 같은 날짜는
+그대로 재사용한다.
+
+한글은 조사가 붙거나 붙여 쓰는 경우가 많아 단어의 접미사(2글자 이상)도
+함께 색인한다. 검색어의 각 단어는 접두사로 찾으므로 '수학'으로 '수학을',
+'공부'로 '수학공부'를 찾을 수 있다.
+"""
+import bisect
+import json
+import os
+import re
+import zlib
+
+from utils.partitions import month_of
+from utils.safe_io import atomic_write
+
+INDEX_DIR = 'data/search_index'
+INDEX_FORMAT = 1
+
+FIELDS = ('memo', 'review')
+WORD = re.compile(r'\w+')
+HANGUL = re.compile(r'[가-힣]')
+
+
+def tokenize(text):
+    tokens = set()
+    for word in WORD.findall(text.lower()):
+        tokens.add(word)
+        if HANGUL.search(word):
+            tokens.update(word[i:] for i in range(1, len(word) - 1))
+    return tokens
+
+
+def field_text(section, value):
+    """색인할 원문 (활동은 그날 모든 메모를 줄바꿈으로 연결)"""
+    if value is None:
+        return ''
+    if section == 'activities':
+        return '\n'.join(
+            record['memo'] for activity_type in ('study', 'break')
+            for record in value[activity_type] if record['memo']
+        )
+    return value.get('content', '')
+
+
+def _checksum(text):
+    return zlib.crc32(text.encode('utf-8'))
+
+
+def _shard(shards, shared, key):
+    """바꿀 안쪽 dict (다른 복사본과 함께 쓰던 것이면 먼저 복사)"""
+    if key in shared:
+        shared.discard(key)
+        shards[key] = dict(shards[key])
+    return shards.setdefault(key, {})
+
+
+class SearchIndex:
+    """단어 -> (날짜, 필드) 역색인
+
+    공유 저장소의 스냅샷끼리 색인을 나눠 쓴다. 문서는 월별로, posting은 단어의
+    첫 글자별로 나눠 두고, 복사본은 바깥 dict만 복사한 뒤 안쪽 dict는 처음 바꿀
+    때 복사한다. posting 집합은 제자리에서 바꾸지 않고 새 frozenset으로 교체한다.
+    """
+
+    SECTION_FIELDS = {'activities': 'memo', 'reviews': 'review'}
+    SECTIONS = tuple(SECTION_FIELDS)
+
+    def __init__(self, data, directory=INDEX_DIR):
+        self.data = data
+        self.directory = directory
+        # 월 -> {(날짜, 필드): (체크섬, 단어 frozenset)}
+        self._docs = None
+        # 첫 글자 -> {단어: (날짜, 필드) frozenset}
+        self._postings = {}
+        # 첫 글자 -> 정렬된 단어 목록 (접두사 검색용, 조회할 때 만듦)
+        self._terms = {}
+        # 다른 복사본과 함께 쓰는 안쪽 dict
+        self._shared_docs = set()
+        self._shared_postings = set()
+        # 저장 이후 색인이 바뀐 월
+        self.dirty_months = set()
+
+    def copy(self, data):
+        new = SearchIndex(data, self.directory)
+        if self._docs is not None:
+            new._docs = dict(self._docs)
+            new._postings = dict(self._postings)
+            # 원본도 이제부터 안쪽 dict를 바꾸기 전에 복사
+            self._shared_docs = set(self._docs)
+            self._shared_postings = set(self._postings)
+            new._shared_docs = set(self._docs)
+            new._shared_postings = set(self._postings)
+        new._terms = dict(self._terms)
+        new.dirty_months = set(self.dirty_months)
+        return new
+
+    def on_change(self, section, key, old, new):
+        field = self.SECTION_FIELDS.get(section)
+        if field is not None and self._docs is not None:
+            self._set_doc(key, field, field_text(section, new))
+
+    def _set_doc(self, date, field, text, tokens=None):
+        doc = (date, field)
+        month = month_of(date)
+        checksum = _checksum(text) if text else None
+        old = self._docs.get(month, {}).get(doc)
+        if (old[0] if old else None) == checksum:
+            return
+        if tokens is None:
+            tokens = frozenset(tokenize(text)) if text else frozenset()
+        old_tokens = old[1] if old else frozenset()
+        for token in old_tokens - tokens:
+            postings = _shard(self._postings, self._shared_postings, token[0])
+            remaining = postings[token] - {doc}
+            if remaining:
+                postings[token] = remaining
+            else:
+                del postings[token]
+                self._terms.pop(token[0], None)
+        for token in tokens - old_tokens:
+            postings = _shard(self._postings, self._shared_postings, token[0])
+            if token not in postings:
+                self._terms.pop(token[0], None)
+            postings[token] = postings.get(token, frozenset()) | {doc}
+        docs = _shard(self._docs, self._shared_docs, month)
+        if checksum is None:
+            docs.pop(doc, None)
+        else:
+            docs[doc] = (checksum, tokens)
+        self.dirty_months.add(month)
+
+    def build(self):
+        """저장된 색인을 읽고 내용이 바뀐 날짜만 다시 색인"""
+        if self._docs is not None:
+            return
+        stored = self._read()
+        docs = {}
+        postings = {}
+        for section, field in self.SECTION_FIELDS.items():
+            for date, value in self.data[section].items():
+                text = field_text(section, value)
+                if not text:
+                    continue
+                doc = (date, field)
+                checksum = _checksum(text)
+                saved = stored.get(doc)
+                tokens = frozenset(saved[1] if saved is not None and saved[0] == checksum else tokenize(text))
+                docs[doc] = (checksum, tokens)
+                for token in tokens:
+                    postings.setdefault(token[0], {}).setdefault(token, set()).add(doc)
+        # 다 만든 뒤에 공개해야 도중에 복사된 스냅샷이 반쪽 색인을 갖지 않음
+        self._postings = {
+            first: {token: frozenset(found) for token, found in bucket.items()}
+            for first, bucket in postings.items()
+        }
+        self._terms = {}
+        months = {}
+        for doc, entry in docs.items():
+            months.setdefault(month_of(doc[0]), {})[doc] = entry
+        self._docs = months
+        self.dirty_months = {
+            month_of(date) for date, _ in docs.keys() ^ stored.keys()
+        } | {
+            month_of(doc[0]) for doc in docs.keys() & stored.keys() if docs[doc][0] != stored[doc][0]
+        }
+        self.save()
+
+    def _path(self, month):
+        return os.path.join(self.directory, f'{month}.json')
+
+    def _read(self):
+        if not os.path.isdir(self.directory):
+            return {}
+        stored = {}
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), encoding='utf-8') as f:
+                    shard = json.load(f)
+            except (OSError, ValueError):
+                # 깨진 월은 버리고 다시 색인
+                continue
+            if shard.get('format') != INDEX_FORMAT:
+                continue
+            for date, field, checksum, tokens in shard['docs']:
+                stored[(date, field)] = (checksum, tokens)
+        return stored
+
+    def save(self):
+        """바뀐 월의 색인 파일만 다시 쓰기 (색인할 날짜가 없어진 월은 삭제)"""
+        if self._docs is None or not self.dirty_months:
+            return
+        for month in sorted(self.dirty_months):
+            path = self._path(month)
+            docs = self._docs.get(month)
+            if not docs:
+                if os.path.exists(path):
+                    os.remove(path)
+                continue
+            stored = {
+                'format': INDEX_FORMAT,
+                'docs': [
+                    [date, field, checksum, sorted(tokens)]
+                    for (date, field), (checksum, tokens) in sorted(docs.items())
+                ]
+            }
+            atomic_write(path, lambda f: json.dump(stored, f, ensure_ascii=False))
+        self.dirty_months = set()
+
+    def _prefix_matches(self, prefix):
+        postings = self._postings.get(prefix[0], {})
+        terms = self._terms.get(prefix[0])
+        if terms is None:
+            terms = self._terms[prefix[0]] = sorted(postings)
+        start = bisect.bisect_left(terms, prefix)
+        end = bisect.bisect_left(terms, prefix + '\uffff')
+        matches = set()
+        for term in terms[start:end]:
+            matches |= postings[term]
+        return matches
+
+    def search(self, query, limit=50):
+        """검색어의 모든 단어가 (메모나 총평에) 들어 있는 날짜, 최신순
+
+        [{'date', 'fields': ('memo', ...), 'snippets': {field: text}}, ...]
+        """
+        self.build()
+        words = WORD.findall(query.lower())
+        if not words:
+            return []
+        dates = None
+        fields = {}
+        for word in words:
+            matches = self._prefix_matches(word)
+            for date, field in matches:
+                fields.setdefault(date, set()).add(field)
+            found = {date for date, _ in matches}
+            dates = found if dates is None else dates & found
+            if not dates:
+                return []
+        results = []
+        for date in sorted(dates, reverse=True)[:limit]:
+            matched = tuple(field for field in FIELDS if field in fields[date])
+            results.append({
+                'date': date,
+                'fields': matched,
+                'snippets': {field: self._text(date, field) for field in matched}
+            })
+        return results
+
+    def _text(self, date, field):
+        section = 'activities' if field == 'memo' else 'reviews'
+        return field_text(section, self.data[section].get(date))
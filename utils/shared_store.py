@@ -0,0 +1,28 @@
+import threading
+
+
+class SharedStore:
+    """프로세스 안의 모든 세션이 함께 쓰는 데이터 (읽기-복사-갱신)
+
+    current는 한 번 공개되면 바뀌지 않는 스냅샷이다. 변경은 잠금 안에서
+    current의 복사본에 적용한 뒤 참조를 교체하므로, 읽는 쪽은 잠금 없이
+    자신이 잡은 스냅샷을 끝까지 일관되게 볼 수 있다.
+    """
+
+    def __init__(self, data):
+        self.current = data
+        self.version = 0
+        self._lock = threading.RLock()
+
+    def __getitem__(self, section):
+        return self.current[section]
+
+    def update(self, mutate):
+        """mutate(복사본)을 적용한 뒤 새 스냅샷으로 공개"""
+        with self._lock:
+            new = self.current.copy()
+            result = mutate(new)
+            new.seal()
+            self.current = new
+            self.version += 1
+            return result
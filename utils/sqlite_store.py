@@ -0,0 +1,230 @@
+"""SQLite 저장소
+
+CSV 스냅샷에서 옮겨 오기:
+    python -m utils.sqlite_store migrate [--db data/study.db]
+"""
+import argparse
+import sqlite3
+from contextlib import closing
+
+from utils.activity_store import ActivityDay, ActivityRecord
+from utils.profiling import count_file_read
+
+DB_PATH = 'data/study.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checklist (
+    date TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    checked INTEGER NOT NULL,
+    PRIMARY KEY (date, item_id)
+);
+CREATE TABLE IF NOT EXISTS activities (
+    date TEXT NOT NULL,
+    activity_type TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    hours REAL NOT NULL,
+    memo TEXT NOT NULL DEFAULT '',
+    timestamp TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (date, activity_type, position)
+);
+CREATE INDEX IF NOT EXISTS idx_activities_date_type ON activities (date, activity_type);
+CREATE TABLE IF NOT EXISTS reviews (
+    date TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    timestamp TEXT NOT NULL
+);
+"""
+
+
+def connect(path=DB_PATH):
+    # Streamlit 세션은 각자 다른 스레드에서 실행되므로 호출마다 연결을 연다
+    conn = sqlite3.connect(path, timeout=10)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def load(path=DB_PATH):
+    data = {'activities': {}, 'checklist': {}, 'reviews': {}}
+    count_file_read(path)
+    with closing(connect(path)) as conn:
+        for date, item_id, checked in conn.execute(
+            'SELECT date, item_id, checked FROM checklist'
+        ):
+            data['checklist'].setdefault(date, {})[item_id] = bool(checked)
+
+        for date, activity_type, hours, memo, timestamp in conn.execute(
+            'SELECT date, activity_type, hours, memo, timestamp FROM activities '
+            'ORDER BY date, activity_type, position'
+        ):
+            day = data['activities'].setdefault(date, {'study': [], 'break': []})
+            day[activity_type].append(ActivityRecord(hours, memo, timestamp))
+        data['activities'] = {
+            date: ActivityDay(day['study'], day['break']) for date, day in data['activities'].items()
+        }
+
+        for date, content, timestamp in conn.execute(
+            'SELECT date, content, timestamp FROM reviews'
+        ):
+            data['reviews'][date] = {'content': content, 'timestamp': timestamp}
+    return data
+
+
+def _save_checklist(conn, date, items):
+    if items is None:
+        conn.execute('DELETE FROM checklist WHERE date = ?', (date,))
+        return
+    conn.executemany(
+        'INSERT INTO checklist (date, item_id, checked) VALUES (?, ?, ?) '
+        'ON CONFLICT (date, item_id) DO UPDATE SET checked = excluded.checked',
+        [(date, item_id, int(bool(checked))) for item_id, checked in items.items()]
+    )
+
+
+def _save_activities(conn, date, activities):
+    activities = activities or {}
+    for activity_type in ('study', 'break'):
+        records = activities.get(activity_type, [])
+        conn.executemany(
+            'INSERT INTO activities (date, activity_type, position, hours, memo, timestamp) '
+            'VALUES (?, ?, ?, ?, ?, ?) '
+            'ON CONFLICT (date, activity_type, position) DO UPDATE SET '
+            'hours = excluded.hours, memo = excluded.memo, timestamp = excluded.timestamp',
+            [
+                (date, activity_type, position, record['hours'], record['memo'], record['timestamp'])
+                for position, record in enumerate(records)
+            ]
+        )
+        # 초기화 등으로 줄어든 기록 정리
+        conn.execute(
+            'DELETE FROM activities WHERE date = ? AND activity_type = ? AND position >= ?',
+            (date, activity_type, len(records))
+        )
+
+
+def _save_review(conn, date, review):
+    if review is None:
+        conn.execute('DELETE FROM reviews WHERE date = ?', (date,))
+        return
+    conn.execute(
+        'INSERT INTO reviews (date, content, timestamp) VALUES (?, ?, ?) '
+        'ON CONFLICT (date) DO UPDATE SET content = excluded.content, timestamp = excluded.timestamp',
+        (date, review['content'], review['timestamp'])
+    )
+
+
+SAVERS = {
+    'checklist': _save_checklist,
+    'activities': _save_activities,
+    'reviews': _save_review
+}
+
+
+def _read_checklist(conn, date):
+    items = {
+        item_id: bool(checked) for item_id, checked in conn.execute(
+            'SELECT item_id, checked FROM checklist WHERE date = ?', (date,)
+        )
+    }
+    return items or None
+
+
+def _read_activities(conn, date):
+    day = {'study': [], 'break': []}
+    for activity_type, hours, memo, timestamp in conn.execute(
+        'SELECT activity_type, hours, memo, timestamp FROM activities WHERE date = ? '
+        'ORDER BY activity_type, position', (date,)
+    ):
+        day[activity_type].append(ActivityRecord(hours, memo, timestamp))
+    return ActivityDay(day['study'], day['break']) if day['study'] or day['break'] else None
+
+
+def _read_review(conn, date):
+    row = conn.execute('SELECT content, timestamp FROM reviews WHERE date = ?', (date,)).fetchone()
+    return None if row is None else {'content': row[0], 'timestamp': row[1]}
+
+
+READERS = {
+    'checklist': _read_checklist,
+    'activities': _read_activities,
+    'reviews': _read_review
+}
+
+
+def save(data, dirty_sections, path=DB_PATH, merge=None):
+    """변경된 날짜의 행만 하나의 트랜잭션으로 upsert
+
+    merge(section, date, stored)를 주면 같은 트랜잭션 안에서 읽은 저장된 값과
+    병합한 결과를 저장한다 (그 사이 다른 프로세스가 쓰지 못하도록 쓰기 잠금).
+    반환: 저장한 값 {section: {date: value}}
+    """
+    saved = {}
+    with closing(connect(path)) as conn:
+        with conn:
+            if merge is not None:
+                conn.execute('BEGIN IMMEDIATE')
+            for section, dates in dirty_sections.items():
+                for date in dates:
+                    if merge is None:
+                        value = data[section].get(date)
+                    else:
+                        value = merge(section, date, READERS[section](conn, date))
+                    SAVERS[section](conn, date, value)
+                    saved.setdefault(section, {})[date] = value
+    return saved
+
+
+def checkpoint(path=DB_PATH):
+    """WAL 내용을 본 파일에 반영 (파일 단위 백업 전에 호출)"""
+    with closing(connect(path)) as conn:
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+
+def iter_activities(columns, chunksize, path=DB_PATH):
+    """활동 기록을 chunksize 행씩 나누어 순회"""
+    with closing(connect(path)) as conn:
+        cursor = conn.execute(
+            f"SELECT {', '.join(columns)} FROM activities ORDER BY date, activity_type, position"
+        )
+        while rows := cursor.fetchmany(chunksize):
+            yield rows
+
+
+def daily_summary(path=DB_PATH):
+    """날짜별 학습/휴식 합계 [(date, study, break), ...]"""
+    with closing(connect(path)) as conn:
+        return conn.execute(
+            "SELECT date, "
+            "SUM(CASE WHEN activity_type = 'study' THEN hours ELSE 0 END), "
+            "SUM(CASE WHEN activity_type = 'break' THEN hours ELSE 0 END) "
+            "FROM activities GROUP BY date ORDER BY date"
+        ).fetchall()
+
+
+def monthly_summary(path=DB_PATH):
+    """월별 학습/휴식 합계 [(month, study, break), ...]"""
+    with closing(connect(path)) as conn:
+        return conn.execute(
+            "SELECT substr(date, 1, 7) AS month, "
+            "SUM(CASE WHEN activity_type = 'study' THEN hours ELSE 0 END), "
+            "SUM(CASE WHEN activity_type = 'break' THEN hours ELSE 0 END) "
+            "FROM activities GROUP BY month ORDER BY month"
+        ).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite 저장소 관리')
+    parser.add_argument('command', choices=['migrate'])
+    parser.add_argument('--db', default=DB_PATH)
+    args = parser.parse_args()
+
+    from utils.data_manager import migrate_to_sqlite
+    if args.command == 'migrate':
+        count = migrate_to_sqlite(args.db)
+        print(f'{count}개 날짜를 {args.db}로 옮겼습니다.')
+
+
+if __name__ == '__main__':
+    main()
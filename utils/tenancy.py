@@ -0,0 +1,63 @@
+"""사용자별 데이터 샤드
+
+MULTI_USER=1 이면 사용자마다 users/<user_id>/ 아래에 data/, backup/,
+schedules.json(선택)을 따로 둔다. 저장소 모듈의 경로('data/...')는 모두
+shard_path()로 현재 사용자의 디렉토리 기준으로 바뀐다. 기본값(MULTI_USER=0)
+에서는 루트가 ''이라 경로가 그대로다.
+
+현재 사용자는 ContextVar로 관리하므로 Streamlit 세션(스레드)마다 따로 잡힌다.
+"""
+import os
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+MULTI_USER = os.environ.get('MULTI_USER', '0') == '1'
+
+USERS_DIR = 'users'
+USER_ID_PATTERN = re.compile(r'[A-Za-z0-9_-]{1,32}')
+
+_root = ContextVar('shard_root', default='')
+
+
+def is_valid_user_id(user_id):
+    return bool(user_id) and USER_ID_PATTERN.fullmatch(user_id) is not None
+
+
+def user_root(user_id):
+    if not is_valid_user_id(user_id):
+        raise ValueError(f'사용자 ID는 영문, 숫자, _, - 로 32자 이하여야 합니다 ({user_id!r})')
+    return os.path.join(USERS_DIR, user_id)
+
+
+def current_root():
+    return _root.get()
+
+
+def shard_path(path):
+    """'data/...' 같은 상대 경로를 현재 사용자의 샤드 기준으로"""
+    root = _root.get()
+    return os.path.join(root, path) if root else path
+
+
+@contextmanager
+def use_root(root):
+    token = _root.set(root)
+    try:
+        yield root
+    finally:
+        _root.reset(token)
+
+
+def use_user(user_id):
+    """user_id의 샤드를 현재 사용자로 (None이면 단일 사용자 경로)"""
+    return use_root(user_root(user_id) if user_id else '')
+
+
+def list_users(users_dir=USERS_DIR):
+    if not os.path.isdir(users_dir):
+        return []
+    return sorted(
+        name for name in os.listdir(users_dir)
+        if is_valid_user_id(name) and os.path.isdir(os.path.join(users_dir, name))
+    )
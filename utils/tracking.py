@@ -0,0 +1,160 @@
+SECTIONS = ('activities', 'checklist', 'reviews')
+
+
+class TrackedSection(dict):
+    """마지막 저장 이후 변경된 날짜를 기록하는 dict
+
+    base에는 변경된 날짜의 마지막 저장(또는 읽기) 시점 값을 남겨 두어, 다른
+    세션이 같은 날짜를 바꿨을 때 이 세션이 바꾼 부분만 골라 병합할 수 있게 한다.
+    """
+
+    # 스냅샷끼리 같은 섹션 객체를 함께 쓸 수 있는지 (TrackedData.copy 참고)
+    shareable = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dirty = set()
+        self.base = {}
+
+    def _remember_base(self, key):
+        if key not in self.dirty:
+            self.base[key] = dict.get(self, key)
+            self.dirty.add(key)
+
+    def __setitem__(self, key, value):
+        self._remember_base(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        if dict.__contains__(self, key):
+            self._remember_base(key)
+        super().__delitem__(key)
+
+    def pop(self, key, *default):
+        if key in self:
+            self._remember_base(key)
+        return super().pop(key, *default)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def mark_dirty(self, key):
+        self._remember_base(key)
+
+    def clear_dirty(self):
+        self.dirty = set()
+        self.base = {}
+
+    def mark_clean(self, key):
+        self.dirty.discard(key)
+        self.base.pop(key, None)
+
+    def copy(self):
+        """같은 종류의 섹션으로 얕은 복사 (변경 기록 포함)"""
+        new = self.__class__.__new__(self.__class__)
+        # dict.copy는 하위 클래스의 __iter__/keys를 거치지 않고 내부 표를 그대로 복사
+        dict.update(new, dict.copy(self))
+        new.__dict__.update(self.__dict__)
+        new.dirty = set(self.dirty)
+        new.base = dict(self.base)
+        return new
+
+
+def _as_section(value):
+    if isinstance(value, TrackedSection):
+        return value
+    return TrackedSection(value or {})
+
+
+class TrackedData(dict):
+    """activities / checklist / reviews 섹션을 묶은 변경 추적 데이터
+
+    파생 데이터(views)는 copy(data)와 on_change(section, key, old, new)를 갖고,
+    SECTIONS에 따라 갱신할 섹션을 밝힌다.
+    """
+
+    def __init__(self, activities=None, checklist=None, reviews=None):
+        super().__init__(
+            activities=_as_section(activities),
+            checklist=_as_section(checklist),
+            reviews=_as_section(reviews)
+        )
+        for name in SECTIONS:
+            dict.__getitem__(self, name).owner = self
+        # 변경 시 함께 갱신되는 파생 데이터 (집계, 인덱스 등)
+        self.views = {}
+        # 저장소 파일별로 마지막으로 읽거나 쓴 시점의 버전
+        self.file_versions = {}
+        # 이 데이터를 읽어 온 사용자 샤드 ('' 이면 단일 사용자)
+        self.root = ''
+        # copy() 이후 아직 원본과 함께 쓰는 섹션/파생 데이터 (처음 바뀔 때 복사)
+        self._shared = set()
+        self._shared_views = set()
+
+    def __getitem__(self, name):
+        if name in self._shared:
+            self._shared.discard(name)
+            section = dict.__getitem__(self, name).copy()
+            section.owner = self
+            dict.__setitem__(self, name, section)
+        return dict.__getitem__(self, name)
+
+    def copy(self):
+        """공유 저장소의 읽기-복사-갱신용 복사본 (copy-on-write)
+
+        섹션은 변경 중에 처음 접근할 때, 파생 데이터는 지켜보는 섹션이 처음
+        바뀔 때 복사하므로 한 번의 변경에는 건드린 섹션과 그 섹션의 파생 데이터만큼의
+        비용이 든다. 변경을 마치면 seal()로 나머지를 원본과 계속 함께 쓴다.
+        """
+        new = TrackedData.__new__(TrackedData)
+        dict.update(new, self)
+        new.file_versions = dict(self.file_versions)
+        new.root = self.root
+        new.views = dict(self.views)
+        new._shared = {name for name in SECTIONS if dict.__getitem__(self, name).shareable}
+        for name in SECTIONS:
+            if name not in new._shared:
+                section = dict.__getitem__(self, name).copy()
+                section.owner = new
+                dict.__setitem__(new, name, section)
+        new._shared_views = set(self.views)
+        return new
+
+    def seal(self):
+        """변경을 마친 복사본: 건드리지 않은 섹션은 복사하지 않고 원본과 함께 씀
+
+        공개된 스냅샷은 읽기만 하므로 이후 접근에서 섹션을 복사하지 않는다.
+        """
+        self._shared = set()
+
+    def add_view(self, name, view):
+        self.views[name] = view
+        self._shared_views.discard(name)
+        return view
+
+    def notify(self, section, key, old, new):
+        """섹션 항목이 old에서 new로 바뀌었음을 파생 데이터에 전달"""
+        for name, view in list(self.views.items()):
+            if section not in view.SECTIONS:
+                continue
+            if name in self._shared_views:
+                self._shared_views.discard(name)
+                view = self.views[name] = view.copy(self)
+            view.on_change(section, key, old, new)
+
+    def is_dirty(self):
+        return any(self[name].dirty for name in SECTIONS)
+
+    def dirty_sections(self):
+        """변경된 섹션별 날짜 집합"""
+        return {name: set(self[name].dirty) for name in SECTIONS if self[name].dirty}
+
+    def clear_dirty(self):
+        for name in SECTIONS:
+            self[name].clear_dirty()
@@ -0,0 +1,153 @@
+import atexit
+import queue
+import threading
+import time
+from datetime import datetime
+
+# 백그라운드 저장 설정
+#   QUEUE_SIZE: 대기할 수 있는 저장 대상 수 (가득 차면 요청한 쪽이 기다림)
+#   FLUSH_INTERVAL: 첫 요청 뒤 이 시간(초) 동안 들어온 요청을 한 번의 저장으로 합침
+QUEUE_SIZE = 64
+FLUSH_INTERVAL = 1.0
+
+
+class BackgroundWriter:
+    """저장 요청을 모아 별도 스레드에서 persist(target)을 호출
+
+    같은 대상에 대한 요청은 저장되기 전까지 하나로 합쳐진다. 프로세스가
+    끝날 때는 남은 요청을 모두 저장한다.
+    """
+
+    def __init__(self, persist, interval=FLUSH_INTERVAL, queue_size=QUEUE_SIZE):
+        self.persist = persist
+        self.interval = interval
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._pending = {}
+        self._busy = False
+        self._cond = threading.Condition()
+        self._stopping = threading.Event()
+        # flush/stop 요청 시 모으는 시간을 기다리지 않고 바로 저장
+        self._hurry = threading.Event()
+        self._thread = None
+        self._atexit_registered = False
+        self.stats = {
+            'requests': 0,
+            'coalesced': 0,
+            'writes': 0,
+            'errors': 0,
+            'last_error': None,
+            'last_flush': None,
+            'last_duration_ms': None
+        }
+
+    def _ensure_started(self):
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name='background-writer', daemon=True)
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.stop)
+                self._atexit_registered = True
+
+    def submit(self, target):
+        """저장 요청 (이미 대기 중인 대상이면 합쳐짐)"""
+        if self._stopping.is_set():
+            # 종료 중에는 바로 저장
+            self.persist(target)
+            return
+        self._ensure_started()
+        with self._cond:
+            self.stats['requests'] += 1
+            if id(target) in self._pending:
+                self.stats['coalesced'] += 1
+                return
+            self._pending[id(target)] = target
+        self._queue.put(target)
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                first = self._queue.get(timeout=self.interval)
+            except queue.Empty:
+                continue
+            # 잠시 기다리며 연달아 들어오는 요청을 모음
+            self._hurry.wait(self.interval)
+            self._hurry.clear()
+            batch = [first]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write(batch)
+
+    def _write(self, batch):
+        with self._cond:
+            # 저장 도중 들어온 변경은 새 요청으로 다시 대기하도록 먼저 빼 둠
+            for target in batch:
+                self._pending.pop(id(target), None)
+            self._busy = True
+        start = time.perf_counter()
+        failed = False
+        try:
+            for target in batch:
+                try:
+                    self.persist(target)
+                    self.stats['writes'] += 1
+                except Exception as exc:  # 스레드가 죽지 않도록 기록만 남김
+                    failed = True
+                    self.stats['errors'] += 1
+                    self.stats['last_error'] = f'{type(exc).__name__}: {exc}'
+        finally:
+            with self._cond:
+                self._busy = False
+                if not failed:
+                    # 일시적인 오류 뒤 저장에 성공하면 오류 표시를 지움 (누적 수는 errors에 남음)
+                    self.stats['last_error'] = None
+                self.stats['last_flush'] = datetime.now().isoformat(timespec='seconds')
+                self.stats['last_duration_ms'] = (time.perf_counter() - start) * 1000
+                self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        """대기 중인 요청이 모두 저장될 때까지 기다림, 다 저장되었으면 True"""
+        if self._thread is None or not self._thread.is_alive():
+            # 스레드가 없으면 호출한 쪽에서 바로 저장
+            self._drain()
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._hurry.set()
+        with self._cond:
+            while self._pending or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining if remaining is not None else self.interval)
+        return True
+
+    def _drain(self):
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._write(batch)
+
+    def stop(self, timeout=10.0):
+        """스레드를 멈추고 남은 요청을 저장 (프로세스 종료 시 자동 호출)"""
+        self._stopping.set()
+        self._hurry.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._drain()
+
+    def health(self):
+        with self._cond:
+            return {
+                'alive': self._thread is not None and self._thread.is_alive(),
+                'pending': len(self._pending),
+                'busy': self._busy,
+                **self.stats
+            }